@@ -0,0 +1,185 @@
+import numpy as np
+from TwistorClasses.ComplexNumber import ComplexNumber
+
+class ComplexBatch:
+    """Represents an array of complex numbers stored in a single NumPy complex128 buffer.
+
+    Every operation is applied element-wise as one vectorized kernel, so bulk work
+    avoids allocating a ComplexNumber per value.
+
+    Functions include:
+        - add
+        - subtract
+        - multiply
+        - divide
+        - magnitude
+        - conjugate
+    """
+
+    # Makes NumPy defer mixed ndarray/ComplexBatch operators to the methods below
+    __array_ufunc__ = None
+
+    def __init__(self, values):
+        """Initializes a ComplexBatch from any array-like of complex values.
+
+        Args:
+            values (array-like): Values convertible to a complex128 array. An existing
+                complex128 array is wrapped without copying.
+        """
+        self.values = np.asarray(values, dtype=np.complex128)
+
+    @classmethod
+    def from_parts(cls, rel, img) -> "ComplexBatch":
+        """Builds a ComplexBatch from separate real and imaginary arrays.
+
+        Args:
+            rel (array-like): The real parts.
+            img (array-like): The imaginary parts.
+
+        Returns:
+            ComplexBatch: The combined batch.
+        """
+        values = np.empty(np.broadcast(np.asarray(rel), np.asarray(img)).shape, dtype=np.complex128)
+        values.real = rel
+        values.imag = img
+        return cls(values)
+
+    @classmethod
+    def from_complex_numbers(cls, numbers) -> "ComplexBatch":
+        """Builds a ComplexBatch from a sequence of ComplexNumber instances.
+
+        Args:
+            numbers (list of ComplexNumber): The values to pack.
+
+        Returns:
+            ComplexBatch: A one-dimensional batch holding the same values.
+        """
+        rel = np.fromiter((n.rel for n in numbers), dtype=np.float64, count=len(numbers))
+        img = np.fromiter((n.img for n in numbers), dtype=np.float64, count=len(numbers))
+        return cls.from_parts(rel, img)
+
+    def to_complex_numbers(self) -> list:
+        """Unpacks the batch into a flat list of ComplexNumber instances.
+
+        Returns:
+            list of ComplexNumber: One ComplexNumber per element, in row-major order.
+        """
+        flat = self.values.ravel()
+        return [ComplexNumber(rel, img) for rel, img in zip(flat.real.tolist(), flat.imag.tolist())]
+
+    @property
+    def rel(self) -> np.ndarray:
+        """The real parts as a float64 array view."""
+        return self.values.real
+
+    @property
+    def img(self) -> np.ndarray:
+        """The imaginary parts as a float64 array view."""
+        return self.values.imag
+
+    @property
+    def shape(self) -> tuple:
+        """The shape of the underlying array."""
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """Returns a ComplexNumber for a scalar index and a ComplexBatch for slices."""
+        item = self.values[index]
+        if np.ndim(item) == 0:
+            return ComplexNumber(float(item.real), float(item.imag))
+        return ComplexBatch(item)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype)
+
+    def display(self):
+        """Displays the real and imaginary components of every element."""
+        for rel, img in zip(self.rel.ravel().tolist(), self.img.ravel().tolist()):
+            print(f"({rel:.2f} + {img:.2f}i)")
+
+    def __str__(self):
+        return "[" + ", ".join(str(n) for n in self.to_complex_numbers()) + "]"
+
+    @staticmethod
+    def _operand(other):
+        """Converts the right-hand operand of an arithmetic operator into an array or scalar."""
+        if isinstance(other, ComplexBatch):
+            return other.values
+        elif isinstance(other, ComplexNumber):
+            return complex(other.rel, other.img)
+        elif isinstance(other, (int, float, complex, np.ndarray)):
+            return other
+        return None
+
+    # Operator overload for addition
+    def __add__(self, other):
+        """Allows the use of the + operator with ComplexBatch, ComplexNumber and scalar operands."""
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for +")
+        return ComplexBatch(self.values + operand)
+
+    __radd__ = __add__
+
+    # Operator overload for subtraction
+    def __sub__(self, other):
+        """Allows the use of the - operator with ComplexBatch, ComplexNumber and scalar operands."""
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for -")
+        return ComplexBatch(self.values - operand)
+
+    def __rsub__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for -")
+        return ComplexBatch(operand - self.values)
+
+    # Operator overload for multiplication
+    def __mul__(self, other):
+        """Allows the use of the * operator with ComplexBatch, ComplexNumber and scalar operands."""
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for *")
+        return ComplexBatch(self.values * operand)
+
+    __rmul__ = __mul__
+
+    # Operator overload for true division
+    def __truediv__(self, other):
+        """Allows the use of the / operator with ComplexBatch, ComplexNumber and scalar operands."""
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for /")
+        return ComplexBatch(self.values / operand)
+
+    def __rtruediv__(self, other):
+        operand = self._operand(other)
+        if operand is None:
+            raise TypeError("Unsupported operand type for /")
+        return ComplexBatch(operand / self.values)
+
+    def __neg__(self):
+        """Allows the use of the unary - operator with ComplexBatch instances."""
+        return ComplexBatch(-self.values)
+
+    def magnitude(self) -> np.ndarray:
+        """Calculates the magnitude of every element.
+
+        Returns:
+            np.ndarray: A float64 array of magnitudes with the batch's shape.
+        """
+        return np.abs(self.values)
+
+    def conjugate(self) -> "ComplexBatch":
+        """Calculates the complex conjugate of every element.
+
+        Returns:
+            ComplexBatch: The element-wise conjugate.
+        """
+        return ComplexBatch(np.conjugate(self.values))
@@ -8,8 +8,14 @@ class ComplexNumber:
         - divide
         - magnitude
         - conjugate
+
+    The augmented operators (+=, -=, *=, /=) and the out= arguments update existing
+    instances instead of allocating new ones. Instances shared between several owners
+    see those updates, so copy() first when a value must stay independent.
     """
 
+    __slots__ = ("rel", "img")
+
     def __init__(self, rel, img):
         """Initializes a ComplexNumber with real and imaginary components.
         
@@ -37,7 +43,7 @@ class ComplexNumber:
         elif isinstance(other, (int, float)):
             return ComplexNumber(self.rel + other, self.img)
         else:
-            raise TypeError("Unsupported operand type for +")
+            return NotImplemented
 
     # Operator overload for subtraction
     def __sub__(self, other):
@@ -47,7 +53,7 @@ class ComplexNumber:
         elif isinstance(other, (int, float)):
             return ComplexNumber(self.rel - other, self.img)
         else:
-            raise TypeError("Unsupported operand type for -")
+            return NotImplemented
 
     # Operator overload for multiplication
     def __mul__(self, other):
@@ -59,25 +65,121 @@ class ComplexNumber:
         elif isinstance(other, (int, float)):
             return ComplexNumber(self.rel * other, self.img * other)
         else:
-            raise TypeError("Unsupported operand type for *")
+            return NotImplemented
 
     # Operator overload for true division
     def __truediv__(self, other):
         """Allows the use of the / operator with ComplexNumber instances."""
         if isinstance(other, ComplexNumber):
-            other_star = other.conjugate()
-            other_magnitude_squared = other.magnitude() ** 2
-            numerator = self * other_star
-            
-            rel_part = numerator.rel / other_magnitude_squared
-            img_part = numerator.img / other_magnitude_squared
-            
-            return ComplexNumber(rel_part, img_part)
+            return self.divide(other)
         elif isinstance(other, (int, float)):
             return ComplexNumber(self.rel / other, self.img / other)
         else:
-            raise TypeError("Unsupported operand type for /")
-        
+            return NotImplemented
+
+    # In-place operator overloads
+    def __iadd__(self, other):
+        """Allows the use of the += operator, updating this instance."""
+        if isinstance(other, ComplexNumber):
+            self.rel += other.rel
+            self.img += other.img
+        elif isinstance(other, (int, float)):
+            self.rel += other
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other):
+        """Allows the use of the -= operator, updating this instance."""
+        if isinstance(other, ComplexNumber):
+            self.rel -= other.rel
+            self.img -= other.img
+        elif isinstance(other, (int, float)):
+            self.rel -= other
+        else:
+            return NotImplemented
+        return self
+
+    def __imul__(self, other):
+        """Allows the use of the *= operator, updating this instance."""
+        if isinstance(other, ComplexNumber):
+            return self.multiply(other, out=self)
+        elif isinstance(other, (int, float)):
+            self.rel *= other
+            self.img *= other
+            return self
+        else:
+            return NotImplemented
+
+    def __itruediv__(self, other):
+        """Allows the use of the /= operator, updating this instance."""
+        if isinstance(other, ComplexNumber):
+            return self.divide(other, out=self)
+        elif isinstance(other, (int, float)):
+            self.rel /= other
+            self.img /= other
+            return self
+        else:
+            return NotImplemented
+
+    def _store(self, rel, img, out):
+        if out is None:
+            return ComplexNumber(rel, img)
+        out.rel = rel
+        out.img = img
+        return out
+
+    def multiply(self, other: "ComplexNumber", out: "ComplexNumber" = None) -> "ComplexNumber":
+        """Multiplies two complex numbers.
+
+        Args:
+            other (ComplexNumber): The complex number to multiply by.
+            out (ComplexNumber): If given, receives the result instead of a new instance. It may be self or other.
+
+        Returns:
+            ComplexNumber: The product (out when given).
+        """
+        rel_part = self.rel * other.rel - self.img * other.img
+        img_part = self.rel * other.img + self.img * other.rel
+        return self._store(rel_part, img_part, out)
+
+    def divide(self, other: "ComplexNumber", out: "ComplexNumber" = None) -> "ComplexNumber":
+        """Divides by another complex number using its squared magnitude, without a square root.
+
+        Args:
+            other (ComplexNumber): The divisor.
+            out (ComplexNumber): If given, receives the result instead of a new instance. It may be self or other.
+
+        Returns:
+            ComplexNumber: The quotient (out when given).
+
+        Raises:
+            ZeroDivisionError: If other is zero.
+        """
+        magnitude_squared = other.rel * other.rel + other.img * other.img
+        rel_part = (self.rel * other.rel + self.img * other.img) / magnitude_squared
+        img_part = (self.img * other.rel - self.rel * other.img) / magnitude_squared
+        return self._store(rel_part, img_part, out)
+
+    def multiply_add(self, factor: "ComplexNumber", addend: "ComplexNumber", out: "ComplexNumber" = None) -> "ComplexNumber":
+        """Computes self * factor + addend in one step.
+
+        Args:
+            factor (ComplexNumber): The complex number to multiply by.
+            addend (ComplexNumber): The complex number added to the product.
+            out (ComplexNumber): If given, receives the result instead of a new instance. It may be any operand.
+
+        Returns:
+            ComplexNumber: The result (out when given).
+        """
+        rel_part = self.rel * factor.rel - self.img * factor.img + addend.rel
+        img_part = self.rel * factor.img + self.img * factor.rel + addend.img
+        return self._store(rel_part, img_part, out)
+
+    def copy(self) -> "ComplexNumber":
+        """Returns an independent ComplexNumber with the same components."""
+        return ComplexNumber(self.rel, self.img)
+
     def __neg__(self):
         """Allows the use of the unary - operator with ComplexNumber instances."""
         return ComplexNumber(-self.rel, -self.img)
@@ -89,6 +191,14 @@ class ComplexNumber:
             float: The magnitude of the complex number.
         """
         return (self.rel**2 + self.img**2) ** 0.5
+
+    def magnitude_squared(self) -> float:
+        """Calculates the squared magnitude of the complex number without a square root.
+        
+        Returns:
+            float: The squared magnitude of the complex number.
+        """
+        return self.rel * self.rel + self.img * self.img
     
     def conjugate(self) -> "ComplexNumber":
         """Calculates the complex conjugate of the complex number.
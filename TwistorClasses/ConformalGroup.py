@@ -0,0 +1,209 @@
+import numpy as np
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.ProjectiveTransform import ProjectiveTransform, as_complex_matrix
+from TwistorClasses.TwistorMappingBatch import minkowski_matrices, twistors_to_array, twistors_from_array
+from TwistorClasses.InverseMapping import minkowski_coordinates
+
+# The Hermitian form i(μ†λ - λ†μ) preserved by SU(2,2), on (mu0, mu1, lambda0, lambda1).
+# Twistors of real spacetime points are null for it.
+INVARIANT_FORM = np.block([[np.zeros((2, 2)), 1j * np.eye(2)], [-1j * np.eye(2), np.zeros((2, 2))]])
+INVARIANT_FORM.flags.writeable = False
+
+def _spacetime_matrix(t: float, x: float, y: float, z: float) -> np.ndarray:
+    """Returns the 2x2 matrix of (t, x, y, z), laid out like ComplexMinkowskiPoint.matrix."""
+    return minkowski_matrices([[t, x, y, z]])[0]
+
+def _spatial_matrix(x: float, y: float, z: float) -> np.ndarray:
+    """Returns the traceless matrix of a spatial vector in the same layout, without the 1/√2 factor."""
+    return np.array([[z, x + 1j * y], [x - 1j * y, -z]], dtype=np.complex128)
+
+def _blocks(a, b, c, d) -> np.ndarray:
+    return np.block([[a, b], [c, d]]).astype(np.complex128)
+
+def translation(t: float, x: float, y: float, z: float) -> np.ndarray:
+    """
+    Builds the twistor matrix of the translation x -> x + a.
+
+    Args:
+        t, x, y, z (float): The components of a.
+
+    Returns:
+        np.ndarray: The (4, 4) matrix [[I, A], [0, I]], where A is the matrix of a.
+    """
+    return _blocks(np.eye(2), _spacetime_matrix(t, x, y, z), np.zeros((2, 2)), np.eye(2))
+
+def lorentz(spin_matrix) -> np.ndarray:
+    """
+    Builds the twistor matrix of the Lorentz transformation X -> S X S†.
+
+    Args:
+        spin_matrix (array-like): A 2x2 complex matrix S with determinant 1.
+
+    Returns:
+        np.ndarray: The (4, 4) matrix diag(S, (S†)^-1).
+
+    Raises:
+        ValueError: If S is not 2x2 or its determinant is not 1.
+    """
+    s = np.asarray(spin_matrix, dtype=np.complex128)
+    if s.shape != (2, 2):
+        raise ValueError("The spin matrix must be 2x2")
+    if not np.isclose(np.linalg.det(s), 1.0):
+        raise ValueError("The spin matrix must have determinant 1")
+    return _blocks(s, np.zeros((2, 2)), np.zeros((2, 2)), np.linalg.inv(s.conj().T))
+
+def rotation(quaternion) -> np.ndarray:
+    """
+    Builds the twistor matrix of a spatial rotation given by a quaternion.
+
+    The rotation matches ProjectivePoint.rotate and RotationBatch: the spatial part of every
+    point is mapped to q * p * q^-1, and t is unchanged.
+
+    Args:
+        quaternion (Quaternion or array-like): A non-zero (w, x, y, z) quaternion; it is normalized.
+
+    Returns:
+        np.ndarray: The (4, 4) twistor matrix.
+
+    Raises:
+        ValueError: If the quaternion is zero.
+    """
+    if isinstance(quaternion, Quaternion):
+        quaternion = (quaternion.w, quaternion.x, quaternion.y, quaternion.z)
+    w, x, y, z = (float(c) for c in quaternion)
+    norm = (w * w + x * x + y * y + z * z) ** 0.5
+    if norm == 0:
+        raise ValueError("Cannot build a rotation from a zero quaternion.")
+    w, x, y, z = w / norm, x / norm, y / norm, z / norm
+    return lorentz(w * np.eye(2) + 1j * _spatial_matrix(x, y, z))
+
+def boost(rapidity: float, direction) -> np.ndarray:
+    """
+    Builds the twistor matrix of a boost.
+
+    A boost with rapidity φ along the unit direction n maps t -> t cosh φ + (n·x) sinh φ
+    and n·x -> (n·x) cosh φ + t sinh φ.
+
+    Args:
+        rapidity (float): The rapidity φ.
+        direction (array-like): The (x, y, z) direction; it is normalized.
+
+    Returns:
+        np.ndarray: The (4, 4) twistor matrix.
+
+    Raises:
+        ValueError: If the direction is zero.
+    """
+    x, y, z = (float(c) for c in direction)
+    norm = (x * x + y * y + z * z) ** 0.5
+    if norm == 0:
+        raise ValueError("Cannot boost along a zero direction.")
+    half = rapidity / 2
+    return lorentz(np.cosh(half) * np.eye(2) + np.sinh(half) * _spatial_matrix(x / norm, y / norm, z / norm))
+
+def dilation(scale: float) -> np.ndarray:
+    """
+    Builds the twistor matrix of the dilation x -> scale * x.
+
+    Args:
+        scale (float): A positive scale factor.
+
+    Returns:
+        np.ndarray: The (4, 4) matrix diag(√s I, I/√s).
+
+    Raises:
+        ValueError: If scale is not positive.
+    """
+    if scale <= 0:
+        raise ValueError("The dilation scale must be positive")
+    root = scale ** 0.5
+    return _blocks(root * np.eye(2), np.zeros((2, 2)), np.zeros((2, 2)), np.eye(2) / root)
+
+def special_conformal(t: float, x: float, y: float, z: float) -> np.ndarray:
+    """
+    Builds the twistor matrix of the special conformal transformation with parameter b.
+
+    Points map as x -> (x - b x²) / (1 - 2 b·x + b² x²) in the (+, -, -, -) metric.
+
+    Args:
+        t, x, y, z (float): The components of b.
+
+    Returns:
+        np.ndarray: The (4, 4) matrix [[I, 0], [B, I]].
+    """
+    m = _spacetime_matrix(t, x, y, z)
+    adjugate = np.array([[m[1, 1], -m[0, 1]], [-m[1, 0], m[0, 0]]])
+    return _blocks(np.eye(2), np.zeros((2, 2)), -2 * adjugate, np.eye(2))
+
+def is_conformal(matrix, tolerance: float = 1e-10) -> bool:
+    """
+    Checks whether a 4x4 matrix lies in SU(2,2), i.e. preserves INVARIANT_FORM and has determinant 1.
+
+    Args:
+        matrix (array-like): The matrix to check.
+        tolerance (float): The allowed absolute deviation.
+
+    Returns:
+        bool: True if the matrix is in SU(2,2).
+    """
+    m = as_complex_matrix(matrix)
+    preserved = np.allclose(m.conj().T @ INVARIANT_FORM @ m, INVARIANT_FORM, rtol=0, atol=tolerance)
+    return bool(preserved and abs(np.linalg.det(m) - 1) <= tolerance)
+
+class ConformalTransform(ProjectiveTransform):
+    """A chain of conformal transformations acting linearly on twistors as SU(2,2) matrices.
+
+    Build it from matrices such as translation, rotation, boost, dilation or
+    special_conformal, the first acting first. Composition and the cached chain product come
+    from ProjectiveTransform, so applying K composed transforms costs a single matrix multiply
+    per twistor instead of remapping every spacetime point. apply takes (..., 4) arrays of
+    (mu0, mu1, lambda0, lambda1) components, e.g. the (N, M, 4) output of twistor_mapping_batch.
+    """
+
+    def inverse(self) -> "ConformalTransform":
+        """Returns the inverse transformation, computed exactly as H M† H for M in SU(2,2)."""
+        return ConformalTransform(INVARIANT_FORM @ self.matrix.conj().T @ INVARIANT_FORM)
+
+    def apply_to_twistors(self, twistors) -> list:
+        """
+        Transforms a list of Twistor objects.
+
+        Args:
+            twistors (list of Twistor): The twistors to transform.
+
+        Returns:
+            list of Twistor: New transformed twistors.
+        """
+        return twistors_from_array(self.apply(twistors_to_array(twistors)))
+
+    def transform_points(self, coords) -> np.ndarray:
+        """
+        Applies the same transformation to spacetime points, X -> (A X + B)(C X + D)^-1.
+
+        This is what remapping transformed points through twistor_mapping would give, and
+        is mainly useful to move results back to spacetime.
+
+        Args:
+            coords (array-like): An (N, 4) array of real (t, x, y, z) coordinates.
+
+        Returns:
+            np.ndarray: An (N, 4) complex128 array. Points sent to infinity (for example by a
+                special conformal transformation) get NaN coordinates.
+        """
+        x = minkowski_matrices(coords)
+        m = self.matrix
+        numerator = m[:2, :2] @ x + m[:2, 2:]
+        denominator = m[2:, :2] @ x + m[2:, 2:]
+        det = denominator[:, 0, 0] * denominator[:, 1, 1] - denominator[:, 0, 1] * denominator[:, 1, 0]
+        # The size of the terms summed into the denominator bounds its rounding error.
+        scale = (np.linalg.norm(m[2:, :2]) * np.linalg.norm(x, axis=(1, 2)) + np.linalg.norm(m[2:, 2:])) ** 2
+        finite = np.abs(det) > 1e-12 * scale
+        inverse = np.empty_like(denominator)
+        inverse[:, 0, 0] = denominator[:, 1, 1]
+        inverse[:, 0, 1] = -denominator[:, 0, 1]
+        inverse[:, 1, 0] = -denominator[:, 1, 0]
+        inverse[:, 1, 1] = denominator[:, 0, 0]
+        inverse /= np.where(finite, det, 1.0)[:, None, None]
+        result = minkowski_coordinates(numerator @ inverse)
+        result[~finite] = np.nan
+        return result
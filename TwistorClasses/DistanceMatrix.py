@@ -0,0 +1,115 @@
+import numpy as np
+from TwistorClasses.PointArray import points_to_array
+from TwistorClasses.Parallel import executor_scope, partition
+
+DEFAULT_TILE_SIZE = 512
+
+def _spatial_coordinates(coords) -> np.ndarray:
+    """Validates (N, 4) homogeneous coordinates and returns their (N, 3) x, y, z columns."""
+    coords = np.asarray(coords, dtype=np.complex128)
+    if coords.ndim != 2 or coords.shape[1] != 4:
+        raise ValueError("Coordinates must be an (N, 4) array of homogeneous (w, x, y, z) values")
+    return np.ascontiguousarray(coords[:, 1:])
+
+def _distance_tile(rows, cols) -> np.ndarray:
+    """Computes ProjectivePoint.distance_to between every row point and every column point."""
+    diff = rows[:, None, :] - cols[None, :, :]
+    return np.sqrt((diff.real**2 + diff.imag**2).sum(axis=2))
+
+def _distance_tiles(xyz, start, stop, first_col, tile_size):
+    """Yields (col, tile) for rows start:stop of the distance matrix, one column tile from first_col onwards."""
+    n = len(xyz)
+    for col in range(first_col, n, tile_size):
+        yield col, _distance_tile(xyz[start:stop], xyz[col:min(col + tile_size, n)])
+
+def condensed_index(n: int, i: int, j: int) -> int:
+    """
+    Returns the position of pair (i, j), i < j, in a condensed distance vector of n points.
+
+    Args:
+        n (int): The number of points.
+        i (int): The smaller point index.
+        j (int): The larger point index.
+
+    Returns:
+        int: The index into the condensed vector.
+    """
+    return n * i - i * (i + 1) // 2 + (j - i - 1)
+
+def _condensed_span(n: int, start: int, stop: int) -> slice:
+    """Returns the slice of the condensed vector holding the pairs of rows start:stop."""
+    return slice(condensed_index(n, start, start + 1), condensed_index(n, stop - 1, stop) + n - stop)
+
+def _dense_kernel(start, stop, xyz, tile_size, out):
+    for col, tile in _distance_tiles(xyz, start, stop, 0, tile_size):
+        out[:, col:col + tile.shape[1]] = tile
+
+def _condensed_kernel(start, stop, xyz, tile_size, out):
+    n = len(xyz)
+    rows = np.arange(start, stop)
+    # Condensed position of pair (i, j) relative to the block's first pair, minus j.
+    row_offsets = (n * rows - rows * (rows + 1) // 2 - rows - 1 - condensed_index(n, start, start + 1))[:, None]
+    for col, tile in _distance_tiles(xyz, start, stop, start, tile_size):
+        cols = np.arange(col, col + tile.shape[1])
+        if col >= stop:
+            out[row_offsets + cols] = tile
+        else:
+            upper = cols > rows[:, None]
+            out[(row_offsets + cols)[upper]] = tile[upper]
+
+def distance_matrix(coords, condensed: bool = False, tile_size: int = DEFAULT_TILE_SIZE, processes: int = None,
+                    executor=None) -> np.ndarray:
+    """
+    Computes the pairwise distance matrix of homogeneous coordinates, tile by tile.
+
+    Distances are the same as ProjectivePoint.distance_to: the Euclidean norm of the
+    complex differences of the x, y and z components.
+
+    Args:
+        coords (array-like): An (N, 4) complex array of (w, x, y, z) coordinates, e.g. from points_to_array.
+        condensed (bool): If True, returns the N*(N-1)/2 upper-triangle entries in row-major
+            order instead of the dense matrix.
+        tile_size (int): The number of rows and columns computed together; each tile is
+            written straight into the result, so working memory per worker is proportional
+            to tile_size**2.
+        processes (int): If given, row blocks are spread across this many worker processes.
+            Shorthand for executor="process" with that many workers.
+        executor: A backend accepted by Parallel.get_executor ("serial", "thread", "process"
+            or an executor instance).
+
+    Returns:
+        np.ndarray: A dense (N, N) float64 matrix or a condensed float64 vector.
+    """
+    if tile_size <= 0:
+        raise ValueError("tile_size must be positive")
+    xyz = _spatial_coordinates(coords)
+    n = len(xyz)
+    blocks = partition(n, tile_size)
+    if executor is None and processes and processes > 1:
+        executor = "process"
+    with executor_scope(executor, processes) as backend:
+        if condensed:
+            out = np.empty(n * (n - 1) // 2, dtype=np.float64)
+            regions = [(_condensed_span(n, start, stop),) for start, stop in blocks]
+            return backend.run(_condensed_kernel, blocks, (xyz, tile_size), out, regions)
+        out = np.empty((n, n), dtype=np.float64)
+        backend.run(_dense_kernel, blocks, (xyz, tile_size), out)
+    np.fill_diagonal(out, 0.0)
+    return out
+
+def compute_distance_matrix(points, condensed: bool = False, tile_size: int = DEFAULT_TILE_SIZE, processes: int = None,
+                            executor=None) -> np.ndarray:
+    """
+    Array-backed replacement for ProjectivePoint.compute_distance_matrix.
+
+    Args:
+        points (list of ProjectivePoint): The points for which to compute the distance matrix.
+        condensed (bool): If True, returns the condensed upper-triangle vector.
+        tile_size (int): The number of rows and columns computed together.
+        processes (int): If given, row blocks are spread across this many worker processes.
+        executor: A backend accepted by Parallel.get_executor.
+
+    Returns:
+        np.ndarray: A dense (N, N) float64 matrix or a condensed float64 vector.
+    """
+    return distance_matrix(points_to_array(points), condensed, tile_size, processes, executor)
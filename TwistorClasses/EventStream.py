@@ -0,0 +1,194 @@
+from itertools import islice
+import os
+import numpy as np
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch
+
+DEFAULT_CHUNK_SIZE = 65536
+_NPY_HEADER_SIZE = 128
+
+def _is_numeric_line(line, columns, delimiter) -> bool:
+    """Returns True if every requested column of a CSV line parses as a number."""
+    fields = line.split(delimiter)
+    try:
+        return all(float(fields[c]) is not None for c in columns)
+    except (ValueError, IndexError):
+        return False
+
+def read_csv_events(path, chunk_size: int = DEFAULT_CHUNK_SIZE, columns=(0, 1, 2, 3), delimiter: str = ","):
+    """
+    Reads (t, x, y, z) events from a CSV file in fixed-size chunks.
+
+    A first line that does not parse as numbers is treated as a header and skipped.
+
+    Args:
+        path (str): The CSV file to read.
+        chunk_size (int): The maximum number of events per chunk.
+        columns (tuple): The column indices holding t, x, y and z.
+        delimiter (str): The field separator.
+
+    Yields:
+        np.ndarray: (n, 4) float64 arrays of events, n <= chunk_size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    with open(path, "r") as handle:
+        first = handle.readline()
+        pending = [first] if _is_numeric_line(first, columns, delimiter) else []
+        while True:
+            lines = pending + list(islice(handle, chunk_size - len(pending)))
+            pending = []
+            if not lines:
+                return
+            lines = [line for line in lines if line.strip()]
+            if not lines:
+                continue
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=columns, dtype=np.float64, ndmin=2)
+
+def read_binary_events(path, chunk_size: int = DEFAULT_CHUNK_SIZE, dtype=np.float64):
+    """
+    Reads (t, x, y, z) events from a raw binary file through a memory map.
+
+    The file holds consecutive records of four values of the given dtype. Each chunk is a
+    view into the map, so only the pages being processed are resident.
+
+    Args:
+        path (str): The binary file to read.
+        chunk_size (int): The maximum number of events per chunk.
+        dtype: The on-disk value type, e.g. "<f8" or "<f4".
+
+    Yields:
+        np.ndarray: (n, 4) arrays of events, n <= chunk_size. An empty file yields nothing.
+
+    Raises:
+        ValueError: If chunk_size is not positive or the file size is not a whole number of records.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    dtype = np.dtype(dtype)
+    size = os.path.getsize(path)
+    if size % (4 * dtype.itemsize):
+        raise ValueError("Binary event file size is not a whole number of (t, x, y, z) records")
+    if size == 0:
+        # np.memmap cannot map an empty file.
+        return
+    events = np.memmap(path, dtype=dtype, mode="r").reshape(-1, 4)
+    for start in range(0, len(events), chunk_size):
+        yield events[start:start + chunk_size]
+
+def map_event_chunks(chunks, spinors):
+    """
+    Maps each chunk of events against a fixed set of spinors.
+
+    Args:
+        chunks (iterable): (n, 4) arrays of (t, x, y, z) events.
+        spinors (array-like): An (M, 2) array of complex λ spinor components.
+
+    Yields:
+        np.ndarray: (n, M, 4) complex128 twistor arrays, one per input chunk.
+    """
+    spinors = np.asarray(spinors, dtype=np.complex128)
+    for chunk in chunks:
+        yield twistor_mapping_batch(chunk, spinors)
+
+class TwistorStreamWriter:
+    """Appends twistor chunks, or rows of any fixed dtype, to a growing .npy file.
+
+    The header is reserved up front and rewritten with the final shape on close, so the
+    result can be opened with np.load(path, mmap_mode="r"). If a with block exits with an
+    exception, the header is left blank instead, so a partial file is never mistaken for a
+    complete one.
+    """
+
+    def __init__(self, path, dtype=np.complex128):
+        """Initializes the writer and reserves the file header.
+
+        Args:
+            path (str): The output .npy file, overwritten if it exists.
+            dtype: The element type stored; blocks are converted to it.
+        """
+        self.path = path
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self.rows = 0
+        self.row_shape = None
+        self.failed = False
+        self._handle = open(path, "wb")
+        self._handle.write(b"\0" * _NPY_HEADER_SIZE)
+
+    def write(self, block):
+        """
+        Appends a block of rows.
+
+        Args:
+            block (array-like): An array whose trailing dimensions match earlier blocks.
+
+        Raises:
+            ValueError: If the block's trailing shape differs from previous blocks.
+        """
+        block = np.ascontiguousarray(block, dtype=self.dtype)
+        if self.row_shape is None:
+            self.row_shape = block.shape[1:]
+        elif block.shape[1:] != self.row_shape:
+            raise ValueError("All blocks must share the same trailing shape")
+        self._handle.write(block.tobytes())
+        self.rows += len(block)
+
+    def close(self):
+        """
+        Writes the final header and closes the file.
+
+        Raises:
+            ValueError: If the shape does not fit in the reserved header; the file is left
+                without a valid header.
+        """
+        if self._handle.closed:
+            return
+        shape = (self.rows,) + (self.row_shape or ())
+        header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (self.dtype.str, shape)
+        if len(header) > _NPY_HEADER_SIZE - 10 - 1:
+            self.abort()
+            raise ValueError(f"The .npy header for shape {shape} does not fit in {_NPY_HEADER_SIZE} bytes")
+        header = header.ljust(_NPY_HEADER_SIZE - 10 - 1) + "\n"
+        self._handle.seek(0)
+        self._handle.write(b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1"))
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def abort(self):
+        """Closes the file without writing a header and marks the writer as failed."""
+        self.failed = True
+        self._handle.close()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def stream_events_to_twistors(input_path, output_path, spinors, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              binary: bool = None) -> int:
+    """
+    Runs an event file through the twistor mapping chunk by chunk and writes the result incrementally.
+
+    Memory use is bounded by chunk_size x M twistors regardless of the file size.
+
+    Args:
+        input_path (str): A CSV file, or a raw binary file of float64 (t, x, y, z) records.
+        output_path (str): The .npy file receiving the (N, M, 4) twistor array.
+        spinors (array-like): An (M, 2) array of complex λ spinor components.
+        chunk_size (int): The number of events processed per chunk.
+        binary (bool): Forces the input format; by default files ending in .csv or .txt are read as CSV.
+
+    Returns:
+        int: The number of events processed.
+    """
+    if binary is None:
+        binary = not str(input_path).lower().endswith((".csv", ".txt"))
+    chunks = read_binary_events(input_path, chunk_size) if binary else read_csv_events(input_path, chunk_size)
+    spinors = np.asarray(spinors, dtype=np.complex128)
+    with TwistorStreamWriter(output_path) as writer:
+        writer.row_shape = (len(spinors), 4)
+        for block in map_event_chunks(chunks, spinors):
+            writer.write(block)
+    return writer.rows
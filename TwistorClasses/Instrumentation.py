@@ -0,0 +1,303 @@
+from collections import defaultdict
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+import tracemalloc
+
+# (module, qualified name) of every method and function instrumented by default.
+DEFAULT_TARGETS = (
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.__add__"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.__sub__"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.__mul__"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.__truediv__"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.__neg__"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.multiply"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.divide"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.multiply_add"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.magnitude"),
+    ("TwistorClasses.ComplexNumber", "ComplexNumber.conjugate"),
+    ("TwistorClasses.Quaternion", "Quaternion.add"),
+    ("TwistorClasses.Quaternion", "Quaternion.subtract"),
+    ("TwistorClasses.Quaternion", "Quaternion.multiply"),
+    ("TwistorClasses.Quaternion", "Quaternion.multiply_add"),
+    ("TwistorClasses.Quaternion", "Quaternion.__mul__"),
+    ("TwistorClasses.Quaternion", "Quaternion.magnitude"),
+    ("TwistorClasses.Quaternion", "Quaternion.conjugate"),
+    ("TwistorClasses.Quaternion", "Quaternion.normalize"),
+    ("TwistorClasses.Quaternion", "Quaternion.inverse"),
+    ("TwistorClasses.Quaternion", "Quaternion.dot_product"),
+    ("TwistorClasses.Quaternion", "Quaternion.angle_with"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.normalize"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.to_affine"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.distance_to"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.angle_with"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.rotate"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.apply_transformation"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint.compute_distance_matrix"),
+    ("TwistorClasses.ProjectiveLine", "ProjectiveLine.cross_product"),
+    ("TwistorClasses.ProjectiveLine", "ProjectiveLine.intersect"),
+    ("TwistorClasses.ProjectiveLine", "ProjectiveLine.intersect_bool"),
+    ("TwistorClasses.ProjectiveLine", "ProjectiveLine.rotate"),
+    ("TwistorClasses.TwistorMapping", "twistor_mapping"),
+)
+
+# Classes whose constructions are counted as allocations.
+DEFAULT_ALLOCATION_TARGETS = (
+    ("TwistorClasses.ComplexNumber", "ComplexNumber"),
+    ("TwistorClasses.Quaternion", "Quaternion"),
+    ("TwistorClasses.ProjectivePoint", "ProjectivePoint"),
+    ("TwistorClasses.ProjectiveLine", "ProjectiveLine"),
+    ("TwistorClasses.TwistorMapping", "Spinor"),
+    ("TwistorClasses.TwistorMapping", "Twistor"),
+    ("TwistorClasses.TwistorMapping", "ComplexMinkowskiPoint"),
+)
+
+_active = None
+
+class _Counter:
+    __slots__ = ("calls", "total", "children")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.children = 0.0
+
+class Profiler:
+    """An opt-in profiling session over the core TwistorClasses methods.
+
+    While a session is active, the instrumented methods are replaced by wrappers that count
+    calls, time them and count constructions of the core classes; stop() puts the original
+    functions back. Outside a session nothing is patched, so disabled instrumentation costs
+    nothing. Use it as a context manager:
+
+        with Profiler() as profiler:
+            run_job()
+        print(profiler.format_report())
+
+    Only one session can be active at a time, but it may observe several threads: each
+    thread keeps its own stack of open calls, so nesting and self time are attributed per
+    thread. Times are wall-clock and inclusive of nested instrumented calls; self time
+    excludes them. Counters are shared and updated without a lock, so concurrent threads
+    may occasionally lose an increment.
+    """
+
+    def __init__(self, targets=DEFAULT_TARGETS, allocation_targets=DEFAULT_ALLOCATION_TARGETS,
+                 trace_memory: bool = False):
+        """Initializes an inactive session.
+
+        Args:
+            targets (iterable of tuple): (module, "Class.method" or "function") pairs to time.
+            allocation_targets (iterable of tuple): (module, "Class") pairs whose constructions are counted.
+            trace_memory (bool): If True, also records the session's peak traced memory with tracemalloc.
+        """
+        self.targets = tuple(targets)
+        self.allocation_targets = tuple(allocation_targets)
+        self.trace_memory = trace_memory
+        self.counters = defaultdict(_Counter)
+        self.allocations = defaultdict(int)
+        self.wall_time = 0.0
+        self.peak_memory = None
+        self._patches = []
+        self._local = threading.local()
+        self._started = None
+        self._owns_tracing = False
+
+    @property
+    def active(self) -> bool:
+        return self._started is not None
+
+    def _timed(self, name, function):
+        counter = self.counters[name]
+        local = self._local
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            counter.calls += 1
+            try:
+                stack = local.stack
+            except AttributeError:
+                stack = local.stack = []
+            stack.append(0.0)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                counter.total += elapsed
+                counter.children += stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+        return wrapper
+
+    def _counted(self, name, init):
+        allocations = self.allocations
+
+        @functools.wraps(init)
+        def wrapper(instance, *args, **kwargs):
+            allocations[name] += 1
+            return init(instance, *args, **kwargs)
+        return wrapper
+
+    def _patch(self, owner, attribute, replacement):
+        original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+        self._patches.append((owner, attribute, original))
+        setattr(owner, attribute, replacement)
+
+    def _patch_method(self, module_name, qualified_name):
+        module = importlib.import_module(module_name)
+        if "." not in qualified_name:
+            original = getattr(module, qualified_name)
+            wrapper = self._timed(qualified_name, original)
+            # Also rebind copies imported into other package modules with "from ... import" and
+            # the package's own lazily cached exports. Every copy is looked up before any is
+            # patched, so a lazy lookup caches (and later restores) the original, not the wrapper.
+            owners = [loaded for name, loaded in list(sys.modules.items())
+                      if name in (module_name, "TwistorClasses") or name.startswith("TwistorClasses.")]
+            for loaded in [owner for owner in owners if getattr(owner, qualified_name, None) is original]:
+                self._patch(loaded, qualified_name, wrapper)
+            return
+        class_name, method_name = qualified_name.split(".")
+        cls = getattr(module, class_name)
+        raw = cls.__dict__[method_name]
+        if isinstance(raw, staticmethod):
+            self._patch(cls, method_name, staticmethod(self._timed(qualified_name, raw.__func__)))
+        elif isinstance(raw, classmethod):
+            self._patch(cls, method_name, classmethod(self._timed(qualified_name, raw.__func__)))
+        else:
+            self._patch(cls, method_name, self._timed(qualified_name, raw))
+
+    def start(self):
+        """
+        Installs the instrumentation wrappers and starts the session.
+
+        Raises:
+            RuntimeError: If a session is already active.
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiling session is already active")
+        _active = self
+        try:
+            for module_name, qualified_name in self.targets:
+                self._patch_method(module_name, qualified_name)
+            for module_name, class_name in self.allocation_targets:
+                cls = getattr(importlib.import_module(module_name), class_name)
+                self._patch(cls, "__init__", self._counted(class_name, cls.__dict__["__init__"]))
+        except BaseException:
+            self._restore()
+            _active = None
+            raise
+        self._owns_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self):
+        """Restores the original functions and ends the session; calling it twice is harmless."""
+        global _active
+        if self._started is None:
+            return
+        self.wall_time += time.perf_counter() - self._started
+        self._started = None
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory = max(self.peak_memory or 0, peak)
+            if self._owns_tracing:
+                tracemalloc.stop()
+        self._restore()
+        _active = None
+
+    def _restore(self):
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches.clear()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def reset(self):
+        """Clears the collected counters while keeping the session state."""
+        for counter in self.counters.values():
+            counter.calls = 0
+            counter.total = counter.children = 0.0
+        self.allocations.clear()
+        self.wall_time = 0.0
+        self.peak_memory = None
+
+    def report(self) -> dict:
+        """
+        Summarizes the session.
+
+        Returns:
+            dict: "operations" maps each called target to calls, total_s, self_s and mean_s;
+                "allocations" maps class names to constructions; also wall_s and peak_memory_bytes.
+        """
+        operations = {
+            name: {
+                "calls": counter.calls,
+                "total_s": counter.total,
+                "self_s": counter.total - counter.children,
+                "mean_s": counter.total / counter.calls,
+            }
+            for name, counter in self.counters.items() if counter.calls
+        }
+        return {
+            "wall_s": self.wall_time,
+            "operations": operations,
+            "allocations": dict(self.allocations),
+            "peak_memory_bytes": self.peak_memory,
+        }
+
+    def to_json(self, path: str = None) -> str:
+        """
+        Exports report() as JSON.
+
+        Args:
+            path (str): If given, the JSON is also written to this file.
+
+        Returns:
+            str: The JSON text.
+        """
+        text = json.dumps(self.report(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+    def format_report(self, sort: str = "self_s", limit: int = None) -> str:
+        """
+        Renders report() as a text table.
+
+        Args:
+            sort (str): The operation column to sort by, descending.
+            limit (int): The maximum number of operations listed.
+
+        Returns:
+            str: The table.
+        """
+        report = self.report()
+        rows = sorted(report["operations"].items(), key=lambda item: item[1][sort], reverse=True)[:limit]
+        lines = [f"{'operation':<42} {'calls':>10} {'total s':>10} {'self s':>10} {'mean us':>10}"]
+        for name, row in rows:
+            lines.append(f"{name:<42} {row['calls']:>10} {row['total_s']:>10.4f} {row['self_s']:>10.4f} "
+                         f"{row['mean_s'] * 1e6:>10.2f}")
+        lines.append("")
+        lines.append(f"{'allocations':<42} {'count':>10}")
+        for name, count in sorted(report["allocations"].items(), key=lambda item: item[1], reverse=True):
+            lines.append(f"{name:<42} {count:>10}")
+        lines.append("")
+        lines.append(f"wall time {report['wall_s']:.4f}s")
+        if report["peak_memory_bytes"] is not None:
+            lines.append(f"peak traced memory {report['peak_memory_bytes'] / 1024:.1f} KiB")
+        return "\n".join(lines)
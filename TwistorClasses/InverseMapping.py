@@ -0,0 +1,78 @@
+import numpy as np
+
+def minkowski_coordinates(matrices) -> np.ndarray:
+    """
+    Recovers (t, x, y, z) from 2x2 matrices laid out like ComplexMinkowskiPoint.matrix.
+
+    Args:
+        matrices (array-like): An (N, 2, 2) complex array.
+
+    Returns:
+        np.ndarray: An (N, 4) complex128 array; real points have zero imaginary parts.
+    """
+    matrices = np.asarray(matrices, dtype=np.complex128)
+    coords = np.empty(matrices.shape[:-2] + (4,), dtype=np.complex128)
+    coords[..., 0] = matrices[..., 0, 0] + matrices[..., 1, 1]
+    coords[..., 1] = matrices[..., 0, 1] + matrices[..., 1, 0]
+    coords[..., 2] = -1j * (matrices[..., 0, 1] - matrices[..., 1, 0])
+    coords[..., 3] = matrices[..., 0, 0] - matrices[..., 1, 1]
+    return coords / 2**0.5
+
+def inverse_twistor_mapping_batch(twistors):
+    """
+    Solves the incidence relation μ = x·λ for the spacetime point of each twistor line.
+
+    Each line is given by K >= 2 twistors with linearly independent λ. For K = 2 the 2x2
+    system is solved exactly; for K > 2 it is solved in the least-squares sense.
+
+    Args:
+        twistors (array-like): An (N, K, 4) complex array of (mu0, mu1, lambda0, lambda1)
+            rows, e.g. a slice of twistor_mapping_batch output.
+
+    Returns:
+        tuple: (coords, residual) where coords is an (N, 4) complex128 array of (t, x, y, z)
+            and residual is an (N,) array of ||x·λ - μ|| / ||μ||. Lines whose λ are all
+            proportional have no unique solution and get NaN coordinates and an infinite residual.
+    """
+    twistors = np.asarray(twistors, dtype=np.complex128)
+    if twistors.ndim != 3 or twistors.shape[1] < 2 or twistors.shape[2] != 4:
+        raise ValueError("Twistors must be an (N, K, 4) array with K >= 2")
+    mu = np.swapaxes(twistors[:, :, :2], 1, 2)
+    lam = np.swapaxes(twistors[:, :, 2:], 1, 2)
+    lam_h = np.conj(np.swapaxes(lam, 1, 2))
+
+    gram = lam @ lam_h
+    det = gram[:, 0, 0] * gram[:, 1, 1] - gram[:, 0, 1] * gram[:, 1, 0]
+    scale = np.einsum("nij,nij->n", gram, np.conj(gram)).real
+    solvable = np.abs(det) > 1e-12 * scale
+    safe_det = np.where(solvable, det, 1.0)
+    inverse = np.empty_like(gram)
+    inverse[:, 0, 0] = gram[:, 1, 1]
+    inverse[:, 0, 1] = -gram[:, 0, 1]
+    inverse[:, 1, 0] = -gram[:, 1, 0]
+    inverse[:, 1, 1] = gram[:, 0, 0]
+    inverse /= safe_det[:, None, None]
+
+    matrices = mu @ lam_h @ inverse
+    error = np.linalg.norm((matrices @ lam - mu).reshape(len(mu), -1), axis=1)
+    magnitude = np.linalg.norm(mu.reshape(len(mu), -1), axis=1)
+    residual = error / np.where(magnitude > 0, magnitude, 1.0)
+
+    coords = minkowski_coordinates(matrices)
+    coords[~solvable] = np.nan
+    residual[~solvable] = np.inf
+    return coords, residual
+
+def inverse_twistor_mapping(twistors) -> tuple:
+    """
+    Recovers the spacetime point whose twistor line contains the given twistors.
+
+    Args:
+        twistors (list of Twistor): Two or more twistors on the same line.
+
+    Returns:
+        tuple: ((t, x, y, z), residual) with complex coordinates and the relative incidence residual.
+    """
+    rows = [[complex(c.rel, c.img) for c in t.mu.components + t.lambda_.components] for t in twistors]
+    coords, residual = inverse_twistor_mapping_batch(np.array([rows], dtype=np.complex128))
+    return tuple(coords[0].tolist()), float(residual[0])
@@ -0,0 +1,487 @@
+from itertools import count
+import re
+import weakref
+import numpy as np
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.QuaternionArray import QuaternionArray
+
+REAL = "real"
+COMPLEX = "complex"
+QUATERNION = "quaternion"
+KINDS = (REAL, COMPLEX, QUATERNION)
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_COMMUTATIVE = {"add", "mul"}
+_COMPONENTS = {COMPLEX: ("rel", "img"), QUATERNION: ("w", "x", "y", "z")}
+
+# Every live node, keyed by its structure, so building the same subexpression twice returns
+# the existing node. Shared subexpressions are therefore evaluated once per compiled kernel.
+_nodes = weakref.WeakValueDictionary()
+_serial = count()
+
+class Expression:
+    """A node of a lazily evaluated, hash-consed expression DAG over real, complex and quaternion values.
+
+    Expressions support the same arithmetic and methods as ComplexNumber and Quaternion, so
+    code written for those classes can be traced into a graph by passing symbols instead of
+    values. Structurally equal expressions are the same object, which makes common
+    subexpressions (e.g. the same inverse used twice) shared nodes. compile_expression turns
+    a graph into one fused NumPy kernel that evaluates it over whole arrays of inputs.
+    """
+
+    __slots__ = ("op", "kind", "args", "payload", "serial", "__weakref__")
+
+    def __new__(cls, op, kind, args=(), payload=None):
+        if op in _COMMUTATIVE and kind != QUATERNION and args[0].serial > args[1].serial:
+            args = (args[1], args[0])
+        key = (op, kind, payload, args)
+        node = _nodes.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            node.op = op
+            node.kind = kind
+            node.args = args
+            node.payload = payload
+            node.serial = next(_serial)
+            _nodes[key] = node
+        return node
+
+    def __repr__(self):
+        if self.op == "symbol":
+            return f"{self.payload}"
+        if self.op == "constant":
+            return repr(self.payload)
+        return f"{self.op}({', '.join(repr(a) for a in self.args)})"
+
+    # Arithmetic
+    def __add__(self, other):
+        return _binary("add", self, other)
+
+    def __radd__(self, other):
+        return _binary("add", other, self)
+
+    def __sub__(self, other):
+        return _binary("sub", self, other)
+
+    def __rsub__(self, other):
+        return _binary("sub", other, self)
+
+    def __mul__(self, other):
+        return _binary("mul", self, other)
+
+    def __rmul__(self, other):
+        return _binary("mul", other, self)
+
+    def __truediv__(self, other):
+        return _binary("div", self, other)
+
+    def __rtruediv__(self, other):
+        return _binary("div", other, self)
+
+    def __neg__(self):
+        if self.op == "neg":
+            return self.args[0]
+        return Expression("neg", self.kind, (self,))
+
+    def __pow__(self, exponent):
+        if self.kind != REAL or not isinstance(exponent, (int, float)):
+            raise TypeError("Only real expressions can be raised to a constant real power")
+        if exponent == 1:
+            return self
+        return Expression("pow", REAL, (self,), float(exponent))
+
+    # ComplexNumber and Quaternion methods
+    def add(self, other):
+        return self + other
+
+    def subtract(self, other):
+        return self - other
+
+    def multiply(self, other):
+        return self * other
+
+    def divide(self, other):
+        return self / other
+
+    def conjugate(self) -> "Expression":
+        """Returns the complex or quaternion conjugate; real expressions are returned unchanged."""
+        if self.kind == REAL:
+            return self
+        if self.op == "conj":
+            return self.args[0]
+        return Expression("conj", self.kind, (self,))
+
+    def magnitude_squared(self) -> "Expression":
+        return Expression("abs2", REAL, (self,))
+
+    def magnitude(self) -> "Expression":
+        return Expression("abs", REAL, (self,))
+
+    def inverse(self) -> "Expression":
+        """Returns the multiplicative inverse, for quaternions q* / |q|²."""
+        if self.kind == QUATERNION:
+            return Expression("inverse", QUATERNION, (self,))
+        return 1.0 / self
+
+    def normalize(self) -> "Expression":
+        return Expression("normalize", self.kind, (self,))
+
+    def dot_product(self, other) -> "Expression":
+        other = _as_expression(other)
+        if self.kind != QUATERNION or other.kind != QUATERNION:
+            raise TypeError("dot_product is defined for quaternion expressions")
+        return Expression("dot", REAL, (self, other))
+
+    def _component(self, name):
+        if name not in _COMPONENTS.get(self.kind, ()):
+            raise AttributeError(f"{self.kind} expressions have no component {name!r}")
+        return Expression("component", REAL, (self,), _COMPONENTS[self.kind].index(name))
+
+    rel = property(lambda self: self._component("rel"))
+    img = property(lambda self: self._component("img"))
+    w = property(lambda self: self._component("w"))
+    x = property(lambda self: self._component("x"))
+    y = property(lambda self: self._component("y"))
+    z = property(lambda self: self._component("z"))
+
+def symbol(name: str, kind: str = COMPLEX) -> Expression:
+    """
+    Creates a named input of a compiled expression.
+
+    Args:
+        name (str): The keyword the input is passed under; must be a Python identifier.
+        kind (str): REAL, COMPLEX or QUATERNION.
+
+    Returns:
+        Expression: The symbol node.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown expression kind: {kind}")
+    if not name.isidentifier():
+        raise ValueError("Symbol names must be Python identifiers")
+    return Expression("symbol", kind, (), name)
+
+def lazy(value) -> Expression:
+    """
+    Wraps a number, ComplexNumber, Quaternion or Expression as an expression constant.
+
+    Returns:
+        Expression: A constant node, or value itself if it already is an Expression.
+    """
+    return _as_expression(value)
+
+def complex_from(rel, img) -> Expression:
+    """Builds a complex expression from real and imaginary parts."""
+    return Expression("pack", COMPLEX, (_real(rel), _real(img)))
+
+def quaternion_from(w, x, y, z) -> Expression:
+    """Builds a quaternion expression from its four real components."""
+    return Expression("pack", QUATERNION, tuple(_real(c) for c in (w, x, y, z)))
+
+def _real(value) -> Expression:
+    value = _as_expression(value)
+    if value.kind != REAL:
+        raise TypeError("Components must be real expressions")
+    return value
+
+def _as_expression(value) -> Expression:
+    if isinstance(value, Expression):
+        return value
+    if isinstance(value, bool):
+        raise TypeError("Unsupported operand type for a lazy expression")
+    if isinstance(value, (int, float)):
+        return Expression("constant", REAL, (), float(value))
+    if isinstance(value, complex):
+        return Expression("constant", COMPLEX, (), value)
+    if isinstance(value, ComplexNumber):
+        if isinstance(value.rel, Expression) or isinstance(value.img, Expression):
+            return complex_from(value.rel, value.img)
+        return Expression("constant", COMPLEX, (), complex(value.rel, value.img))
+    if isinstance(value, Quaternion):
+        components = (value.w, value.x, value.y, value.z)
+        if any(isinstance(c, Expression) for c in components):
+            return quaternion_from(*components)
+        return Expression("constant", QUATERNION, (), tuple(float(c) for c in components))
+    raise TypeError("Unsupported operand type for a lazy expression")
+
+def _binary(op, left, right) -> Expression:
+    left, right = _as_expression(left), _as_expression(right)
+    kinds = {left.kind, right.kind}
+    if kinds == {COMPLEX, QUATERNION}:
+        raise TypeError(f"Unsupported operand types for {op}: complex and quaternion")
+    if QUATERNION in kinds and op in ("add", "sub") and kinds != {QUATERNION}:
+        raise TypeError(f"Unsupported operand types for {op}: quaternion and real")
+    if op == "div" and right.kind == QUATERNION:
+        right = right.inverse()
+        op = "mul"
+    if op == "mul" and right.op == "constant" and right.payload == 1.0:
+        return left
+    if op == "mul" and left.op == "constant" and left.payload == 1.0:
+        return right
+    if op in ("add", "sub") and right.op == "constant" and right.payload == 0.0:
+        return left
+    kind = QUATERNION if QUATERNION in kinds else COMPLEX if COMPLEX in kinds else REAL
+    return Expression(op, kind, (left, right))
+
+def _order(outputs) -> list:
+    """Returns every node reachable from outputs, each after its arguments."""
+    order, seen = [], set()
+    for root in outputs:
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in seen:
+                continue
+            if expanded:
+                seen.add(id(node))
+                order.append(node)
+                continue
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in reversed(node.args) if id(arg) not in seen)
+    return order
+
+class _CodeGenerator:
+    """Lowers a DAG to straight-line NumPy code over real and complex arrays.
+
+    Complex values stay complex128 arrays; quaternions are split into four real arrays so
+    Hamilton products need no stacking. Each node emits its lines once, however often it is used.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.constants = {}
+        self.names = {}
+        self._temporaries = count()
+
+    def _new(self):
+        return f"t{next(self._temporaries)}"
+
+    def _emit(self, expression):
+        target = self._new()
+        self.lines.append((target, expression))
+        return target
+
+    def constant(self, value):
+        name = f"k{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def lower(self, node, parameter=None):
+        op, kind, a = node.op, node.kind, [self.names[id(arg)] for arg in node.args]
+        if op == "symbol":
+            if kind == QUATERNION:
+                return [self._emit(f"{parameter}[..., {k}]") for k in range(4)]
+            return [parameter]
+        if op == "constant":
+            values = node.payload if kind == QUATERNION else (node.payload,)
+            return [self.constant(v) for v in values]
+        if op == "component":
+            parts = a[0]
+            if node.args[0].kind == COMPLEX:
+                return [self._emit(f"{parts[0]}.{'real' if node.payload == 0 else 'imag'}")]
+            return [parts[node.payload]]
+        if op == "pack":
+            if kind == COMPLEX:
+                return [self._emit(f"{a[0][0]} + 1j * {a[1][0]}")]
+            return [parts[0] for parts in a]
+        if kind != QUATERNION:
+            return [self._emit(self._scalar(op, node, [parts[0] for parts in a]))]
+        return self._quaternion(op, node, a)
+
+    def _scalar(self, op, node, a):
+        if op in ("add", "sub", "mul", "div"):
+            return f"{a[0]} {'+-*/'['add sub mul div'.split().index(op)]} {a[1]}"
+        if op == "neg":
+            return f"-{a[0]}"
+        if op == "conj":
+            return f"np.conj({a[0]})"
+        if op == "pow":
+            if node.payload == 2.0:
+                return f"{a[0]} * {a[0]}"
+            if node.payload == 0.5:
+                return f"np.sqrt({a[0]})"
+            return f"{a[0]} ** {node.payload!r}"
+        if op == "normalize":
+            return f"{a[0]} / np.abs({a[0]})"
+        arg = node.args[0]
+        parts = self.names[id(arg)]
+        if arg.kind == QUATERNION:
+            if op == "dot":
+                other = self.names[id(node.args[1])]
+                return " + ".join(f"{p} * {q}" for p, q in zip(parts, other))
+            squared = " + ".join(f"{p} * {p}" for p in parts)
+            return squared if op == "abs2" else f"np.sqrt({squared})"
+        if op == "abs2":
+            return f"{a[0]}.real * {a[0]}.real + {a[0]}.imag * {a[0]}.imag" if arg.kind == COMPLEX else f"{a[0]} * {a[0]}"
+        if op == "abs":
+            return f"np.abs({a[0]})"
+        raise ValueError(f"Cannot lower operation {op}")
+
+    def _quaternion(self, op, node, a):
+        kinds = [arg.kind for arg in node.args]
+        if op in ("add", "sub"):
+            sign = "+" if op == "add" else "-"
+            return [self._emit(f"{p} {sign} {q}") for p, q in zip(a[0], a[1])]
+        if op == "neg":
+            return [self._emit(f"-{p}") for p in a[0]]
+        if op == "conj":
+            return [a[0][0]] + [self._emit(f"-{p}") for p in a[0][1:]]
+        if op in ("mul", "div") and kinds != [QUATERNION, QUATERNION]:
+            q, r = (a[0], a[1][0]) if kinds[0] == QUATERNION else (a[1], a[0][0])
+            symbol = "*" if op == "mul" else "/"
+            return [self._emit(f"{p} {symbol} {r}") for p in q]
+        if op == "mul":
+            (aw, ax, ay, az), (bw, bx, by, bz) = a
+            return [
+                self._emit(f"{aw} * {bw} - {ax} * {bx} - {ay} * {by} - {az} * {bz}"),
+                self._emit(f"{aw} * {bx} + {ax} * {bw} + {ay} * {bz} - {az} * {by}"),
+                self._emit(f"{aw} * {by} - {ax} * {bz} + {ay} * {bw} + {az} * {bx}"),
+                self._emit(f"{aw} * {bz} + {ax} * {by} - {ay} * {bx} + {az} * {bw}"),
+            ]
+        if op in ("inverse", "normalize"):
+            squared = " + ".join(f"{p} * {p}" for p in a[0])
+            scale = self._emit(f"1.0 / ({squared})" if op == "inverse" else f"1.0 / np.sqrt({squared})")
+            signs = ("", "-", "-", "-") if op == "inverse" else ("", "", "", "")
+            return [self._emit(f"{s}{p} * {scale}") for s, p in zip(signs, a[0])]
+        raise ValueError(f"Cannot lower operation {op}")
+
+class CompiledExpression:
+    """A fused NumPy evaluator for one or more expressions, built once and reused.
+
+    Call it with one keyword argument per symbol: complex and real inputs are arrays of any
+    broadcastable shape, quaternion inputs are (..., 4) arrays, QuaternionArrays or lists of
+    Quaternions; ComplexNumber and Quaternion objects are accepted as single values. The
+    inputs are evaluated in chunks of the leading axis so temporaries stay cache-sized.
+    """
+
+    def __init__(self, outputs, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Compiles the expressions.
+
+        Args:
+            outputs (Expression or sequence): The expressions to evaluate. ComplexNumber and
+                Quaternion objects whose fields are expressions are accepted too.
+            chunk_size (int): The number of leading-axis rows evaluated per kernel call.
+        """
+        self.single = not isinstance(outputs, (list, tuple))
+        self.outputs = tuple(_as_expression(o) for o in ((outputs,) if self.single else outputs))
+        self.chunk_size = chunk_size
+        order = _order(self.outputs)
+        symbols = sorted((n for n in order if n.op == "symbol"), key=lambda n: n.payload)
+        names = [s.payload for s in symbols]
+        if len(set(names)) != len(names):
+            raise ValueError("Two symbols of different kinds share a name")
+        self.inputs = {s.payload: s.kind for s in symbols}
+        self.node_count = len(order)
+
+        generator = _CodeGenerator()
+        for node in order:
+            parameter = f"in_{node.payload}" if node.op == "symbol" else None
+            generator.names[id(node)] = generator.lower(node, parameter)
+        results = [name for output in self.outputs for name in generator.names[id(output)]]
+        self.source = self._render(generator, names, results)
+        namespace = {"np": np, **generator.constants}
+        exec(compile(self.source, "<compiled expression>", "exec"), namespace)
+        self._kernel = namespace["kernel"]
+
+    @staticmethod
+    def _render(generator, names, results):
+        """Writes the kernel source, deleting every temporary after its last use."""
+        last_use = {}
+        for index, (_, expression) in enumerate(generator.lines):
+            for temporary in re.findall(r"\bt\d+\b", expression):
+                last_use[temporary] = index
+        keep = set(results)
+        body = []
+        for index, (target, expression) in enumerate(generator.lines):
+            body.append(f"    {target} = {expression}")
+            dead = sorted(t for t, last in last_use.items() if last == index and t not in keep)
+            if dead:
+                body.append(f"    del {', '.join(dead)}")
+        parameters = ", ".join(f"in_{name}" for name in names)
+        return "\n".join([f"def kernel({parameters}):"] + body + [f"    return ({', '.join(results)},)", ""])
+
+    def _prepare(self, name, kind, value):
+        if kind == QUATERNION:
+            if isinstance(value, Quaternion):
+                value = (value.w, value.x, value.y, value.z)
+            elif isinstance(value, QuaternionArray):
+                value = value.components
+            elif isinstance(value, (list, tuple)) and value and isinstance(value[0], Quaternion):
+                value = [(q.w, q.x, q.y, q.z) for q in value]
+            value = np.asarray(value, dtype=np.float64)
+            if value.ndim == 0 or value.shape[-1] != 4:
+                raise ValueError(f"Quaternion input {name!r} must have shape (..., 4)")
+            return value
+        if isinstance(value, ComplexNumber):
+            value = complex(value.rel, value.img)
+        return np.asarray(value, dtype=np.complex128 if kind == COMPLEX else np.float64)
+
+    def __call__(self, **inputs):
+        """
+        Evaluates the compiled expressions.
+
+        Returns:
+            np.ndarray or tuple: One array per output (a single array if compiled from one
+                expression): complex128 for complex, float64 for real, (..., 4) float64 for quaternions.
+
+        Raises:
+            ValueError: If an input is missing, unexpected or has the wrong shape.
+        """
+        missing = set(self.inputs) - set(inputs)
+        extra = set(inputs) - set(self.inputs)
+        if missing or extra:
+            raise ValueError(f"Expected inputs {sorted(self.inputs)}, got {sorted(inputs)}")
+        values = {name: self._prepare(name, kind, inputs[name]) for name, kind in self.inputs.items()}
+        batch = np.broadcast_shapes(*(v.shape[:-1] if self.inputs[n] == QUATERNION else v.shape
+                                      for n, v in values.items()))
+        arguments = [np.broadcast_to(values[name], batch + ((4,) if kind == QUATERNION else ()))
+                     for name, kind in self.inputs.items()]
+        results = []
+        for output in self.outputs:
+            dtype = np.complex128 if output.kind == COMPLEX else np.float64
+            results.append(np.empty(batch + ((4,) if output.kind == QUATERNION else ()), dtype=dtype))
+
+        rows = batch[0] if batch else 1
+        step = max(self.chunk_size, 1)
+        for start in range(0, rows, step):
+            index = slice(start, start + step) if batch else ()
+            parts = iter(self._kernel(*(a[index] for a in arguments)))
+            for output, result in zip(self.outputs, results):
+                if output.kind == QUATERNION:
+                    for k in range(4):
+                        result[(index, ..., k) if batch else k] = next(parts)
+                else:
+                    result[index] = next(parts)
+        return results[0] if self.single else tuple(results)
+
+def compile_expression(outputs, chunk_size: int = DEFAULT_CHUNK_SIZE) -> CompiledExpression:
+    """
+    Compiles expressions into a fused evaluator; see CompiledExpression.
+
+    Args:
+        outputs (Expression or sequence of Expression): The expressions to evaluate together.
+        chunk_size (int): The number of leading-axis rows evaluated per kernel call.
+
+    Returns:
+        CompiledExpression: The reusable evaluator.
+    """
+    return CompiledExpression(outputs, chunk_size)
+
+def trace(function, chunk_size: int = DEFAULT_CHUNK_SIZE, **kinds) -> CompiledExpression:
+    """
+    Traces a function written against ComplexNumber/Quaternion arithmetic and compiles it.
+
+    The function is called once with symbols in place of its arguments, for example
+    trace(lambda q, p: q * p * q.inverse(), q=QUATERNION, p=QUATERNION).
+
+    Args:
+        function (callable): The function to trace; it may return one value or a tuple.
+        chunk_size (int): See compile_expression.
+        **kinds: The kind (REAL, COMPLEX or QUATERNION) of every argument, by name.
+
+    Returns:
+        CompiledExpression: The evaluator, taking the same argument names as keywords.
+    """
+    return CompiledExpression(function(**{name: symbol(name, kind) for name, kind in kinds.items()}), chunk_size)
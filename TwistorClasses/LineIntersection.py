@@ -0,0 +1,402 @@
+from fractions import Fraction
+import numpy as np
+from TwistorClasses.Parallel import executor_scope, partition
+
+DEFAULT_TOLERANCE = 1e-10
+DEFAULT_TILE_SIZE = 1024
+PRECISIONS = ("float64", "float32", "exact", "mixed")
+
+# Safety factor applied to the first-order rounding error bound of a screened incidence
+# (see _screen_coordinates).
+_SCREEN_SAFETY = 32.0
+
+# Pairs of homogeneous indices (w=0, x=1, y=2, z=3) forming the six Plücker coordinates
+_PLUCKER_PAIRS = ((0, 1), (0, 2), (0, 3), (2, 3), (3, 1), (1, 2))
+# Permutation taking Plücker coordinates to their duals, so that lines meet iff p . dual(q) = 0
+_DUAL = [3, 4, 5, 0, 1, 2]
+
+def _checked_endpoints(endpoints, dtype=np.complex128) -> np.ndarray:
+    endpoints = np.asarray(endpoints, dtype=dtype)
+    if endpoints.ndim != 3 or endpoints.shape[1:] != (2, 4):
+        raise ValueError("Line endpoints must be an (N, 2, 4) array")
+    return endpoints
+
+def _raw_plucker(endpoints) -> np.ndarray:
+    """Returns the unnormalized (N, 6) Plücker coordinates a_i b_j - a_j b_i, in the endpoints' dtype."""
+    a, b = endpoints[:, 0], endpoints[:, 1]
+    return np.stack([a[:, i] * b[:, j] - a[:, j] * b[:, i] for i, j in _PLUCKER_PAIRS], axis=1)
+
+def plucker_coordinates(endpoints, dtype=np.complex128) -> tuple:
+    """
+    Computes unit-norm Plücker coordinates of lines given by two homogeneous endpoints.
+
+    Each row is scaled to unit length and rotated to a canonical complex phase (largest
+    component real and positive), so equal lines map to equal rows.
+
+    Args:
+        endpoints (array-like): An (N, 2, 4) complex array of (w, x, y, z) endpoint coordinates.
+        dtype (np.dtype): The complex dtype to compute in, complex128 or complex64.
+
+    Returns:
+        tuple: (coords, valid) where coords is the (N, 6) array of the given dtype and valid
+            marks non-degenerate lines (distinct endpoints). Degenerate rows are zero.
+    """
+    coords = _raw_plucker(_checked_endpoints(endpoints, dtype))
+    norms = np.linalg.norm(coords, axis=1)
+    valid = norms > 0
+    largest = coords[np.arange(len(coords)), np.argmax(np.abs(coords), axis=1)]
+    scale = np.zeros(len(coords), dtype=dtype)
+    scale[valid] = np.conj(largest[valid]) / (np.abs(largest[valid]) * norms[valid])
+    return coords * scale[:, None], valid
+
+def _screen_coordinates(endpoints, dtype=np.complex64) -> tuple:
+    """
+    Computes Plücker coordinates in a given precision together with a bound on their rounding error.
+
+    Each endpoint is first scaled by its largest component, which leaves the line unchanged
+    and keeps float32 from overflowing. Rounding perturbs a coordinate by a few units of
+    roundoff times |a||b|, so after normalization by |p| the error of an incidence
+    p . dual(q) is bounded to first order by a small multiple of the roundoff times
+    kappa_p + kappa_q + 1, with kappa = |a||b| / |p| the conditioning of each line.
+
+    Args:
+        endpoints (array-like): An (N, 2, 4) array of line endpoints.
+        dtype (np.dtype): complex64 or complex128.
+
+    Returns:
+        tuple: (coords, margins, finite) where coords is the (N, 6) array of the given dtype,
+            margins the float64 per-line error contribution (inf where the precision cannot
+            tell whether the line is degenerate) and finite marks lines with finite endpoints.
+    """
+    endpoints = _checked_endpoints(endpoints)
+    finite = np.isfinite(endpoints).all(axis=(1, 2))
+    scale = np.abs(endpoints).max(axis=2, keepdims=True)
+    scale[(scale == 0) | ~finite[:, None, None]] = 1.0
+    scaled = np.where(finite[:, None, None], endpoints / scale, 0).astype(dtype)
+    norms = np.linalg.norm(_raw_plucker(scaled), axis=1).astype(np.float64)
+    endpoint_norms = np.linalg.norm(scaled, axis=2).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa = endpoint_norms[:, 0] * endpoint_norms[:, 1] / norms
+    roundoff = float(np.finfo(dtype).eps) / 2
+    margins = np.where(finite & (norms > 0), _SCREEN_SAFETY * roundoff * (2 * kappa + 1), np.inf)
+    coords, _ = plucker_coordinates(scaled, dtype=dtype)
+    return coords, margins, finite
+
+def _screen_pairs(endpoints_a, endpoints_b, tolerance, dtype) -> tuple:
+    """
+    Classifies pairs of lines with one screened pass.
+
+    Returns:
+        tuple: (meets, ambiguous) bool arrays; pairs in neither certainly do not meet.
+    """
+    p, p_margins, p_finite = _screen_coordinates(endpoints_a, dtype)
+    q, q_margins, q_finite = _screen_coordinates(endpoints_b, dtype)
+    incidence = np.abs((p * q[:, _DUAL]).sum(axis=1)).astype(np.float64)
+    margins = p_margins + q_margins
+    meets = incidence + margins <= tolerance
+    ambiguous = ~meets & (incidence - margins <= tolerance) & p_finite & q_finite
+    return meets, ambiguous
+
+def _refine(endpoints_a, endpoints_b, tolerance, dtypes) -> tuple:
+    """
+    Decides pairs of lines through screened passes in each of dtypes, evaluating whatever
+    is still ambiguous after the last one with exact_lines_meet.
+
+    Returns:
+        tuple: (meets, refined) where refined holds the indices evaluated exactly.
+    """
+    meets = np.zeros(len(endpoints_a), dtype=bool)
+    pending = np.arange(len(endpoints_a))
+    for dtype in dtypes:
+        decided, ambiguous = _screen_pairs(endpoints_a[pending], endpoints_b[pending], tolerance, dtype)
+        meets[pending[decided]] = True
+        pending = pending[ambiguous]
+    meets[pending] = exact_lines_meet(endpoints_a[pending], endpoints_b[pending], tolerance)
+    return meets, pending
+
+def _integer_endpoint(point) -> list:
+    """Writes four finite complex floats exactly as (re, im) integers sharing one power-of-two scale."""
+    ratios = [part.as_integer_ratio() for c in point for part in (float(c.real), float(c.imag))]
+    denominator = max(d for _, d in ratios)
+    parts = [n * (denominator // d) for n, d in ratios]
+    return list(zip(parts[0::2], parts[1::2]))
+
+def _exact_meets(line_a, line_b, tolerance_squared: Fraction) -> bool:
+    """Decides |p . dual(q)| <= tolerance |p| |q| exactly, in integer arithmetic."""
+    (a, b), (c, d) = ([_integer_endpoint(point) for point in line] for line in (line_a, line_b))
+
+    def plucker(u, v):
+        coords = []
+        for i, j in _PLUCKER_PAIRS:
+            (ar, ai), (br, bi), (cr, ci), (dr, di) = u[i], v[j], u[j], v[i]
+            coords.append((ar * br - ai * bi - (cr * dr - ci * di), ar * bi + ai * br - (cr * di + ci * dr)))
+        return coords
+
+    p, q = plucker(a, b), plucker(c, d)
+    p_norm = sum(re * re + im * im for re, im in p)
+    q_norm = sum(re * re + im * im for re, im in q)
+    if p_norm == 0 or q_norm == 0:
+        return False
+    dual = [q[k] for k in _DUAL]
+    re = sum(pr * qr - pi * qi for (pr, pi), (qr, qi) in zip(p, dual))
+    im = sum(pr * qi + pi * qr for (pr, pi), (qr, qi) in zip(p, dual))
+    return (re * re + im * im) * tolerance_squared.denominator <= tolerance_squared.numerator * p_norm * q_norm
+
+def exact_lines_meet(endpoints_a, endpoints_b, tolerance: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """
+    Tests pairs of lines for intersection exactly, row by row.
+
+    Every float is converted to an integer without rounding, so the normalized incidence is
+    compared with the tolerance exactly. This is slow, and meant for the few pairs a float
+    pass cannot decide.
+
+    Args:
+        endpoints_a (array-like): A (K, 2, 4) array of first-line endpoints.
+        endpoints_b (array-like): A (K, 2, 4) array of second-line endpoints.
+        tolerance (float): Pairs whose normalized incidence is at most this value meet.
+
+    Returns:
+        np.ndarray: A (K,) bool array. Degenerate or non-finite lines never meet.
+    """
+    endpoints_a, endpoints_b = _checked_endpoints(endpoints_a), _checked_endpoints(endpoints_b)
+    if len(endpoints_a) != len(endpoints_b):
+        raise ValueError("Both endpoint arrays must hold the same number of lines")
+    finite = np.isfinite(endpoints_a).all(axis=(1, 2)) & np.isfinite(endpoints_b).all(axis=(1, 2))
+    tolerance_squared = Fraction(tolerance) ** 2
+    return np.array([bool(ok) and _exact_meets(a, b, tolerance_squared)
+                     for a, b, ok in zip(endpoints_a.tolist(), endpoints_b.tolist(), finite)], dtype=bool)
+
+def lines_meet(endpoints_a, endpoints_b, tolerance: float = DEFAULT_TOLERANCE, precision: str = "mixed",
+               return_refined: bool = False):
+    """
+    Tests pairs of lines for intersection, row by row, with a selectable numeric backend.
+
+    Precisions:
+        - "float64": normalized Plücker incidence in double precision.
+        - "float32": the same in single precision; fastest, but unreliable near the tolerance.
+        - "exact": exact_lines_meet for every pair.
+        - "mixed": a float32 pass with a rounding-error bound per pair. Pairs whose incidence
+          is clearly inside or outside the tolerance band are decided there; the ambiguous
+          ones are re-screened in float64 and only those still ambiguous are evaluated
+          exactly, so results match "exact".
+
+    Args:
+        endpoints_a (array-like): A (K, 2, 4) array of first-line endpoints.
+        endpoints_b (array-like): A (K, 2, 4) array of second-line endpoints.
+        tolerance (float): Pairs whose normalized incidence is at most this value meet.
+        precision (str): One of PRECISIONS.
+        return_refined (bool): If True, also returns the indices of the pairs evaluated exactly
+            ("mixed" only).
+
+    Returns:
+        np.ndarray or tuple: A (K,) bool array; with return_refined, also the refined indices.
+
+    Raises:
+        ValueError: If the shapes disagree or the precision is unknown.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}")
+    endpoints_a, endpoints_b = _checked_endpoints(endpoints_a), _checked_endpoints(endpoints_b)
+    if len(endpoints_a) != len(endpoints_b):
+        raise ValueError("Both endpoint arrays must hold the same number of lines")
+    refined = np.empty(0, dtype=np.intp)
+    if precision == "exact":
+        meets = exact_lines_meet(endpoints_a, endpoints_b, tolerance)
+    elif precision == "mixed":
+        meets, refined = _refine(endpoints_a, endpoints_b, tolerance, (np.complex64, np.complex128))
+    elif precision == "float32":
+        p, p_margins, _ = _screen_coordinates(endpoints_a)
+        q, q_margins, _ = _screen_coordinates(endpoints_b)
+        valid = np.isfinite(p_margins) & np.isfinite(q_margins)
+        meets = (np.abs((p * q[:, _DUAL]).sum(axis=1)) <= tolerance) & valid
+    else:
+        p, p_valid = plucker_coordinates(endpoints_a)
+        q, q_valid = plucker_coordinates(endpoints_b)
+        meets = (np.abs((p * q[:, _DUAL]).sum(axis=1)) <= tolerance) & p_valid & q_valid
+    if return_refined:
+        return meets, refined
+    return meets
+
+def incidence(endpoints_a, endpoints_b) -> np.ndarray:
+    """
+    Computes the normalized incidence |p . dual(q)| of every pair of lines.
+
+    The value is zero exactly when the lines meet and at most one otherwise.
+
+    Args:
+        endpoints_a (array-like): An (N, 2, 4) array of line endpoints.
+        endpoints_b (array-like): An (M, 2, 4) array of line endpoints.
+
+    Returns:
+        np.ndarray: An (N, M) float64 array.
+    """
+    p, _ = plucker_coordinates(endpoints_a)
+    q, _ = plucker_coordinates(endpoints_b)
+    return np.abs(p @ q[:, _DUAL].T)
+
+def _spatial_order(coords, cell_size) -> np.ndarray:
+    """Orders lines by a grid hash of their Plücker coordinates so that tiles stay compact."""
+    cells = np.floor(np.ascontiguousarray(coords).view(coords.real.dtype) / cell_size).astype(np.int64)
+    return np.lexsort(cells.T[::-1])
+
+def _tile_bounds(coords, tiles):
+    """Returns the bounding-ball centre, radius and centre norm of each tile."""
+    centres = np.array([coords[s:e].mean(axis=0) for s, e in tiles]).reshape(-1, 6)
+    radii = np.array([np.linalg.norm(coords[s:e] - centres[k], axis=1).max() for k, (s, e) in enumerate(tiles)])
+    return centres, radii, np.linalg.norm(centres, axis=1)
+
+def intersection_points(endpoints_a, endpoints_b) -> np.ndarray:
+    """
+    Computes the meeting point of each pair of lines, row by row.
+
+    The point is the null vector of the 4x4 matrix [a1, b1, a2, b2], mapped back onto the
+    first line. For lines that do not meet it is the best least-squares compromise.
+
+    Args:
+        endpoints_a (array-like): A (K, 2, 4) array of first-line endpoints.
+        endpoints_b (array-like): A (K, 2, 4) array of second-line endpoints.
+
+    Returns:
+        np.ndarray: A (K, 4) complex128 array of homogeneous (w, x, y, z) coordinates.
+    """
+    endpoints_a = np.asarray(endpoints_a, dtype=np.complex128)
+    endpoints_b = np.asarray(endpoints_b, dtype=np.complex128)
+    if len(endpoints_a) == 0:
+        return np.empty((0, 4), dtype=np.complex128)
+    system = np.stack((endpoints_a[:, 0], endpoints_a[:, 1], endpoints_b[:, 0], endpoints_b[:, 1]), axis=-1)
+    null = np.conj(np.linalg.svd(system)[2][:, -1, :])
+    return null[:, :1] * endpoints_a[:, 0] + null[:, 1:2] * endpoints_a[:, 1]
+
+def _intersection_kernel(start, stop, rows, cols, rows_valid, cols_valid, row_order, col_order,
+                         candidate, same, tile_size, tolerance, row_margins=None, col_margins=None):
+    """
+    Tests row tiles start..stop against every candidate column tile and returns the (i, j) hits.
+
+    With margins, the tolerance of each tile is widened by the largest rounding error bound
+    of its rows and columns, so a float32 pass reports every pair that may meet.
+    """
+    found_i, found_j = [], []
+    for a in range(start, stop):
+        r0, r1 = a * tile_size, min((a + 1) * tile_size, len(rows))
+        for b in np.flatnonzero(candidate[a]):
+            if same and b < a:
+                continue
+            c0, c1 = b * tile_size, min((b + 1) * tile_size, len(cols))
+            limit = tolerance
+            if row_margins is not None:
+                limit += row_margins[r0:r1].max() + col_margins[c0:c1].max()
+            hits = np.abs(rows[r0:r1] @ cols[c0:c1].T) <= limit
+            hits &= rows_valid[r0:r1, None] & cols_valid[None, c0:c1]
+            i, j = np.nonzero(hits)
+            i, j = row_order[i + r0], col_order[j + c0]
+            if same:
+                keep = i != j
+                i, j = np.minimum(i[keep], j[keep]), np.maximum(i[keep], j[keep])
+            found_i.append(i)
+            found_j.append(j)
+    return found_i, found_j
+
+def _refine_pairs(pairs, endpoints, other, row_unknown, col_unknown, same, tolerance) -> np.ndarray:
+    """Adds every pair involving a line float32 could not screen, then keeps the pairs that meet."""
+    extra = [np.stack(np.meshgrid(row_unknown, np.arange(len(other)), indexing="ij"), axis=-1).reshape(-1, 2),
+             np.stack(np.meshgrid(np.arange(len(endpoints)), col_unknown, indexing="ij"), axis=-1).reshape(-1, 2)]
+    pairs = np.concatenate([pairs.astype(np.intp)] + [e.astype(np.intp) for e in extra])
+    if same:
+        pairs = np.sort(pairs[pairs[:, 0] != pairs[:, 1]], axis=1)
+    pairs = np.unique(pairs, axis=0)
+    return pairs[_refine(endpoints[pairs[:, 0]], other[pairs[:, 1]], tolerance, (np.complex128,))[0]]
+
+def find_intersections(endpoints, other=None, tolerance: float = DEFAULT_TOLERANCE,
+                       tile_size: int = DEFAULT_TILE_SIZE, broad_phase: bool = True,
+                       return_points: bool = False, executor=None, precision: str = "float64"):
+    """
+    Finds every pair of lines that meet, testing tiles of pairs at a time.
+
+    Two lines in projective 3-space meet exactly when their four endpoints are coplanar,
+    i.e. when the Plücker incidence of the pair vanishes. Each tile of pairs is one matrix
+    product. With broad_phase, lines are first sorted by a grid hash of their Plücker
+    coordinates and every tile gets a bounding ball; tile pairs whose balls cannot come
+    within tolerance are skipped without being evaluated.
+
+    Args:
+        endpoints (array-like): An (N, 2, 4) complex array of (w, x, y, z) endpoints, e.g. from lines_to_array.
+        other (array-like): Optional (M, 2, 4) endpoints. If omitted, pairs are taken within endpoints.
+        tolerance (float): Pairs whose normalized incidence is at most this value are reported.
+        tile_size (int): The number of lines per tile.
+        broad_phase (bool): If True, skips tile pairs that provably contain no intersections.
+        return_points (bool): If True, also returns the intersection point of each pair.
+        executor: A backend accepted by Parallel.get_executor; row tiles are split across its workers.
+        precision (str): "float64", or "mixed" to test tiles in float32 and decide the pairs
+            float32 cannot rule out as lines_meet(precision="mixed") does. "mixed" returns
+            exactly the pairs within tolerance.
+
+    Returns:
+        np.ndarray or tuple: A (K, 2) array of (i, j) index pairs sorted lexicographically, with
+            i < j when other is omitted; with return_points, also a (K, 4) array of points.
+            Degenerate lines (coincident endpoints) are never reported.
+    """
+    if tile_size <= 0:
+        raise ValueError("tile_size must be positive")
+    if precision not in ("float64", "mixed"):
+        raise ValueError(f"Unknown precision: {precision}")
+    endpoints = np.asarray(endpoints, dtype=np.complex128)
+    same = other is None
+    other = endpoints if same else np.asarray(other, dtype=np.complex128)
+    mixed = precision == "mixed"
+    if mixed:
+        rows, row_margins, rows_valid = _screen_coordinates(endpoints)
+        cols, col_margins, cols_valid = (rows, row_margins, rows_valid) if same else _screen_coordinates(other)
+        # Lines float32 cannot even tell apart from degenerate ones are tested exactly below.
+        row_unknown = np.flatnonzero(rows_valid & np.isinf(row_margins))
+        col_unknown = row_unknown if same else np.flatnonzero(cols_valid & np.isinf(col_margins))
+        rows_valid = rows_valid & np.isfinite(row_margins)
+        cols_valid = cols_valid & np.isfinite(col_margins)
+        row_margins = np.where(rows_valid, row_margins, 0.0)
+        col_margins = row_margins if same else np.where(cols_valid, col_margins, 0.0)
+        wide_tolerance = tolerance + row_margins[rows_valid].max(initial=0) + col_margins[cols_valid].max(initial=0)
+    else:
+        rows, rows_valid = plucker_coordinates(endpoints)
+        cols, cols_valid = (rows, rows_valid) if same else plucker_coordinates(other)
+        wide_tolerance = tolerance
+    cols = cols[:, _DUAL]
+
+    if broad_phase:
+        cell_size = max(4.0 * wide_tolerance, 0.25)
+        row_order = _spatial_order(rows, cell_size)
+        col_order = row_order if same else _spatial_order(cols, cell_size)
+    else:
+        row_order = np.arange(len(rows))
+        col_order = np.arange(len(cols))
+    rows, rows_valid = rows[row_order], rows_valid[row_order]
+    cols, cols_valid = cols[col_order], cols_valid[col_order]
+    margins = (row_margins[row_order], col_margins[col_order]) if mixed else (None, None)
+
+    row_tiles = [(s, min(s + tile_size, len(rows))) for s in range(0, len(rows), tile_size)]
+    col_tiles = [(s, min(s + tile_size, len(cols))) for s in range(0, len(cols), tile_size)]
+    if broad_phase and row_tiles and col_tiles:
+        # Bounds are taken in float64 even for float32 tiles so they add no rounding of their own.
+        row_c, row_r, row_n = _tile_bounds(rows.astype(np.complex128), row_tiles)
+        col_c, col_r, col_n = _tile_bounds(cols.astype(np.complex128), col_tiles)
+        lower = (np.abs(row_c @ col_c.T) - row_r[:, None] * col_n[None, :]
+                 - row_n[:, None] * col_r[None, :] - row_r[:, None] * col_r[None, :])
+        candidate = lower <= wide_tolerance
+    else:
+        candidate = np.ones((len(row_tiles), len(col_tiles)), dtype=bool)
+
+    found_i, found_j = [], []
+    inputs = (rows, cols, rows_valid, cols_valid, row_order, col_order, candidate, same, tile_size, tolerance, *margins)
+    with executor_scope(executor) as backend:
+        for block_i, block_j in backend.map_blocks(_intersection_kernel, partition(len(row_tiles), parts=backend.workers), inputs):
+            found_i.extend(block_i)
+            found_j.extend(block_j)
+
+    pairs = np.stack((np.concatenate(found_i), np.concatenate(found_j)), axis=1) if found_i else np.empty((0, 2), dtype=np.intp)
+    if mixed:
+        pairs = _refine_pairs(pairs, endpoints, other, row_unknown, col_unknown, same, tolerance)
+    if same and len(pairs):
+        pairs = np.unique(pairs, axis=0)
+    elif len(pairs):
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    if return_points:
+        return pairs, intersection_points(endpoints[pairs[:, 0]], other[pairs[:, 1]])
+    return pairs
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, Twistor, twistor_mapping
+
+class LRUCache:
+    """A size-bounded least-recently-used cache with hit, miss and eviction counters."""
+
+    def __init__(self, maxsize: int):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept; 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, factory):
+        """
+        Returns the cached value for key, computing and storing factory() on a miss.
+
+        Args:
+            key: A hashable key.
+            factory (callable): Computes the value when the key is missing.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        entries = self._entries
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.misses += 1
+        value = factory()
+        if self.maxsize:
+            entries[key] = value
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, size, maxsize and hit_rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+def point_key(point) -> tuple:
+    """Returns the cache key of a ComplexMinkowskiPoint or (t, x, y, z) tuple: its eight matrix entries.
+
+    A tuple is keyed through the matrix of ComplexMinkowskiPoint(*point), so it shares its
+    key with the point built from it.
+    """
+    if not isinstance(point, ComplexMinkowskiPoint):
+        point = ComplexMinkowskiPoint(*point)
+    m = point.matrix
+    return (m[0][0].rel, m[0][0].img, m[0][1].rel, m[0][1].img, m[1][0].rel, m[1][0].img, m[1][1].rel, m[1][1].img)
+
+def spinor_key(spinor: Spinor) -> tuple:
+    """Returns the cache key of a Spinor's components."""
+    c0, c1 = spinor.components
+    return (c0.rel, c0.img, c1.rel, c1.img)
+
+def _point_from_key(key: tuple) -> ComplexMinkowskiPoint:
+    """Builds a new ComplexMinkowskiPoint from the eight matrix entries returned by point_key."""
+    point = ComplexMinkowskiPoint.__new__(ComplexMinkowskiPoint)
+    point.matrix = (
+        (ComplexNumber(key[0], key[1]), ComplexNumber(key[2], key[3])),
+        (ComplexNumber(key[4], key[5]), ComplexNumber(key[6], key[7]))
+    )
+    return point
+
+class MappingCache:
+    """An opt-in cache of Minkowski matrices and twistor mapping results.
+
+    Pass an instance as twistor_mapping(point, spinor, cache=...) or call its methods
+    directly. Entries are stored as plain floats and every call returns new objects, so
+    updating a result in place (e.g. with *=) affects neither the cache nor other callers.
+    """
+
+    def __init__(self, max_points: int = 4096, max_twistors: int = 65536):
+        """Initializes the cache.
+
+        Args:
+            max_points (int): The maximum number of Minkowski matrices kept.
+            max_twistors (int): The maximum number of (point, spinor) twistor results kept.
+        """
+        self.points = LRUCache(max_points)
+        self.twistors = LRUCache(max_twistors)
+
+    def minkowski_point(self, t: float, x: float, y: float, z: float) -> ComplexMinkowskiPoint:
+        """
+        Returns the ComplexMinkowskiPoint for (t, x, y, z), computing its matrix only on a miss.
+
+        Returns:
+            ComplexMinkowskiPoint: A new point built from the cached matrix entries.
+        """
+        return _point_from_key(self._matrix_key((t, x, y, z)))
+
+    def _matrix_key(self, coordinates: tuple) -> tuple:
+        """Returns the cached point_key of (t, x, y, z)."""
+        return self.points.get(coordinates, lambda: point_key(ComplexMinkowskiPoint(*coordinates)))
+
+    def twistor_mapping(self, point, lambda_spinor: Spinor) -> Twistor:
+        """
+        Returns twistor_mapping(point, lambda_spinor), reusing earlier results.
+
+        Results are keyed by the point's matrix, so a tuple and the ComplexMinkowskiPoint
+        built from it share one entry; the matrix of a tuple is cached as well.
+
+        Args:
+            point: A ComplexMinkowskiPoint or a (t, x, y, z) tuple.
+            lambda_spinor (Spinor): The spinor representing λα.
+
+        Returns:
+            Twistor: A new twistor whose mu is built from the cached components and whose
+                lambda_ is lambda_spinor, as returned by twistor_mapping.
+        """
+        if isinstance(point, ComplexMinkowskiPoint):
+            key = point_key(point)
+        else:
+            key = self._matrix_key(tuple(point))
+
+        def compute():
+            source = point if isinstance(point, ComplexMinkowskiPoint) else _point_from_key(key)
+            mu0, mu1 = twistor_mapping(source, lambda_spinor).mu.components
+            return (mu0.rel, mu0.img, mu1.rel, mu1.img)
+
+        mu = self.twistors.get((key, spinor_key(lambda_spinor)), compute)
+        return Twistor(mu=Spinor(ComplexNumber(mu[0], mu[1]), ComplexNumber(mu[2], mu[3])), lambda_=lambda_spinor)
+
+    def stats(self) -> dict:
+        """Returns the statistics of both caches as {"points": {...}, "twistors": {...}}."""
+        return {"points": self.points.stats(), "twistors": self.twistors.stats()}
+
+    def clear(self):
+        """Empties both caches."""
+        self.points.clear()
+        self.twistors.clear()
@@ -0,0 +1,93 @@
+from functools import lru_cache
+import numpy as np
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch, iter_twistor_mapping_batch
+from TwistorClasses.InverseMapping import minkowski_coordinates
+
+@lru_cache(maxsize=32)
+def null_direction_grid(resolution: int) -> np.ndarray:
+    """
+    Samples the CP¹ of null directions as unit spinors spread evenly over the Riemann sphere.
+
+    The directions lie on a Fibonacci sphere of the given size; direction (θ, φ) maps to
+    λ = (cos(θ/2), e^{iφ} sin(θ/2)). Results are cached per resolution and read-only.
+
+    Args:
+        resolution (int): The number of null directions.
+
+    Returns:
+        np.ndarray: An (M, 2) complex128 array of λ spinors.
+    """
+    if resolution <= 0:
+        raise ValueError("resolution must be positive")
+    k = np.arange(resolution) + 0.5
+    theta = np.arccos(1.0 - 2.0 * k / resolution)
+    phi = np.pi * (1.0 + 5**0.5) * k
+    spinors = np.empty((resolution, 2), dtype=np.complex128)
+    spinors[:, 0] = np.cos(theta / 2)
+    spinors[:, 1] = np.exp(1j * phi) * np.sin(theta / 2)
+    spinors.flags.writeable = False
+    return spinors
+
+def null_vectors(spinors) -> np.ndarray:
+    """
+    Converts λ spinors into the real null vectors (t, x, y, z) of the matrices λλ†.
+
+    Args:
+        spinors (array-like): An (M, 2) complex array of λ spinors.
+
+    Returns:
+        np.ndarray: An (M, 4) float64 array with t² = x² + y² + z².
+    """
+    spinors = np.asarray(spinors, dtype=np.complex128)
+    outer = spinors[:, :, None] * np.conj(spinors[:, None, :])
+    return minkowski_coordinates(outer).real
+
+def _as_coordinates(points) -> np.ndarray:
+    """Accepts an (N, 4) array or a list of ComplexMinkowskiPoints and returns (N, 4) real coordinates."""
+    if len(points) and isinstance(points[0], ComplexMinkowskiPoint):
+        matrices = np.array([[[complex(e.rel, e.img) for e in row] for row in p.matrix] for p in points],
+                            dtype=np.complex128)
+        return minkowski_coordinates(matrices).real
+    return np.asarray(points, dtype=np.float64).reshape(-1, 4)
+
+class LightConeSampler:
+    """Generates the twistor line of every spacetime point over a fixed grid of null directions."""
+
+    def __init__(self, resolution: int):
+        """Initializes the sampler and its cached spinor grid.
+
+        Args:
+            resolution (int): The number of null directions per twistor line.
+        """
+        self.resolution = resolution
+        self.spinors = null_direction_grid(resolution)
+
+    def null_vectors(self) -> np.ndarray:
+        """Returns the (M, 4) null vectors of the sampler's directions."""
+        return null_vectors(self.spinors)
+
+    def twistor_lines(self, points) -> np.ndarray:
+        """
+        Computes the sampled twistor line of every point in one array.
+
+        Args:
+            points: An (N, 4) array of (t, x, y, z) coordinates or a list of ComplexMinkowskiPoints.
+
+        Returns:
+            np.ndarray: An (N, M, 4) complex128 array; row i is the twistor line of point i.
+        """
+        return twistor_mapping_batch(_as_coordinates(points), self.spinors)
+
+    def iter_twistor_lines(self, points, chunk_size: int):
+        """
+        Lazily yields twistor lines for chunks of points when the full set does not fit in memory.
+
+        Args:
+            points: An (N, 4) array of (t, x, y, z) coordinates or a list of ComplexMinkowskiPoints.
+            chunk_size (int): The number of points per chunk.
+
+        Yields:
+            tuple: (start, block) where block is the (chunk, M, 4) twistor array of points[start:start + chunk].
+        """
+        yield from iter_twistor_mapping_batch(_as_coordinates(points), self.spinors, chunk_size)
@@ -0,0 +1,277 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import os
+import numpy as np
+
+def partition(count: int, block_size: int = None, parts: int = None) -> list:
+    """
+    Splits range(count) into contiguous (start, stop) blocks.
+
+    Args:
+        count (int): The number of rows to split.
+        block_size (int): The rows per block. Takes precedence over parts.
+        parts (int): The number of blocks wanted when block_size is not given.
+
+    Returns:
+        list of tuple: The (start, stop) blocks in order.
+    """
+    if block_size is None:
+        block_size = -(-count // max(parts or 1, 1))
+    block_size = max(block_size, 1)
+    return [(start, min(start + block_size, count)) for start in range(0, count, block_size)]
+
+def _regions(blocks, regions):
+    return [(slice(start, stop),) for start, stop in blocks] if regions is None else regions
+
+class SerialExecutor:
+    """Runs every block in the calling thread; the reference backend."""
+
+    workers = 1
+
+    def run(self, kernel, blocks, inputs, out, regions=None):
+        """
+        Calls kernel(start, stop, *inputs, out[region]) for every block.
+
+        Each call writes only the part of out belonging to its block, which it receives as its
+        own array, so backends are free to hand it a temporary copy of that part instead.
+
+        Args:
+            kernel (callable): A module-level function writing its block's results into the
+                array it is given.
+            blocks (list of tuple): The (start, stop) blocks.
+            inputs (tuple): Arrays and plain values passed to every call.
+            out (np.ndarray): The result array, e.g. a memory map.
+            regions (list of tuple): The index of out written by each block; defaults to
+                rows start:stop.
+
+        Returns:
+            np.ndarray: out.
+        """
+        for (start, stop), region in zip(blocks, _regions(blocks, regions)):
+            kernel(start, stop, *inputs, out[region])
+        return out
+
+    def map_blocks(self, kernel, blocks, inputs) -> list:
+        """
+        Calls kernel(start, stop, *inputs) for every block and returns the results in block order.
+
+        Use this for variable-sized results, e.g. sparse index pairs.
+        """
+        return [kernel(start, stop, *inputs) for start, stop in blocks]
+
+    def close(self):
+        """Releases the backend's workers (nothing to do for the serial backend)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class ThreadExecutor(SerialExecutor):
+    """Runs blocks on a thread pool. NumPy kernels release the GIL, so threads scale for array work."""
+
+    def __init__(self, workers: int = None):
+        """Initializes the backend.
+
+        Args:
+            workers (int): The number of threads; defaults to the number of CPUs.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def run(self, kernel, blocks, inputs, out, regions=None):
+        futures = [self._get_pool().submit(kernel, start, stop, *inputs, out[region])
+                   for (start, stop), region in zip(blocks, _regions(blocks, regions))]
+        for future in futures:
+            future.result()
+        return out
+
+    def map_blocks(self, kernel, blocks, inputs) -> list:
+        futures = [self._get_pool().submit(kernel, start, stop, *inputs) for start, stop in blocks]
+        return [future.result() for future in futures]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+def _share(array, segments):
+    """Copies an array into a new shared-memory segment and returns its picklable description and view."""
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    segments.append(segment)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+    view[...] = array
+    return ("shared", segment.name, array.shape, array.dtype.str), view
+
+def _attach(spec, attached):
+    """Turns a description from _share back into an array view inside a worker."""
+    if not (isinstance(spec, tuple) and len(spec) == 4 and spec[0] == "shared"):
+        return spec
+    _, name, shape, dtype = spec
+    segment = shared_memory.SharedMemory(name=name)
+    attached.append(segment)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+
+def _run_shared(kernel, start, stop, specs, out_spec=None):
+    """Worker entry point: attaches to the shared arrays, runs one block and detaches."""
+    attached = []
+    inputs = []
+    try:
+        inputs = [_attach(spec, attached) for spec in specs]
+        if out_spec is None:
+            return kernel(start, stop, *inputs)
+        kernel(start, stop, *inputs, _attach(out_spec, attached))
+    finally:
+        del inputs
+        for segment in attached:
+            segment.close()
+
+class ProcessExecutor(SerialExecutor):
+    """Runs blocks on a process pool, exchanging arrays through shared memory instead of pickling them.
+
+    Array inputs are copied once into shared-memory segments; workers attach to them by name,
+    so only block bounds and segment names cross process boundaries. Each block writes its
+    results into a segment of its own, which is copied into its region of out as soon as the
+    block finishes. At most two blocks per worker are in flight, so with a memory-mapped out
+    the resident result stays bounded by the block size. Kernels must be module-level functions.
+    """
+
+    def __init__(self, workers: int = None):
+        """Initializes the backend.
+
+        Args:
+            workers (int): The number of processes; defaults to the number of CPUs.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _submit(self, kernel, blocks, inputs):
+        segments = []
+        views = []
+        try:
+            specs = [self._share_input(x, segments, views) for x in inputs]
+            futures = [self._get_pool().submit(_run_shared, kernel, start, stop, specs) for start, stop in blocks]
+            return [future.result() for future in futures]
+        finally:
+            views.clear()
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    def _run_block(self, kernel, start, stop, specs, out, region, pending):
+        """Submits one block with its own output segment, initialized from out[region]."""
+        segments = []
+        spec, view = _share(np.ascontiguousarray(out[region]), segments)
+        future = self._get_pool().submit(_run_shared, kernel, start, stop, specs, spec)
+        pending[future] = (region, view, segments[0])
+
+    @staticmethod
+    def _finish_block(future, out, pending):
+        region, view, segment = pending.pop(future)
+        try:
+            future.result()
+            out[region] = view
+        finally:
+            del view
+            segment.close()
+            segment.unlink()
+
+    @staticmethod
+    def _share_input(value, segments, views):
+        """Moves arrays into shared memory; other values are passed through unchanged."""
+        if not isinstance(value, np.ndarray):
+            return value
+        spec, view = _share(np.ascontiguousarray(value), segments)
+        views.append(view)
+        return spec
+
+    def run(self, kernel, blocks, inputs, out, regions=None):
+        segments = []
+        views = []
+        pending = {}
+        try:
+            specs = [self._share_input(x, segments, views) for x in inputs]
+            for (start, stop), region in zip(blocks, _regions(blocks, regions)):
+                if len(pending) >= 2 * self.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._finish_block(future, out, pending)
+                self._run_block(kernel, start, stop, specs, out, region, pending)
+            while pending:
+                self._finish_block(next(iter(pending)), out, pending)
+            return out
+        finally:
+            for future in list(pending):
+                future.cancel()
+                try:
+                    self._finish_block(future, out, pending)
+                except BaseException:
+                    pass
+            views.clear()
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    def map_blocks(self, kernel, blocks, inputs) -> list:
+        return self._submit(kernel, blocks, inputs)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+_BACKENDS = {"serial": SerialExecutor, "thread": ThreadExecutor, "process": ProcessExecutor}
+
+def get_executor(executor=None, workers: int = None):
+    """
+    Resolves an executor argument as accepted by the bulk operations.
+
+    Args:
+        executor: None or "serial" for the serial backend, "thread" or "process" for a new
+            pool backend, or an existing executor instance which is returned unchanged.
+        workers (int): The number of workers for a new pool backend.
+
+    Returns:
+        SerialExecutor: The executor to use.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if executor is None:
+        return SerialExecutor()
+    if isinstance(executor, str):
+        if executor not in _BACKENDS:
+            raise ValueError(f"Unknown executor backend: {executor}")
+        return _BACKENDS[executor]() if executor == "serial" else _BACKENDS[executor](workers)
+    return executor
+
+@contextmanager
+def executor_scope(executor=None, workers: int = None):
+    """
+    Resolves an executor argument and closes the backend afterwards if it was created here.
+
+    Args:
+        executor: Anything accepted by get_executor.
+        workers (int): The number of workers for a new pool backend.
+
+    Yields:
+        SerialExecutor: The executor to use. Instances passed in are left open for reuse.
+    """
+    backend = get_executor(executor, workers)
+    try:
+        yield backend
+    finally:
+        if backend is not executor:
+            backend.close()
@@ -0,0 +1,62 @@
+import numpy as np
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.ProjectiveLine import ProjectiveLine
+
+def points_to_array(points) -> np.ndarray:
+    """
+    Packs ProjectivePoints into an (N, 4) complex128 array of homogeneous (w, x, y, z) coordinates.
+
+    Args:
+        points (list of ProjectivePoint): The points to pack.
+
+    Returns:
+        np.ndarray: One row per point.
+    """
+    parts = np.fromiter(
+        (value for p in points for c in (p.w, p.x, p.y, p.z) for value in (c.rel, c.img)),
+        dtype=np.float64, count=8 * len(points)
+    )
+    return parts.view(np.complex128).reshape(len(points), 4)
+
+def array_to_points(coords) -> list:
+    """
+    Unpacks an (N, 4) array of homogeneous (w, x, y, z) coordinates into ProjectivePoints.
+
+    Args:
+        coords (array-like): The coordinates to unpack.
+
+    Returns:
+        list of ProjectivePoint: One point per row.
+    """
+    rows = np.asarray(coords, dtype=np.complex128).reshape(-1, 4).tolist()
+    return [
+        ProjectivePoint(*(ComplexNumber(c.real, c.imag) for c in row))
+        for row in rows
+    ]
+
+def lines_to_array(lines) -> np.ndarray:
+    """
+    Packs ProjectiveLines into an (N, 2, 4) complex128 array of endpoint coordinates.
+
+    Args:
+        lines (list of ProjectiveLine): The lines to pack.
+
+    Returns:
+        np.ndarray: Row i holds (point_a, point_b) of line i.
+    """
+    endpoints = [p for line in lines for p in (line.point_a, line.point_b)]
+    return points_to_array(endpoints).reshape(len(lines), 2, 4)
+
+def array_to_lines(endpoints) -> list:
+    """
+    Unpacks an (N, 2, 4) array of endpoint coordinates into ProjectiveLines.
+
+    Args:
+        endpoints (array-like): The endpoint coordinates to unpack.
+
+    Returns:
+        list of ProjectiveLine: One line per row.
+    """
+    points = array_to_points(endpoints)
+    return [ProjectiveLine(points[i], points[i + 1]) for i in range(0, len(points), 2)]
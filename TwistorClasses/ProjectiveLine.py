@@ -1,10 +1,65 @@
+from TwistorClasses.ComplexNumber import ComplexNumber
 from TwistorClasses.Quaternion import Quaternion
 from TwistorClasses.ProjectivePoint import ProjectivePoint
-from math import acos
+from math import acos, isfinite
+
+DEFAULT_TOLERANCE = 1e-10
+
+# Pairs of homogeneous components forming the six Plücker coordinates, and the permutation
+# taking them to their duals; the same conventions as LineIntersection.
+_PLUCKER_PAIRS = (("w", "x"), ("w", "y"), ("w", "z"), ("y", "z"), ("z", "x"), ("x", "y"))
+_DUAL = (3, 4, 5, 0, 1, 2)
+
+def _plucker(a: ProjectivePoint, b: ProjectivePoint) -> list:
+    """Returns the six unnormalized Plücker coordinates a_i b_j - a_j b_i of the line through a and b."""
+    return [getattr(a, i) * getattr(b, j) - getattr(a, j) * getattr(b, i) for i, j in _PLUCKER_PAIRS]
+
+def _meets(p: list, q: list, tolerance) -> bool:
+    """Checks |p . dual(q)| <= tolerance |p| |q| on squared magnitudes; degenerate lines never meet."""
+    p_norm = sum(c.magnitude_squared() for c in p)
+    q_norm = sum(c.magnitude_squared() for c in q)
+    if p_norm == 0 or q_norm == 0:
+        return False
+    incidence = p[0] * q[_DUAL[0]]
+    for k in range(1, 6):
+        incidence = incidence + p[k] * q[_DUAL[k]]
+    return incidence.magnitude_squared() <= tolerance * tolerance * p_norm * q_norm
+
+def _coincide(p: list, q: list, tolerance) -> bool:
+    """Checks whether Plücker coordinates p and q are parallel within tolerance, i.e. the lines coincide."""
+    p_norm = sum(c.magnitude_squared() for c in p)
+    q_norm = sum(c.magnitude_squared() for c in q)
+    inner = p[0] * q[0].conjugate()
+    for k in range(1, 6):
+        inner = inner + p[k] * q[k].conjugate()
+    return p_norm * q_norm - inner.magnitude_squared() <= tolerance * tolerance * p_norm * q_norm
+
+def _determinant3(m) -> ComplexNumber:
+    (a, b, c), (d, e, f), (g, h, i) = m
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+def _meeting_coefficients(a, b, c, d) -> tuple:
+    """Returns the first two entries (α, β) of a null vector of the 4x4 matrix [a, b, c, d].
+
+    Each choice of three rows gives a null vector by signed 3x3 minors; the choice with the
+    largest |α|² + |β|² is used, so the result does not depend on which component vanishes.
+    """
+    rows = [[getattr(point, name) for point in (a, b, c, d)] for name in ("w", "x", "y", "z")]
+    best, best_norm = None, -1.0
+    for skip in range(4):
+        kept = [row for r, row in enumerate(rows) if r != skip]
+        alpha = _determinant3([row[1:] for row in kept])
+        beta = -_determinant3([row[:1] + row[2:] for row in kept])
+        norm = alpha.magnitude_squared() + beta.magnitude_squared()
+        if norm > best_norm:
+            best, best_norm = (alpha, beta), norm
+    return best
 
 class ProjectiveLine:
     """Represents a line in projective space defined by two points."""
 
+    __slots__ = ("point_a", "point_b")
+
     def __init__(self, point_a: ProjectivePoint, point_b: ProjectivePoint):
         """Initializes a ProjectiveLine with two ProjectivePoint endpoints.
         
@@ -47,30 +102,70 @@ class ProjectiveLine:
         z = a.w * b.x - a.x * b.w
         return ProjectivePoint(w, x, y, z)
 
-    def intersect(self, other_line: "ProjectiveLine") -> ProjectivePoint:
+    def intersect(self, other_line: "ProjectiveLine", tolerance: float = DEFAULT_TOLERANCE) -> ProjectivePoint:
         """Finds the intersection of this line with another line in projective space.
+
+        The lines are tested with the same Plücker incidence as intersect_bool. The meeting
+        point is then the null vector (α, β, γ, δ) of the 4x4 matrix [a, b, c, d] of the four
+        endpoints, mapped back onto this line as α a + β b; this is the point returned by
+        LineIntersection.intersection_points, up to a complex scale.
         
         Args:
             other_line (ProjectiveLine): The other line to intersect with.
+            tolerance (float): Pairs whose normalized incidence is at most this value intersect.
         
         Returns:
-            ProjectivePoint: The intersection point of the two lines.
+            ProjectivePoint: The intersection point of the two lines, or None if they do not
+                meet, either line is degenerate, or the lines coincide so that no single
+                meeting point exists.
         """
-        return self.cross_product(self.point_a, other_line.point_a)
+        a, b, c, d = self.point_a, self.point_b, other_line.point_a, other_line.point_b
+        p, q = _plucker(a, b), _plucker(c, d)
+        if not _meets(p, q, tolerance) or _coincide(p, q, tolerance):
+            return None
+        alpha, beta = _meeting_coefficients(a, b, c, d)
+        scale = (alpha.magnitude_squared() + beta.magnitude_squared()) ** 0.5
+        if scale == 0:
+            return None
+        alpha, beta = alpha / scale, beta / scale
+        return ProjectivePoint(*(getattr(a, name) * alpha + getattr(b, name) * beta for name in ("w", "x", "y", "z")))
     
-    def intersect_bool(self, other_line: "ProjectiveLine") -> bool:
+    def intersect_bool(self, other_line: "ProjectiveLine", tolerance: float = DEFAULT_TOLERANCE,
+                       exact: bool = False) -> bool:
         """Checks if two lines intersect in projective space.
+
+        Two lines meet exactly when their four endpoints are coplanar, i.e. when the normalized
+        Plücker incidence |p . dual(q)| / (|p| |q|) vanishes. This is the test used by
+        LineIntersection.find_intersections, so both agree. Lines whose endpoints coincide
+        never intersect.
         
         Args:
             other_line (ProjectiveLine): The other line to check for intersection.
+            tolerance (float): Pairs whose normalized incidence is at most this value intersect.
+            exact (bool): If True, the same incidence is computed in rational arithmetic and
+                compared with the tolerance exactly, so near-threshold cases are not decided
+                by rounding; lines with non-finite components never intersect. This matches
+                LineIntersection.exact_lines_meet, which is faster for many lines.
         
         Returns:
             bool: True if the lines intersect, False otherwise.
         """
-        intersection = self.intersect(other_line)
-        tolerance = 1e-10
-        return not (abs(intersection.w.magnitude()) < tolerance and abs(intersection.x.magnitude()) < tolerance 
-                    and abs(intersection.y.magnitude()) < tolerance and abs(intersection.z.magnitude()) < tolerance)
+        a, b, c, d = self.point_a, self.point_b, other_line.point_a, other_line.point_b
+        if exact:
+            # Imported here so that the scalar classes stay quick to import (see benchmarks/bench_import.py).
+            from fractions import Fraction
+
+            components = [getattr(point, name) for point in (a, b, c, d) for name in ("w", "x", "y", "z")]
+            if not all(isfinite(part) for z in components for part in (z.rel, z.img)):
+                return False
+
+            def rational(point):
+                return ProjectivePoint(*(ComplexNumber(Fraction(z.rel), Fraction(z.img))
+                                         for z in (point.w, point.x, point.y, point.z)))
+
+            a, b, c, d = rational(a), rational(b), rational(c), rational(d)
+            tolerance = Fraction(tolerance)
+        return _meets(_plucker(a, b), _plucker(c, d), tolerance)
 
     def normalize(self):
         """Normalizes the points defining the line, so each has w = 1 if possible."""
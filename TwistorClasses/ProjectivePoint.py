@@ -5,6 +5,8 @@ from math import acos
 class ProjectivePoint:
     """Represents a point in projective space using homogeneous coordinates."""
 
+    __slots__ = ("w", "x", "y", "z")
+
     def __init__(self, w: ComplexNumber, x: ComplexNumber, y: ComplexNumber, z: ComplexNumber):
         """
         Initializes a ProjectivePoint with ComplexNumber components for w, x, y, and z.
@@ -29,14 +31,17 @@ class ProjectivePoint:
     def scale(self, scale_factor: float):
         """
         Scales the projective point by a real number, preserving conformal structure.
+
+        The components are replaced by scaled copies, so ComplexNumbers shared with other
+        points are left unchanged.
         
         Args:
             scale_factor (float): The factor by which to scale the point.
         """
-        self.w *= scale_factor
-        self.x *= scale_factor
-        self.y *= scale_factor
-        self.z *= scale_factor
+        self.w = self.w * scale_factor
+        self.x = self.x * scale_factor
+        self.y = self.y * scale_factor
+        self.z = self.z * scale_factor
 
     def normalize(self):
         """
@@ -123,7 +128,8 @@ class ProjectivePoint:
         if mag_self == 0 or mag_other == 0:
             raise ValueError("Cannot compute angle with a zero-magnitude point.")
         dot_product = (self.x.rel * other.x.rel + self.y.rel * other.y.rel + self.z.rel * other.z.rel)
-        return acos(dot_product / (mag_self * mag_other))
+        # Rounding can push the cosine of (anti)parallel points just past ±1.
+        return acos(max(-1.0, min(1.0, dot_product / (mag_self * mag_other))))
 
     def rotate(self, quaternion: Quaternion, in_place=True):
         """
@@ -138,13 +144,36 @@ class ProjectivePoint:
         """
         point_quat = Quaternion(0, self.x.rel, self.y.rel, self.z.rel)
         rotated_quat = quaternion * point_quat * quaternion.inverse()
-        rotated_point = ProjectivePoint(
-            self.w, ComplexNumber(rotated_quat.x, 0), ComplexNumber(rotated_quat.y, 0), ComplexNumber(rotated_quat.z, 0)
-        )
+        x, y, z = ComplexNumber(rotated_quat.x, 0), ComplexNumber(rotated_quat.y, 0), ComplexNumber(rotated_quat.z, 0)
         if in_place:
-            self.x, self.y, self.z = rotated_point.x, rotated_point.y, rotated_point.z
+            self.x, self.y, self.z = x, y, z
         else:
-            return rotated_point
+            # The copy keeps in-place updates of either point from reaching the other.
+            return ProjectivePoint(self.w.copy(), x, y, z)
+
+    def apply_transformation(self, transformation_matrix):
+        """
+        Applies a projective transformation to the homogeneous coordinates (w, x, y, z).
+        
+        Args:
+            transformation_matrix (list): A 4x4 matrix whose entries are ComplexNumbers or real numbers.
+        
+        Returns:
+            ProjectivePoint: A new ProjectivePoint holding the transformed coordinates.
+        
+        Raises:
+            ValueError: If transformation_matrix is not a valid 4x4 matrix.
+        """
+        if len(transformation_matrix) != 4 or any(len(row) != 4 for row in transformation_matrix):
+            raise ValueError("Transformation matrix must be 4x4")
+        components = (self.w, self.x, self.y, self.z)
+        transformed = []
+        for row in transformation_matrix:
+            total = ComplexNumber(0, 0)
+            for component, entry in zip(components, row):
+                total = total + component * entry
+            transformed.append(total)
+        return ProjectivePoint(*transformed)
 
     @staticmethod
     def compute_distance_matrix(points):
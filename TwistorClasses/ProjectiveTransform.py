@@ -0,0 +1,130 @@
+import numpy as np
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.PointArray import points_to_array, array_to_points, lines_to_array, array_to_lines
+
+def as_complex_matrix(matrix) -> np.ndarray:
+    """
+    Converts a 4x4 matrix of numbers or ComplexNumbers into a complex128 array.
+
+    Args:
+        matrix: A 4x4 array-like whose entries are real, complex or ComplexNumber values.
+
+    Returns:
+        np.ndarray: A (4, 4) complex128 array.
+
+    Raises:
+        ValueError: If the matrix is not 4x4.
+    """
+    if not isinstance(matrix, np.ndarray):
+        matrix = [[complex(e.rel, e.img) if isinstance(e, ComplexNumber) else e for e in row] for row in matrix]
+    matrix = np.asarray(matrix, dtype=np.complex128)
+    if matrix.shape != (4, 4):
+        raise ValueError("Transformation matrix must be 4x4")
+    return matrix
+
+class ProjectiveTransform:
+    """A chain of 4x4 complex projective transformations applied to arrays of homogeneous coordinates.
+
+    The chain's product is computed once, on first use, so applying K composed transforms
+    costs a single matrix multiply per point.
+    """
+
+    def __init__(self, *matrices):
+        """Initializes a transform from matrices applied in the order given.
+
+        Args:
+            *matrices: 4x4 matrices (arrays, nested lists of numbers or ComplexNumbers). The
+                first matrix acts first. With no matrices the transform is the identity.
+        """
+        self.matrices = tuple(as_complex_matrix(m) for m in matrices)
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The cached (4, 4) product of the chain, last matrix on the left."""
+        if self._matrix is None:
+            product = np.eye(4, dtype=np.complex128)
+            for m in self.matrices:
+                product = m @ product
+            self._matrix = product
+        return self._matrix
+
+    def then(self, *others) -> "ProjectiveTransform":
+        """
+        Returns the transform that applies self first and then each of others in turn.
+
+        Args:
+            *others (ProjectiveTransform or matrix): The transformations to append.
+
+        Returns:
+            ProjectiveTransform: The longer chain, of the same class as self unless one of
+                others is a transform of a different class.
+        """
+        cls = type(self)
+        matrices = list(self.matrices)
+        for other in others:
+            if isinstance(other, ProjectiveTransform):
+                matrices.extend(other.matrices)
+                if not isinstance(other, cls):
+                    cls = ProjectiveTransform
+            else:
+                matrices.append(other)
+        return cls(*matrices)
+
+    def __matmul__(self, other):
+        """Composes like matrices: (self @ other) applies other first, then self."""
+        if isinstance(other, ProjectiveTransform):
+            return other.then(self)
+        return NotImplemented
+
+    def inverse(self) -> "ProjectiveTransform":
+        """Returns the inverse transformation as a single matrix."""
+        return ProjectiveTransform(np.linalg.inv(self.matrix))
+
+    def apply(self, coords, renormalize: bool = False) -> np.ndarray:
+        """
+        Transforms an array of homogeneous (w, x, y, z) coordinates.
+
+        Args:
+            coords (array-like): A (..., 4) array; (N, 4) points and (N, 2, 4) line endpoints
+                are handled in the same pass.
+            renormalize (bool): If True, scales each result by 1/|w| as ProjectivePoint.normalize
+                does. Points at infinity (w = 0) are left unscaled instead of raising.
+
+        Returns:
+            np.ndarray: The transformed complex128 coordinates, same shape as coords.
+        """
+        coords = np.asarray(coords, dtype=np.complex128)
+        if coords.shape[-1] != 4:
+            raise ValueError("Coordinates must have 4 (w, x, y, z) columns")
+        out = coords @ self.matrix.T
+        if renormalize:
+            magnitude_w = np.abs(out[..., :1])
+            np.divide(out, magnitude_w, out=out, where=magnitude_w != 0)
+        return out
+
+    def apply_to_points(self, points, renormalize: bool = False) -> list:
+        """
+        Transforms a list of ProjectivePoints.
+
+        Args:
+            points (list of ProjectivePoint): The points to transform.
+            renormalize (bool): See apply.
+
+        Returns:
+            list of ProjectivePoint: New transformed points.
+        """
+        return array_to_points(self.apply(points_to_array(points), renormalize))
+
+    def apply_to_lines(self, lines, renormalize: bool = False) -> list:
+        """
+        Transforms a list of ProjectiveLines by their endpoints.
+
+        Args:
+            lines (list of ProjectiveLine): The lines to transform.
+            renormalize (bool): See apply.
+
+        Returns:
+            list of ProjectiveLine: New transformed lines.
+        """
+        return array_to_lines(self.apply(lines_to_array(lines), renormalize))
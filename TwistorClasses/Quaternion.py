@@ -1,7 +1,13 @@
 from math import acos
 
 class Quaternion:
-    """Represents a quaternion with real (w) and imaginary (x, y, z) components."""
+    """Represents a quaternion with real (w) and imaginary (x, y, z) components.
+
+    The augmented operators (+=, -=, *=, /=) and the out= arguments update existing
+    instances instead of allocating new ones; copy() first when a value must stay independent.
+    """
+
+    __slots__ = ("w", "x", "y", "z")
 
     def __init__(self, w, x, y, z):
         """Initializes a Quaternion with given components.
@@ -21,42 +27,113 @@ class Quaternion:
         """Displays the components of the quaternion in a readable format."""
         print(f"Quaternion: {self.w} + {self.x}i + {self.y}j + {self.z}k")
 
-    def add(self, other: "Quaternion") -> "Quaternion":
+    def _store(self, w, x, y, z, out):
+        if out is None:
+            return Quaternion(w, x, y, z)
+        out.w = w
+        out.x = x
+        out.y = y
+        out.z = z
+        return out
+
+    def add(self, other: "Quaternion", out: "Quaternion" = None) -> "Quaternion":
         """Adds two quaternions.
         
         Args:
             other (Quaternion): The quaternion to add.
+            out (Quaternion): If given, receives the result instead of a new instance.
         
         Returns:
-            Quaternion: The sum of the two quaternions.
+            Quaternion: The sum of the two quaternions (out when given).
         """
-        return Quaternion(self.w + other.w, self.x + other.x, self.y + other.y, self.z + other.z)
+        return self._store(self.w + other.w, self.x + other.x, self.y + other.y, self.z + other.z, out)
 
-    def subtract(self, other: "Quaternion") -> "Quaternion":
+    def subtract(self, other: "Quaternion", out: "Quaternion" = None) -> "Quaternion":
         """Subtracts two quaternions.
         
         Args:
             other (Quaternion): The quaternion to subtract.
+            out (Quaternion): If given, receives the result instead of a new instance.
         
         Returns:
-            Quaternion: The difference of the two quaternions.
+            Quaternion: The difference of the two quaternions (out when given).
         """
-        return Quaternion(self.w - other.w, self.x - other.x, self.y - other.y, self.z - other.z)
+        return self._store(self.w - other.w, self.x - other.x, self.y - other.y, self.z - other.z, out)
 
-    def multiply(self, other: "Quaternion") -> "Quaternion":
+    def multiply(self, other: "Quaternion", out: "Quaternion" = None) -> "Quaternion":
         """Multiplies two quaternions.
         
         Args:
             other (Quaternion): The quaternion to multiply by.
+            out (Quaternion): If given, receives the result instead of a new instance. It may be self or other.
         
         Returns:
-            Quaternion: The product of the two quaternions.
+            Quaternion: The product of the two quaternions (out when given).
         """
         w = self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z
         x = self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y
         y = self.w * other.y - self.x * other.z + self.y * other.w + self.z * other.x
         z = self.w * other.z + self.x * other.y - self.y * other.x + self.z * other.w
-        return Quaternion(w, x, y, z)
+        return self._store(w, x, y, z, out)
+
+    def multiply_add(self, other: "Quaternion", addend: "Quaternion", out: "Quaternion" = None) -> "Quaternion":
+        """Computes self * other + addend in one step.
+        
+        Args:
+            other (Quaternion): The quaternion to multiply by.
+            addend (Quaternion): The quaternion added to the product.
+            out (Quaternion): If given, receives the result instead of a new instance. It may be any operand.
+        
+        Returns:
+            Quaternion: The result (out when given).
+        """
+        w = self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z + addend.w
+        x = self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y + addend.x
+        y = self.w * other.y - self.x * other.z + self.y * other.w + self.z * other.x + addend.y
+        z = self.w * other.z + self.x * other.y - self.y * other.x + self.z * other.w + addend.z
+        return self._store(w, x, y, z, out)
+
+    # In-place operator overloads
+    def __iadd__(self, other):
+        """Allows the use of the += operator, updating this instance."""
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def __isub__(self, other):
+        """Allows the use of the -= operator, updating this instance."""
+        if not isinstance(other, Quaternion):
+            return NotImplemented
+        return self.subtract(other, out=self)
+
+    def __imul__(self, other):
+        """Allows the use of the *= operator for the Hamilton product and real scaling, updating this instance."""
+        if isinstance(other, Quaternion):
+            return self.multiply(other, out=self)
+        elif isinstance(other, (int, float)):
+            return self._store(self.w * other, self.x * other, self.y * other, self.z * other, self)
+        else:
+            return NotImplemented
+
+    def __itruediv__(self, other):
+        """Allows the use of the /= operator with a real divisor, updating this instance."""
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self._store(self.w / other, self.x / other, self.y / other, self.z / other, self)
+
+    def copy(self) -> "Quaternion":
+        """Returns an independent Quaternion with the same components."""
+        return Quaternion(self.w, self.x, self.y, self.z)
+
+    # Operator overload for multiplication
+    def __mul__(self, other):
+        """Allows the use of the * operator for the Hamilton product and for scaling by a real number."""
+        if isinstance(other, Quaternion):
+            return self.multiply(other)
+        elif isinstance(other, (int, float)):
+            return Quaternion(self.w * other, self.x * other, self.y * other, self.z * other)
+        else:
+            return NotImplemented
 
     def magnitude(self) -> float:
         """Calculates the magnitude of the quaternion.
@@ -66,32 +143,49 @@ class Quaternion:
         """
         return (self.w**2 + self.x**2 + self.y**2 + self.z**2) ** 0.5
 
-    def conjugate(self) -> "Quaternion":
+    def magnitude_squared(self) -> float:
+        """Calculates the squared magnitude of the quaternion without a square root.
+        
+        Returns:
+            float: The squared magnitude of the quaternion.
+        """
+        return self.w * self.w + self.x * self.x + self.y * self.y + self.z * self.z
+
+    def conjugate(self, out: "Quaternion" = None) -> "Quaternion":
         """Calculates the conjugate of the quaternion.
         
+        Args:
+            out (Quaternion): If given, receives the result instead of a new instance.
+        
         Returns:
-            Quaternion: The conjugate of the quaternion.
+            Quaternion: The conjugate of the quaternion (out when given).
         """
-        return Quaternion(self.w, -self.x, -self.y, -self.z)
+        return self._store(self.w, -self.x, -self.y, -self.z, out)
 
-    def normalize(self) -> "Quaternion":
+    def normalize(self, out: "Quaternion" = None) -> "Quaternion":
         """Normalizes the quaternion to unit length.
         
+        Args:
+            out (Quaternion): If given, receives the result instead of a new instance.
+        
         Returns:
-            Quaternion: A normalized (unit) quaternion.
+            Quaternion: A normalized (unit) quaternion (out when given).
         """
         mag = self.magnitude()
-        return Quaternion(self.w / mag, self.x / mag, self.y / mag, self.z / mag)
+        return self._store(self.w / mag, self.x / mag, self.y / mag, self.z / mag, out)
 
-    def inverse(self) -> "Quaternion":
-        """Calculates the inverse of the quaternion.
+    def inverse(self, out: "Quaternion" = None) -> "Quaternion":
+        """Calculates the inverse of the quaternion from its conjugate and squared magnitude.
+        
+        Args:
+            out (Quaternion): If given, receives the result instead of a new instance.
         
         Returns:
-            Quaternion: The inverse of the quaternion.
+            Quaternion: The inverse of the quaternion (out when given).
         """
-        conj = self.conjugate()
-        mag_squared = self.magnitude() ** 2
-        return Quaternion(conj.w / mag_squared, conj.x / mag_squared, conj.y / mag_squared, conj.z / mag_squared)
+        mag_squared = self.magnitude_squared()
+        return self._store(self.w / mag_squared, -self.x / mag_squared, -self.y / mag_squared,
+                           -self.z / mag_squared, out)
 
     def dot_product(self, other: "Quaternion") -> float:
         """Calculates the dot product of two quaternions.
@@ -114,5 +208,6 @@ class Quaternion:
             float: The angle between the two quaternions in radians.
         """
         dot_prod = self.dot_product(other)
-        return acos(dot_prod / (self.magnitude() * other.magnitude()))
+        # Rounding can push the cosine of (anti)parallel quaternions just past ±1.
+        return acos(max(-1.0, min(1.0, dot_prod / (self.magnitude() * other.magnitude()))))
 
@@ -0,0 +1,242 @@
+import numpy as np
+from TwistorClasses.Quaternion import Quaternion
+
+def _hamilton(a, b) -> np.ndarray:
+    """Broadcasted Hamilton product of two (..., 4) arrays of (w, x, y, z) components."""
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+class QuaternionArray:
+    """Represents many quaternions as one (..., 4) float64 array of (w, x, y, z) components.
+
+    Functions include:
+        - multiply (element-wise and broadcast)
+        - cumulative_product and product
+        - magnitude, conjugate, normalize, inverse
+        - slerp
+        - angle_matrix
+    """
+
+    def __init__(self, components):
+        """Initializes a QuaternionArray.
+
+        Args:
+            components (array-like): An array whose last axis holds (w, x, y, z).
+        """
+        self.components = np.asarray(components, dtype=np.float64)
+        if self.components.ndim == 0 or self.components.shape[-1] != 4:
+            raise ValueError("Quaternion components must have a last axis of length 4")
+
+    @classmethod
+    def from_quaternions(cls, quaternions) -> "QuaternionArray":
+        """Builds a QuaternionArray from a sequence of Quaternion instances.
+
+        Args:
+            quaternions (list of Quaternion): The quaternions to pack.
+
+        Returns:
+            QuaternionArray: An (N, 4) array.
+        """
+        return cls(np.array([(q.w, q.x, q.y, q.z) for q in quaternions], dtype=np.float64).reshape(-1, 4))
+
+    def to_quaternions(self) -> list:
+        """Unpacks the array into a flat list of Quaternion instances.
+
+        Returns:
+            list of Quaternion: One Quaternion per row, in row-major order.
+        """
+        return [Quaternion(*row) for row in self.components.reshape(-1, 4).tolist()]
+
+    @property
+    def shape(self) -> tuple:
+        """The shape of the array without the trailing component axis."""
+        return self.components.shape[:-1]
+
+    def _require_axis(self, operation: str):
+        """Raises ValueError if the array holds a single quaternion and so has no axis to index or scan."""
+        if self.components.ndim < 2:
+            raise ValueError(f"{operation} needs an array of shape (N, ..., 4), not a single quaternion of shape (4,)")
+
+    def __len__(self):
+        if self.components.ndim < 2:
+            raise TypeError("len() of a single quaternion")
+        return len(self.components)
+
+    def __getitem__(self, index):
+        """Returns a Quaternion for a single element and a QuaternionArray otherwise.
+
+        Raises:
+            ValueError: If the array holds a single quaternion of shape (4,).
+        """
+        self._require_axis("Indexing")
+        item = self.components[index]
+        if item.ndim == 1:
+            return Quaternion(*item.tolist())
+        return QuaternionArray(item)
+
+    def display(self):
+        """Displays every quaternion in a readable format."""
+        for q in self.to_quaternions():
+            q.display()
+
+    @staticmethod
+    def _operand(other):
+        if isinstance(other, QuaternionArray):
+            return other.components
+        elif isinstance(other, Quaternion):
+            return np.array([other.w, other.x, other.y, other.z], dtype=np.float64)
+        return np.asarray(other, dtype=np.float64)
+
+    def add(self, other) -> "QuaternionArray":
+        """Adds quaternions element-wise with broadcasting."""
+        return QuaternionArray(self.components + self._operand(other))
+
+    def subtract(self, other) -> "QuaternionArray":
+        """Subtracts quaternions element-wise with broadcasting."""
+        return QuaternionArray(self.components - self._operand(other))
+
+    def multiply(self, other) -> "QuaternionArray":
+        """
+        Computes the Hamilton product self * other with NumPy broadcasting.
+
+        Use arrays of shape (N, 1, 4) and (1, M, 4) for an outer product.
+
+        Args:
+            other (QuaternionArray, Quaternion or array-like): The right-hand factor.
+
+        Returns:
+            QuaternionArray: The element-wise products.
+        """
+        return QuaternionArray(_hamilton(self.components, self._operand(other)))
+
+    # Operator overload for multiplication
+    def __mul__(self, other):
+        """Allows the use of the * operator for Hamilton products and scaling by a real number."""
+        if isinstance(other, (int, float)):
+            return QuaternionArray(self.components * other)
+        elif isinstance(other, (QuaternionArray, Quaternion, np.ndarray)):
+            return self.multiply(other)
+        else:
+            raise TypeError("Unsupported operand type for *")
+
+    def __rmul__(self, other):
+        if isinstance(other, (int, float)):
+            return QuaternionArray(self.components * other)
+        else:
+            raise TypeError("Unsupported operand type for *")
+
+    def cumulative_product(self, sequence: bool = False) -> "QuaternionArray":
+        """
+        Computes the running products along the first axis.
+
+        The scan takes log2(N) vectorized passes instead of N interpreted multiplies.
+
+        Args:
+            sequence (bool): If False, row i is q0 * q1 * ... * qi. If True, row i is
+                qi * ... * q1 * q0, the single rotation equal to applying q0, then q1, ..., then qi.
+
+        Returns:
+            QuaternionArray: The prefix products, same shape as self.
+
+        Raises:
+            ValueError: If the array holds a single quaternion of shape (4,).
+        """
+        self._require_axis("cumulative_product()")
+        result = self.components.copy()
+        step = 1
+        while step < len(result):
+            if sequence:
+                result[step:] = _hamilton(result[step:], result[:-step])
+            else:
+                result[step:] = _hamilton(result[:-step], result[step:])
+            step *= 2
+        return QuaternionArray(result)
+
+    def product(self, sequence: bool = False) -> Quaternion:
+        """
+        Reduces the first axis to a single composed quaternion by pairwise multiplication.
+
+        Args:
+            sequence (bool): If False, returns q0 * q1 * ... * q(N-1). If True, returns
+                q(N-1) * ... * q0, the rotation equal to applying q0 first.
+
+        Returns:
+            Quaternion: The composed quaternion (the identity for an empty array).
+        """
+        if self.components.ndim != 2:
+            raise ValueError("product() expects an (N, 4) array")
+        result = self.components[::-1] if sequence else self.components
+        if len(result) == 0:
+            return Quaternion(1.0, 0.0, 0.0, 0.0)
+        while len(result) > 1:
+            paired = _hamilton(result[0:len(result) - 1:2], result[1::2])
+            result = np.concatenate((paired, result[-1:])) if len(result) % 2 else paired
+        return Quaternion(*result[0].tolist())
+
+    def magnitude(self) -> np.ndarray:
+        """Calculates the magnitude of every quaternion."""
+        return np.sqrt(np.einsum("...i,...i->...", self.components, self.components))
+
+    def conjugate(self) -> "QuaternionArray":
+        """Calculates the conjugate of every quaternion."""
+        return QuaternionArray(self.components * np.array([1.0, -1.0, -1.0, -1.0]))
+
+    def normalize(self) -> "QuaternionArray":
+        """Normalizes every quaternion to unit length."""
+        return QuaternionArray(self.components / self.magnitude()[..., None])
+
+    def inverse(self) -> "QuaternionArray":
+        """Calculates the inverse of every quaternion."""
+        mag_squared = np.einsum("...i,...i->...", self.components, self.components)
+        return QuaternionArray(self.conjugate().components / mag_squared[..., None])
+
+    def dot_product(self, other) -> np.ndarray:
+        """Calculates the element-wise 4D dot product with broadcasting."""
+        return np.einsum("...i,...i->...", self.components, self._operand(other))
+
+    def slerp(self, other, t) -> "QuaternionArray":
+        """
+        Spherically interpolates between unit quaternions along the shortest arc.
+
+        Args:
+            other (QuaternionArray, Quaternion or array-like): The end orientations.
+            t (float or array-like): Interpolation parameters in [0, 1], broadcast against the quaternions.
+
+        Returns:
+            QuaternionArray: The normalized interpolated quaternions.
+        """
+        start = self.normalize().components
+        end = QuaternionArray(self._operand(other)).normalize().components
+        start, end = np.broadcast_arrays(start, end)
+        t = np.asarray(t, dtype=np.float64)[..., None]
+        cos_theta = np.einsum("...i,...i->...", start, end)[..., None]
+        end = np.where(cos_theta < 0, -end, end)
+        cos_theta = np.abs(cos_theta)
+        theta = np.arccos(np.clip(cos_theta, -1.0, 1.0))
+        sin_theta = np.sin(theta)
+        close = sin_theta < 1e-8
+        safe_sin = np.where(close, 1.0, sin_theta)
+        weight_start = np.where(close, 1.0 - t, np.sin((1.0 - t) * theta) / safe_sin)
+        weight_end = np.where(close, t, np.sin(t * theta) / safe_sin)
+        return QuaternionArray(weight_start * start + weight_end * end).normalize()
+
+    def angle_matrix(self, other=None) -> np.ndarray:
+        """
+        Calculates Quaternion.angle_with between every pair of quaternions.
+
+        Args:
+            other (QuaternionArray): The column quaternions. Defaults to self.
+
+        Returns:
+            np.ndarray: An (N, M) array of angles in radians.
+        """
+        rows = self.components.reshape(-1, 4)
+        cols = rows if other is None else QuaternionArray(self._operand(other)).components.reshape(-1, 4)
+        norms = np.outer(np.linalg.norm(rows, axis=1), np.linalg.norm(cols, axis=1))
+        return np.arccos(np.clip(rows @ cols.T / norms, -1.0, 1.0))
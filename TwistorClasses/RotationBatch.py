@@ -0,0 +1,148 @@
+import numpy as np
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.QuaternionArray import QuaternionArray
+from TwistorClasses.Parallel import executor_scope, partition
+
+ACTIVE = "active"
+PASSIVE = "passive"
+
+def quaternions_to_array(quaternions) -> np.ndarray:
+    """
+    Converts a Quaternion, a list of Quaternions or an array-like into a (K, 4) float64 array.
+
+    Args:
+        quaternions: A Quaternion, a sequence of Quaternions, a QuaternionArray, or an
+            array-like of (w, x, y, z) rows.
+
+    Returns:
+        np.ndarray: A (K, 4) array of (w, x, y, z) components.
+    """
+    if isinstance(quaternions, Quaternion):
+        quaternions = [quaternions]
+    if isinstance(quaternions, QuaternionArray):
+        quaternions = quaternions.components.reshape(-1, 4)
+    elif len(quaternions) and isinstance(quaternions[0], Quaternion):
+        quaternions = [(q.w, q.x, q.y, q.z) for q in quaternions]
+    array = np.asarray(quaternions, dtype=np.float64)
+    if array.ndim == 1:
+        array = array[None, :]
+    if array.ndim != 2 or array.shape[1] != 4:
+        raise ValueError("Quaternions must be given as (w, x, y, z) rows")
+    return array
+
+def rotation_matrices(quaternions, normalize: bool = True) -> np.ndarray:
+    """
+    Converts quaternions into 3x3 matrices of the active rotation p -> q * p * q^*.
+
+    Args:
+        quaternions: Anything accepted by quaternions_to_array.
+        normalize (bool): If True, divides by |q|^2 so the matrix matches q * p * q^-1 as in
+            ProjectivePoint.rotate. If False, keeps the |q|^2 scaling of VectorRotation.active_rotation.
+
+    Returns:
+        np.ndarray: A (K, 3, 3) float64 array of rotation matrices.
+    """
+    q = quaternions_to_array(quaternions)
+    w, x, y, z = q.T
+    ww, xx, yy, zz = w * w, x * x, y * y, z * z
+    matrices = np.empty((len(q), 3, 3), dtype=np.float64)
+    matrices[:, 0, 0] = ww + xx - yy - zz
+    matrices[:, 0, 1] = 2 * (x * y - w * z)
+    matrices[:, 0, 2] = 2 * (x * z + w * y)
+    matrices[:, 1, 0] = 2 * (x * y + w * z)
+    matrices[:, 1, 1] = ww - xx + yy - zz
+    matrices[:, 1, 2] = 2 * (y * z - w * x)
+    matrices[:, 2, 0] = 2 * (x * z - w * y)
+    matrices[:, 2, 1] = 2 * (y * z + w * x)
+    matrices[:, 2, 2] = ww - xx - yy + zz
+    if normalize:
+        norm_sq = ww + xx + yy + zz
+        if np.any(norm_sq == 0):
+            raise ValueError("Cannot build a rotation from a zero quaternion.")
+        matrices /= norm_sq[:, None, None]
+    return matrices
+
+def _rotate(matrices, xyz, paired):
+    """Rotates (..., 3) coordinates by (K, 3, 3) matrices; see RotationBatch.apply for the shapes."""
+    if paired:
+        return np.einsum("kij,k...j->k...i", matrices, xyz)
+    if len(matrices) == 1:
+        return xyz @ matrices[0].T
+    return np.einsum("kij,...j->k...i", matrices, xyz)
+
+def _rotate_kernel(start, stop, matrices, xyz, paired, out):
+    if paired:
+        out[..., -3:] = _rotate(matrices[start:stop], xyz[start:stop], True)
+    else:
+        out[..., -3:] = _rotate(matrices, xyz[start:stop], False)
+
+class RotationBatch:
+    """Applies one or many quaternion rotations to whole coordinate arrays at once.
+
+    The quaternions are converted to 3x3 matrices once, at construction; every call to
+    apply is then a single matrix product over the coordinate array.
+    """
+
+    def __init__(self, quaternions, normalize: bool = True):
+        """Initializes a RotationBatch.
+
+        Args:
+            quaternions: A Quaternion, a list of Quaternions, a QuaternionArray or a (K, 4) array.
+            normalize (bool): See rotation_matrices.
+        """
+        self.matrices = rotation_matrices(quaternions, normalize)
+
+    def __len__(self):
+        return len(self.matrices)
+
+    def apply(self, coords, mode: str = ACTIVE, paired: bool = False, executor=None) -> np.ndarray:
+        """
+        Rotates an array of coordinates.
+
+        Args:
+            coords (array-like): A (..., 3) array of x, y, z values or a (..., 4) array of
+                homogeneous (w, x, y, z) values, real or complex. The w column is left unchanged,
+                and real and imaginary parts are rotated alike.
+            mode (str): "active" for q * p * q^* or "passive" for q^* * p * q, as in VectorRotation.
+            paired (bool): If True, quaternion k rotates coords[k] only, so K must equal
+                coords.shape[0]. Otherwise a single quaternion rotates every row, and K > 1
+                quaternions produce a leading K axis.
+            executor: A backend accepted by Parallel.get_executor; the rows of coords are
+                split evenly across its workers.
+
+        Returns:
+            np.ndarray: The rotated coordinates, shaped like coords (with a leading K axis
+                when several quaternions are applied to every row).
+
+        Raises:
+            ValueError: If mode is unknown or the shapes do not match.
+        """
+        if mode == ACTIVE:
+            matrices = self.matrices
+        elif mode == PASSIVE:
+            matrices = self.matrices.transpose(0, 2, 1)
+        else:
+            raise ValueError(f"Unknown rotation mode: {mode}")
+
+        coords = np.asarray(coords)
+        if coords.shape[-1] not in (3, 4):
+            raise ValueError("Coordinates must have 3 (x, y, z) or 4 (w, x, y, z) columns")
+        homogeneous = coords.shape[-1] == 4
+        xyz = coords[..., 1:] if homogeneous else coords
+
+        if paired and (coords.ndim < 2 or len(coords) != len(matrices)):
+            raise ValueError("Paired rotation needs one quaternion per coordinate row")
+        shape = xyz.shape if paired or len(matrices) == 1 else (len(matrices),) + xyz.shape
+        out = np.empty(shape[:-1] + coords.shape[-1:], dtype=np.result_type(matrices, xyz))
+        if homogeneous:
+            out[..., 0] = coords[..., 0]
+        if coords.ndim < 2:
+            out[..., -3:] = _rotate(matrices, xyz, paired)
+            return out
+        with executor_scope(executor) as backend:
+            blocks = partition(len(xyz), parts=backend.workers)
+            regions = None
+            if not paired and len(matrices) > 1:
+                # Every quaternion rotates the block, so the block is a range of the second axis.
+                regions = [(slice(None), slice(start, stop)) for start, stop in blocks]
+            return backend.run(_rotate_kernel, blocks, (matrices, xyz, paired), out, regions)
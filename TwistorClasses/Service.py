@@ -0,0 +1,499 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import time
+import numpy as np
+from TwistorClasses.TwistorMappingBatch import minkowski_matrices
+from TwistorClasses.LineIntersection import DEFAULT_TOLERANCE, lines_meet
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT = 0.002
+DEFAULT_MAX_PENDING = 4096
+
+def map_twistors(requests) -> list:
+    """
+    Maps a batch of (point, spinor) requests to twistors in one vectorized pass.
+
+    Args:
+        requests (list of tuple): (point, spinor) pairs, where point is a real (t, x, y, z)
+            sequence and spinor a pair of complex λ components.
+
+    Returns:
+        list: One [mu0, mu1, lambda0, lambda1] list of complex numbers per request, equal to
+            twistor_mapping(ComplexMinkowskiPoint(*point), Spinor(*spinor)).
+    """
+    points = np.array([point for point, _ in requests], dtype=np.float64).reshape(len(requests), 4)
+    spinors = np.array([spinor for _, spinor in requests], dtype=np.complex128).reshape(len(requests), 2)
+    twistors = np.empty((len(requests), 4), dtype=np.complex128)
+    twistors[:, :2] = np.einsum("nij,nj->ni", minkowski_matrices(points), spinors)
+    twistors[:, 2:] = spinors
+    return twistors.tolist()
+
+def point_distances(requests) -> list:
+    """
+    Computes ProjectivePoint.distance_to for a batch of point pairs.
+
+    Args:
+        requests (list of tuple): (a, b) pairs of homogeneous (w, x, y, z) complex coordinates.
+
+    Returns:
+        list of float: One distance per request.
+    """
+    pairs = np.array(requests, dtype=np.complex128).reshape(len(requests), 2, 4)
+    diff = pairs[:, 0, 1:] - pairs[:, 1, 1:]
+    return np.sqrt((diff.real**2 + diff.imag**2).sum(axis=1)).tolist()
+
+def lines_intersect(requests, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """
+    Tests a batch of line pairs for intersection with LineIntersection.lines_meet.
+
+    Args:
+        requests (list of tuple): (line_a, line_b) pairs, each line given by two homogeneous
+            (w, x, y, z) complex endpoints.
+        tolerance (float): Pairs whose normalized incidence is at most this value meet. The
+            float32 screen with exact re-evaluation of ambiguous pairs decides this exactly.
+
+    Returns:
+        list of bool: One result per request; degenerate lines never intersect.
+    """
+    pairs = np.array(requests, dtype=np.complex128).reshape(len(requests), 2, 2, 4)
+    return lines_meet(pairs[:, 0], pairs[:, 1], tolerance).tolist()
+
+# Operation name -> batch handler taking a list of requests and returning one result per request.
+OPERATIONS = {
+    "map": map_twistors,
+    "distance": point_distances,
+    "intersect": lines_intersect,
+}
+
+def _run_batch(handler, requests) -> list:
+    """
+    Runs a batch, falling back to one request at a time if it fails, so that one bad
+    request does not fail the others.
+
+    Returns:
+        list of tuple: (ok, result or exception) per request.
+    """
+    try:
+        results = handler(requests)
+        if len(results) != len(requests):
+            raise RuntimeError(f"The handler returned {len(results)} results for {len(requests)} requests")
+        return [(True, result) for result in results]
+    except Exception as e:
+        if len(requests) == 1:
+            return [(False, e)]
+    return [_run_batch(handler, [request])[0] for request in requests]
+
+class LatencyStats:
+    """Collects per-request latencies and batch sizes and summarizes them."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears everything recorded so far."""
+        self.latencies = []
+        self.batch_sizes = []
+        self.errors = 0
+        self._first = None
+        self._last = None
+
+    def record(self, started: float, finished: float, ok: bool = True):
+        """
+        Records one request.
+
+        Args:
+            started (float): The time.perf_counter() value when the request arrived.
+            finished (float): The time.perf_counter() value when its result was ready.
+            ok (bool): False if the request failed.
+        """
+        self.latencies.append(finished - started)
+        self.errors += not ok
+        self._first = started if self._first is None else min(self._first, started)
+        self._last = finished if self._last is None else max(self._last, finished)
+
+    def record_batch(self, size: int):
+        """Records the size of one dispatched batch."""
+        self.batch_sizes.append(size)
+
+    def summary(self) -> dict:
+        """
+        Summarizes the recorded requests.
+
+        Returns:
+            dict: requests, errors, batches, mean_batch_size, p50_ms, p99_ms, max_ms and
+                throughput_rps, the completed requests per second between the first arrival
+                and the last completion.
+        """
+        count = len(self.latencies)
+        latencies = np.array(self.latencies) * 1e3
+        elapsed = (self._last - self._first) if count else 0.0
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "batches": len(self.batch_sizes),
+            "mean_batch_size": float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            "p50_ms": float(np.percentile(latencies, 50)) if count else None,
+            "p99_ms": float(np.percentile(latencies, 99)) if count else None,
+            "max_ms": float(latencies.max()) if count else None,
+            "throughput_rps": count / elapsed if elapsed > 0 else None,
+        }
+
+class MicroBatcher:
+    """Groups concurrent requests into batches handled by one vectorized call.
+
+    A batch is dispatched as soon as it holds max_batch_size requests, or max_wait seconds
+    after its first request arrived. Handlers run on an executor so the event loop stays
+    responsive. At most max_pending requests may be queued or in flight; further enqueue()
+    calls wait for space, which is how backpressure reaches the callers.
+    """
+
+    def __init__(self, handler, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT,
+                 max_pending: int = DEFAULT_MAX_PENDING, executor=None, stats: LatencyStats = None):
+        """Initializes the batcher; it starts with the first request.
+
+        Args:
+            handler (callable): handler(requests) -> list with one result per request. If a
+                batch raises, its requests are retried one by one so only the bad ones fail.
+                It must be a module-level function when executor is a process pool.
+            max_batch_size (int): The largest batch handed to the handler.
+            max_wait (float): The longest a request waits for its batch to fill, in seconds.
+            max_pending (int): The most requests queued or in flight at once.
+            executor (concurrent.futures.Executor): Where batches run; None uses the event
+                loop's default thread pool.
+            stats (LatencyStats): Where latencies and batch sizes are recorded.
+
+        Raises:
+            ValueError: If a limit is not positive or max_pending is below max_batch_size.
+        """
+        if max_batch_size <= 0 or max_pending <= 0 or max_wait < 0:
+            raise ValueError("Batch size and pending limit must be positive, max_wait non-negative")
+        if max_pending < max_batch_size:
+            raise ValueError("max_pending must be at least max_batch_size")
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.executor = executor
+        self.stats = stats if stats is not None else LatencyStats()
+        self._queue = deque()
+        self._space = None
+        self._ready = None
+        self._full = None
+        self._collector = None
+        self._dispatches = set()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """The number of requests waiting to be batched."""
+        return len(self._queue)
+
+    def _start(self):
+        self._space = asyncio.Semaphore(self.max_pending)
+        self._ready = asyncio.Event()
+        self._full = asyncio.Event()
+        self._collector = asyncio.get_running_loop().create_task(self._collect())
+
+    async def enqueue(self, request) -> asyncio.Future:
+        """
+        Queues a request, waiting while max_pending requests are outstanding.
+
+        Args:
+            request: One request for the handler.
+
+        Returns:
+            asyncio.Future: Resolves to the request's result.
+
+        Raises:
+            RuntimeError: If the batcher is closed.
+        """
+        if self._closed:
+            raise RuntimeError("The batcher is closed")
+        if self._collector is None:
+            self._start()
+        await self._space.acquire()
+        if self._closed:
+            # close() ran while this request waited for space; the collector may be gone.
+            self._space.release()
+            raise RuntimeError("The batcher is closed")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((request, future, time.perf_counter()))
+        self._ready.set()
+        if len(self._queue) >= self.max_batch_size:
+            self._full.set()
+        return future
+
+    async def submit(self, request):
+        """Queues a request and returns its result."""
+        return await (await self.enqueue(request))
+
+    async def _collect(self):
+        while True:
+            await self._ready.wait()
+            if not self._queue:
+                break
+            if len(self._queue) < self.max_batch_size and not self._closed:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+            batch = [self._queue.popleft() for _ in range(min(self.max_batch_size, len(self._queue)))]
+            if not self._queue and not self._closed:
+                self._ready.clear()
+            if len(self._queue) < self.max_batch_size:
+                self._full.clear()
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch):
+        loop = asyncio.get_running_loop()
+        self.stats.record_batch(len(batch))
+        try:
+            try:
+                outcomes = await loop.run_in_executor(self.executor, _run_batch, self.handler,
+                                                      [request for request, _, _ in batch])
+            except Exception as e:
+                # The executor itself failed, e.g. a broken process pool.
+                outcomes = [(False, e)] * len(batch)
+            finished = time.perf_counter()
+            for (_, future, started), (ok, value) in zip(batch, outcomes):
+                if not future.done():
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+                self.stats.record(started, finished, ok)
+        finally:
+            for _ in batch:
+                self._space.release()
+
+    async def close(self):
+        """Dispatches everything still queued, waits for it and stops the batcher."""
+        self._closed = True
+        if self._collector is None:
+            return
+        self._full.set()
+        self._ready.set()
+        await self._collector
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+def _encode(message: dict) -> bytes:
+    """Serializes a message as one line of JSON, writing complex numbers as {"__complex__": [re, im]}."""
+    def default(value):
+        if isinstance(value, (complex, np.complexfloating)):
+            return {"__complex__": [value.real, value.imag]}
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+    return json.dumps(message, default=default).encode() + b"\n"
+
+def _decode(line: bytes) -> dict:
+    """Parses one line written by _encode."""
+    def object_hook(value):
+        if value.keys() == {"__complex__"}:
+            return complex(*value["__complex__"])
+        return value
+    return json.loads(line, object_hook=object_hook)
+
+class TwistorService:
+    """Serves twistor mapping, distance and intersection queries with micro-batching.
+
+    Each operation in OPERATIONS gets its own MicroBatcher; all share one worker pool and
+    one LatencyStats. Requests can be made in-process with request(), or over a localhost
+    TCP socket with serve() and ServiceClient, using one JSON message per line:
+
+        {"id": 1, "op": "map", "args": [[t, x, y, z], [l0, l1]]}
+        {"id": 1, "result": [mu0, mu1, l0, l1]}
+
+    Use it as an async context manager so the workers are shut down.
+    """
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT,
+                 max_pending: int = DEFAULT_MAX_PENDING, workers: int = None, executor=None, operations=None):
+        """Initializes the service.
+
+        Args:
+            max_batch_size (int): The largest batch per vectorized call.
+            max_wait (float): The longest a request waits for its batch to fill, in seconds.
+            max_pending (int): The most requests outstanding per operation before callers wait.
+            workers (int): Threads in the worker pool; defaults to the number of CPUs.
+            executor (concurrent.futures.Executor): A pool to use instead, e.g. a
+                ProcessPoolExecutor. It is not shut down by close().
+            operations (dict): Operation name -> batch handler; defaults to OPERATIONS.
+        """
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.stats = LatencyStats()
+        self.batchers = {
+            name: MicroBatcher(handler, max_batch_size, max_wait, max_pending, self.executor, self.stats)
+            for name, handler in (operations or OPERATIONS).items()
+        }
+        self._server = None
+
+    def _batcher(self, operation: str) -> MicroBatcher:
+        try:
+            return self.batchers[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+
+    async def request(self, operation: str, *args):
+        """
+        Runs one query in-process.
+
+        Args:
+            operation (str): A key of OPERATIONS: "map", "distance" or "intersect".
+            *args: The request, e.g. (point, spinor) for "map".
+
+        Returns:
+            The query's result.
+
+        Raises:
+            ValueError: If the operation is unknown.
+        """
+        return await self._batcher(operation).submit(args)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Starts accepting connections.
+
+        Args:
+            host (str): The interface to bind; localhost by default.
+            port (int): The port; 0 picks a free one.
+
+        Returns:
+            tuple: The (host, port) the service listens on.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def _handle_connection(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        replies = set()
+
+        async def reply(message_id, future):
+            try:
+                message = {"id": message_id, "result": await future}
+            except Exception as e:
+                message = {"id": message_id, "error": str(e)}
+            try:
+                data = _encode(message)
+            except Exception as e:
+                data = _encode({"id": message_id, "error": f"Cannot encode the result: {e}"})
+            writer.write(data)
+            await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                message_id = None
+                try:
+                    message = _decode(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("Each request must be a JSON object")
+                    message_id = message.get("id")
+                    if not isinstance(message.get("args"), list):
+                        raise ValueError('The request needs an "args" array')
+                    # Waiting here for queue space stops reading from the socket, so a
+                    # saturated service pushes back on the client through TCP.
+                    future = await self._batcher(message.get("op")).enqueue(tuple(message["args"]))
+                except Exception as e:
+                    # A malformed line only fails itself; the connection and its queued replies survive.
+                    future = loop.create_future()
+                    future.set_exception(e)
+                task = loop.create_task(reply(message_id, future))
+                replies.add(task)
+                task.add_done_callback(replies.discard)
+        except ConnectionError:
+            pass
+        finally:
+            if replies:
+                await asyncio.gather(*replies, return_exceptions=True)
+            writer.close()
+
+    async def close(self):
+        """Stops listening, finishes queued requests and shuts down the worker pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for batcher in self.batchers.values():
+            await batcher.close()
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+class ServiceClient:
+    """A localhost client for TwistorService, pipelining many requests over one connection."""
+
+    def __init__(self, reader, writer):
+        """Wraps an open connection; use ServiceClient.connect instead."""
+        self._reader = reader
+        self._writer = writer
+        self._futures = {}
+        self._next_id = 0
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 0) -> "ServiceClient":
+        """Opens a connection to a running service."""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            while line := await self._reader.readline():
+                message = _decode(line)
+                future = self._futures.pop(message.get("id"), None)
+                if future is None:
+                    continue
+                if "error" in message:
+                    future.set_exception(RuntimeError(message["error"]))
+                else:
+                    future.set_result(message["result"])
+        finally:
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("The service closed the connection"))
+            self._futures.clear()
+
+    async def request(self, operation: str, *args):
+        """
+        Sends one query and waits for its result.
+
+        Args:
+            operation (str): The operation name, see TwistorService.request.
+            *args: The request.
+
+        Returns:
+            The query's result; complex numbers come back as complex.
+
+        Raises:
+            RuntimeError: If the service reported an error.
+        """
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._futures[self._next_id] = future
+        self._writer.write(_encode({"id": self._next_id, "op": operation, "args": args}))
+        await self._writer.drain()
+        return await future
+
+    async def close(self):
+        """Closes the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
+        await asyncio.gather(self._receiver, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
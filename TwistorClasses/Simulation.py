@@ -0,0 +1,319 @@
+import os
+import numpy as np
+from TwistorClasses.QuaternionArray import QuaternionArray
+from TwistorClasses.RotationBatch import rotation_matrices
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch
+from TwistorClasses.EventStream import TwistorStreamWriter
+
+def euler_step(derivative, t: float, y: np.ndarray, dt: float) -> np.ndarray:
+    """
+    Advances y' = derivative(t, y) by one explicit Euler step.
+
+    Args:
+        derivative (callable): Returns the time derivative of the whole state array.
+        t (float): The current time.
+        y (np.ndarray): The current state, e.g. the (N, 6) phase array of a Simulation.
+        dt (float): The step size.
+
+    Returns:
+        np.ndarray: The state at t + dt.
+    """
+    return y + dt * derivative(t, y)
+
+def rk4_step(derivative, t: float, y: np.ndarray, dt: float) -> np.ndarray:
+    """
+    Advances y' = derivative(t, y) by one classical fourth-order Runge-Kutta step.
+
+    Args:
+        derivative (callable): Returns the time derivative of the whole state array.
+        t (float): The current time.
+        y (np.ndarray): The current state.
+        dt (float): The step size.
+
+    Returns:
+        np.ndarray: The state at t + dt.
+    """
+    half = dt / 2
+    k1 = derivative(t, y)
+    k2 = derivative(t + half, y + half * k1)
+    k3 = derivative(t + half, y + half * k2)
+    k4 = derivative(t + dt, y + dt * k3)
+    return y + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+def quaternion_attitude_step(attitudes: np.ndarray, angular_velocities: np.ndarray, dt: float) -> np.ndarray:
+    """
+    Rotates attitude quaternions by constant body-frame angular velocities over one step.
+
+    Each attitude is multiplied by the exact rotation exp(ω dt / 2), so a constant spin is
+    integrated without drift; the result is renormalized to stay on the unit sphere.
+
+    Args:
+        attitudes (np.ndarray): An (N, 4) array of unit (w, x, y, z) quaternions.
+        angular_velocities (np.ndarray): An (N, 3) array of angular velocities in radians per unit time.
+        dt (float): The step size.
+
+    Returns:
+        np.ndarray: The (N, 4) attitudes at t + dt.
+    """
+    speed = np.linalg.norm(angular_velocities, axis=1)
+    half_angle = speed * (dt / 2)
+    # sin(θ/2)/|ω| written with sinc so that resting particles need no special case.
+    scale = (dt / 2) * np.sinc(half_angle / np.pi)
+    increments = np.empty_like(attitudes)
+    increments[:, 0] = np.cos(half_angle)
+    increments[:, 1:] = angular_velocities * scale[:, None]
+    return QuaternionArray(attitudes).multiply(QuaternionArray(increments)).normalize().components
+
+INTEGRATORS = {"euler": euler_step, "rk4": rk4_step}
+
+def constant_acceleration(vector):
+    """
+    Returns an acceleration function for a uniform field such as gravity.
+
+    Args:
+        vector (array-like): The (x, y, z) acceleration shared by all particles.
+
+    Returns:
+        callable: acceleration(t, positions, velocities) -> (N, 3) array.
+    """
+    vector = np.asarray(vector, dtype=np.float64)
+    return lambda t, positions, velocities: np.broadcast_to(vector, positions.shape)
+
+def harmonic_acceleration(stiffness: float, center=(0.0, 0.0, 0.0), damping: float = 0.0):
+    """
+    Returns an acceleration function pulling every particle towards a center, a = -k (x - c) - γ v.
+
+    Args:
+        stiffness (float): The spring constant per unit mass k.
+        center (array-like): The (x, y, z) rest position c.
+        damping (float): The damping rate γ.
+
+    Returns:
+        callable: acceleration(t, positions, velocities) -> (N, 3) array.
+    """
+    center = np.asarray(center, dtype=np.float64)
+    return lambda t, positions, velocities: -stiffness * (positions - center) - damping * velocities
+
+class Simulation:
+    """Advances N particles in lockstep, with all state held in contiguous arrays.
+
+    Translational state lives in one (N, 6) phase array whose first three columns are the
+    positions and last three the velocities; attitudes are an (N, 4) array of (w, x, y, z)
+    quaternions with (N, 3) angular velocities. Every step updates all particles with a few
+    array operations instead of per-particle ProjectivePoint.rotate and twistor_mapping calls.
+    """
+
+    def __init__(self, positions, velocities=None, attitudes=None, angular_velocities=None,
+                 acceleration=None, angular_acceleration=None, integrator="rk4", time: float = 0.0):
+        """Initializes the simulation.
+
+        Args:
+            positions (array-like): An (N, 3) array of x, y, z positions.
+            velocities (array-like): An (N, 3) array; defaults to rest.
+            attitudes (array-like): An (N, 4) array of (w, x, y, z) quaternions; defaults to the identity.
+                They are normalized.
+            angular_velocities (array-like): An (N, 3) array of body-frame angular velocities; defaults to zero.
+            acceleration (callable): acceleration(t, positions, velocities) -> (N, 3); defaults to free motion.
+            angular_acceleration (callable): angular_acceleration(t, attitudes, angular_velocities) -> (N, 3);
+                defaults to constant spin.
+            integrator (str or callable): "euler", "rk4", or a function with the signature of rk4_step.
+            time (float): The initial time.
+
+        Raises:
+            ValueError: If the array shapes disagree or the integrator name is unknown.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("Positions must be an (N, 3) array")
+        count = len(positions)
+        self.phase = np.zeros((count, 6), dtype=np.float64)
+        self.phase[:, :3] = positions
+        if velocities is not None:
+            self.phase[:, 3:] = self._checked(velocities, (count, 3), "Velocities")
+        self.attitudes = np.zeros((count, 4), dtype=np.float64)
+        if attitudes is None:
+            self.attitudes[:, 0] = 1.0
+        else:
+            self.attitudes[:] = QuaternionArray(self._checked(attitudes, (count, 4), "Attitudes")).normalize().components
+        self.angular_velocities = np.zeros((count, 3), dtype=np.float64)
+        if angular_velocities is not None:
+            self.angular_velocities[:] = self._checked(angular_velocities, (count, 3), "Angular velocities")
+        if isinstance(integrator, str):
+            if integrator not in INTEGRATORS:
+                raise ValueError(f"Unknown integrator: {integrator}")
+            integrator = INTEGRATORS[integrator]
+        self.integrator = integrator
+        self.acceleration = acceleration
+        self.angular_acceleration = angular_acceleration
+        self.time = time
+        self.steps = 0
+
+    @staticmethod
+    def _checked(values, shape, name):
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape != shape:
+            raise ValueError(f"{name} must have shape {shape}")
+        return values
+
+    def __len__(self):
+        return len(self.phase)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """An (N, 3) view of the positions."""
+        return self.phase[:, :3]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """An (N, 3) view of the velocities."""
+        return self.phase[:, 3:]
+
+    def _derivative(self, t, phase):
+        derivative = np.empty_like(phase)
+        derivative[:, :3] = phase[:, 3:]
+        if self.acceleration is None:
+            derivative[:, 3:] = 0.0
+        else:
+            derivative[:, 3:] = self.acceleration(t, phase[:, :3], phase[:, 3:])
+        return derivative
+
+    def step(self, dt: float):
+        """
+        Advances every particle by dt.
+
+        Positions and velocities use the configured integrator; attitudes use
+        quaternion_attitude_step with the angular velocities at the start of the step,
+        which are then advanced by an Euler step when angular_acceleration is set.
+
+        Args:
+            dt (float): The step size.
+        """
+        self.phase[:] = self.integrator(self._derivative, self.time, self.phase, dt)
+        if self.angular_velocities.any():
+            self.attitudes[:] = quaternion_attitude_step(self.attitudes, self.angular_velocities, dt)
+        if self.angular_acceleration is not None:
+            self.angular_velocities += dt * self.angular_acceleration(self.time, self.attitudes, self.angular_velocities)
+        self.time += dt
+        self.steps += 1
+
+    def run(self, steps: int, dt: float, recorder=None):
+        """
+        Advances the simulation by several steps.
+
+        Args:
+            steps (int): The number of steps.
+            dt (float): The step size.
+            recorder (SnapshotRecorder): If given, offered the state after every step; it keeps
+                every K-th one.
+        """
+        for _ in range(steps):
+            self.step(dt)
+            if recorder is not None:
+                recorder.maybe_record(self)
+
+    def spacetime_points(self) -> np.ndarray:
+        """Returns the (N, 4) spacetime events (t, x, y, z) of the particles at the current time."""
+        points = np.empty((len(self), 4), dtype=np.float64)
+        points[:, 0] = self.time
+        points[:, 1:] = self.positions
+        return points
+
+    def twistors(self, spinors) -> np.ndarray:
+        """
+        Maps the particles' current events to twistor space.
+
+        Args:
+            spinors (array-like): An (M, 2) array of λ spinors.
+
+        Returns:
+            np.ndarray: An (N, M, 4) complex128 twistor array, see twistor_mapping_batch.
+        """
+        return twistor_mapping_batch(self.spacetime_points(), spinors)
+
+    def body_to_world(self, body_points) -> np.ndarray:
+        """
+        Places body-frame points on every particle, rotated by its attitude and moved to its position.
+
+        Args:
+            body_points (array-like): A (P, 3) array of points in the body frame.
+
+        Returns:
+            np.ndarray: An (N, P, 3) array of world-frame points.
+        """
+        body_points = np.asarray(body_points, dtype=np.float64)
+        rotated = np.einsum("nij,pj->npi", rotation_matrices(self.attitudes), body_points)
+        return rotated + self.positions[:, None, :]
+
+class SnapshotRecorder:
+    """Streams every K-th simulation state to .npy files in a directory.
+
+    Each recorded field becomes one file of shape (snapshots, N, ...) written through
+    TwistorStreamWriter, so long runs never hold more than one snapshot in memory. A
+    times.npy file lists the time of every snapshot. All files can be opened with
+    np.load(path, mmap_mode="r") once the recorder is closed. If a with block exits with an
+    exception, the recorder is aborted instead: the field files are left without headers and
+    times.npy is not written, so a partial run is never mistaken for a complete one.
+    """
+
+    FIELDS = ("positions", "velocities", "attitudes", "angular_velocities")
+
+    def __init__(self, directory, every: int = 1, fields=("positions", "velocities", "attitudes"), spinors=None):
+        """Initializes the recorder.
+
+        Args:
+            directory (str): The output directory, created if missing.
+            every (int): Keep one state in every this many steps.
+            fields (iterable of str): Which of FIELDS to record.
+            spinors (array-like): If given, also records the particles' twistors against these
+                (M, 2) spinors in twistors.npy.
+        """
+        if every <= 0:
+            raise ValueError("every must be positive")
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown snapshot fields: {sorted(unknown)}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.every = every
+        self.fields = tuple(fields)
+        self.spinors = None if spinors is None else np.asarray(spinors, dtype=np.complex128)
+        self.times = []
+        self.failed = False
+        self._writers = {name: TwistorStreamWriter(os.path.join(directory, f"{name}.npy"), np.float64)
+                         for name in self.fields}
+        if self.spinors is not None:
+            self._writers["twistors"] = TwistorStreamWriter(os.path.join(directory, "twistors.npy"))
+
+    def maybe_record(self, simulation: Simulation):
+        """Records the simulation's state if its step count is a multiple of every."""
+        if simulation.steps % self.every == 0:
+            self.record(simulation)
+
+    def record(self, simulation: Simulation):
+        """Appends the simulation's current state as one snapshot."""
+        for name in self.fields:
+            self._writers[name].write(getattr(simulation, name)[None])
+        if self.spinors is not None:
+            self._writers["twistors"].write(simulation.twistors(self.spinors)[None])
+        self.times.append(simulation.time)
+
+    def close(self):
+        """Finalizes every file and writes times.npy."""
+        for writer in self._writers.values():
+            writer.close()
+        np.save(os.path.join(self.directory, "times.npy"), np.asarray(self.times, dtype=np.float64))
+
+    def abort(self):
+        """Closes every file without finalizing it and marks the recorder as failed."""
+        self.failed = True
+        for writer in self._writers.values():
+            writer.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
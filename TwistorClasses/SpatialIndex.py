@@ -0,0 +1,274 @@
+import heapq
+import numpy as np
+
+class SpatialIndex:
+    """A KD-tree over ProjectivePoint coordinates for nearest-neighbour and radius queries.
+
+    Each point is embedded as the real 6-vector (Re x, Im x, Re y, Im y, Re z, Im z) of its
+    affine coordinates (x/w, y/w, z/w), as in ProjectivePoint.to_cartesian, so distances are
+    Euclidean distances between affine positions and do not depend on the scale of (w, x, y, z).
+    With affine=False the raw x, y, z are embedded instead, and distances then equal
+    ProjectivePoint.distance_to.
+
+    Points at infinity (w = 0) have no affine position. Instead of raising, the index keeps
+    them in a separate bucket: they are listed by points_at_infinity() and never returned
+    by distance queries.
+
+    Inserted points go to a small unindexed buffer and deleted points are tombstoned; the
+    tree is rebuilt once either exceeds rebuild_fraction of the indexed size.
+    """
+
+    def __init__(self, coords=None, affine: bool = True, leaf_size: int = 32, rebuild_fraction: float = 0.25):
+        """Initializes the index, optionally bulk-building it from coordinates.
+
+        Args:
+            coords (array-like): Optional (N, 4) complex array of homogeneous (w, x, y, z) coordinates.
+            affine (bool): If True, index affine coordinates (x/w, y/w, z/w); otherwise index raw x, y, z.
+            leaf_size (int): The maximum number of points stored in a tree leaf.
+            rebuild_fraction (float): The fraction of buffered inserts or deletes that triggers a rebuild.
+        """
+        if leaf_size <= 0:
+            raise ValueError("leaf_size must be positive")
+        self.affine = affine
+        self.leaf_size = leaf_size
+        self.rebuild_fraction = rebuild_fraction
+        self._data = np.empty((0, 6), dtype=np.float64)
+        self._alive = np.empty(0, dtype=bool)
+        self._finite = np.empty(0, dtype=bool)
+        self._count = 0
+        self._size = 0
+        self._buffer = []
+        self._deleted_since_build = 0
+        self._build_tree()
+        if coords is not None:
+            self.build(coords)
+
+    def __len__(self):
+        """Returns the number of live points, including points at infinity."""
+        return self._size
+
+    def _embed(self, coords):
+        """Converts (N, 4) homogeneous coordinates into (N, 6) real features and a finite mask."""
+        coords = np.asarray(coords, dtype=np.complex128)
+        if coords.ndim != 2 or coords.shape[1] != 4:
+            raise ValueError("Coordinates must be an (N, 4) array of homogeneous (w, x, y, z) values")
+        xyz = coords[:, 1:]
+        finite = np.ones(len(coords), dtype=bool)
+        if self.affine:
+            finite = coords[:, 0] != 0
+            xyz = np.zeros_like(xyz)
+            np.divide(coords[:, 1:], coords[:, :1], out=xyz, where=finite[:, None])
+        return np.ascontiguousarray(xyz).view(np.float64).reshape(len(coords), 6), finite
+
+    def _reserve(self, extra):
+        needed = self._count + extra
+        if needed <= len(self._data):
+            return
+        capacity = max(needed, 2 * len(self._data), 16)
+        for name in ("_data", "_alive", "_finite"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
+
+    def build(self, coords) -> np.ndarray:
+        """
+        Bulk-inserts points and rebuilds the tree once.
+
+        Args:
+            coords (array-like): An (N, 4) complex array of homogeneous (w, x, y, z) coordinates.
+
+        Returns:
+            np.ndarray: The integer ids assigned to the new points.
+        """
+        features, finite = self._embed(coords)
+        ids = self._append(features, finite)
+        self._build_tree()
+        return ids
+
+    def _append(self, features, finite):
+        self._reserve(len(features))
+        ids = np.arange(self._count, self._count + len(features))
+        self._data[ids] = features
+        self._finite[ids] = finite
+        self._alive[ids] = True
+        self._count += len(features)
+        self._size += len(features)
+        return ids
+
+    def insert(self, coord) -> int:
+        """
+        Inserts a single point.
+
+        Args:
+            coord (array-like): The (w, x, y, z) coordinates of the point.
+
+        Returns:
+            int: The id assigned to the point.
+        """
+        features, finite = self._embed(np.asarray(coord, dtype=np.complex128).reshape(1, 4))
+        point_id = int(self._append(features, finite)[0])
+        if finite[0]:
+            self._buffer.append(point_id)
+            self._maybe_rebuild()
+        return point_id
+
+    def delete(self, point_id: int):
+        """
+        Removes a point from the index.
+
+        Args:
+            point_id (int): The id returned by build or insert.
+
+        Raises:
+            KeyError: If the id is unknown or already deleted.
+        """
+        if not 0 <= point_id < self._count or not self._alive[point_id]:
+            raise KeyError(f"No live point with id {point_id}")
+        self._alive[point_id] = False
+        self._size -= 1
+        self._deleted_since_build += 1
+        self._maybe_rebuild()
+
+    def points_at_infinity(self) -> np.ndarray:
+        """Returns the ids of live points with w = 0 (always empty when affine is False)."""
+        return np.flatnonzero(self._alive[:self._count] & ~self._finite[:self._count])
+
+    def _maybe_rebuild(self):
+        threshold = max(self.leaf_size, self.rebuild_fraction * len(self._tree_ids))
+        if len(self._buffer) > threshold or self._deleted_since_build > threshold:
+            self._build_tree()
+
+    def _build_tree(self):
+        """Rebuilds the KD-tree over every live finite point."""
+        ids = np.flatnonzero(self._alive[:self._count] & self._finite[:self._count])
+        self._tree_ids = ids
+        self._buffer = []
+        self._deleted_since_build = 0
+        self._lo, self._hi, self._start, self._end, self._left, self._right = [], [], [], [], [], []
+        if len(ids):
+            self._split(0, len(ids))
+        self._lo = np.array(self._lo).reshape(-1, 6)
+        self._hi = np.array(self._hi).reshape(-1, 6)
+
+    def _split(self, start, end) -> int:
+        """Recursively builds the subtree over tree_ids[start:end] and returns its node number."""
+        points = self._data[self._tree_ids[start:end]]
+        node = len(self._start)
+        self._lo.append(points.min(axis=0))
+        self._hi.append(points.max(axis=0))
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        if end - start > self.leaf_size:
+            dim = int(np.argmax(self._hi[node] - self._lo[node]))
+            mid = (end - start) // 2
+            order = np.argpartition(points[:, dim], mid)
+            self._tree_ids[start:end] = self._tree_ids[start:end][order]
+            self._left[node] = self._split(start, start + mid)
+            self._right[node] = self._split(start + mid, end)
+        return node
+
+    def _box_distance_sq(self, node, q) -> float:
+        gap = np.maximum(np.maximum(self._lo[node] - q, q - self._hi[node]), 0.0)
+        return float(gap @ gap)
+
+    def _candidates(self, ids, q):
+        """Returns (squared distances, ids) of the live points among ids."""
+        ids = ids[self._alive[ids]]
+        diff = self._data[ids] - q
+        return np.einsum("ij,ij->i", diff, diff), ids
+
+    def _query_point(self, coord):
+        features, finite = self._embed(np.asarray(coord, dtype=np.complex128).reshape(1, 4))
+        return features[0], bool(finite[0])
+
+    def query(self, coord, k: int = 1):
+        """
+        Finds the k nearest finite points to a query point.
+
+        Args:
+            coord (array-like): The (w, x, y, z) coordinates of the query point.
+            k (int): The number of neighbours to return.
+
+        Returns:
+            tuple: (distances, ids) as arrays sorted by distance. Fewer than k entries are
+                returned if the index holds fewer finite points, and none if the query
+                point is at infinity.
+        """
+        q, finite = self._query_point(coord)
+        best = []  # max-heap of (-distance_sq, id)
+        if not finite or k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+
+        def offer(dist_sq, ids):
+            for d, i in zip(dist_sq.tolist(), ids.tolist()):
+                if len(best) < k:
+                    heapq.heappush(best, (-d, i))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, i))
+
+        if self._buffer:
+            offer(*self._candidates(np.array(self._buffer), q))
+        heap = [(self._box_distance_sq(0, q), 0)] if len(self._tree_ids) else []
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if len(best) == k and bound >= -best[0][0]:
+                break
+            if self._left[node] < 0:
+                offer(*self._candidates(self._tree_ids[self._start[node]:self._end[node]], q))
+            else:
+                for child in (self._left[node], self._right[node]):
+                    heapq.heappush(heap, (self._box_distance_sq(child, q), child))
+
+        best.sort(key=lambda item: -item[0])
+        distances = np.sqrt(np.array([-d for d, _ in best], dtype=np.float64))
+        return distances, np.array([i for _, i in best], dtype=np.intp)
+
+    def query_radius(self, coord, radius: float):
+        """
+        Finds every finite point within a distance of a query point.
+
+        Args:
+            coord (array-like): The (w, x, y, z) coordinates of the query point.
+            radius (float): The inclusive search radius.
+
+        Returns:
+            tuple: (distances, ids) as arrays sorted by distance, in the same order as query();
+                empty if the query point is at infinity.
+
+        Raises:
+            ValueError: If radius is negative.
+        """
+        if radius < 0:
+            raise ValueError("radius must be non-negative")
+        q, finite = self._query_point(coord)
+        if not finite:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        radius_sq = radius * radius
+        found_d, found_i = [], []
+
+        def collect(dist_sq, ids):
+            mask = dist_sq <= radius_sq
+            found_d.append(dist_sq[mask])
+            found_i.append(ids[mask])
+
+        if self._buffer:
+            collect(*self._candidates(np.array(self._buffer), q))
+        stack = [0] if len(self._tree_ids) else []
+        while stack:
+            node = stack.pop()
+            if self._box_distance_sq(node, q) > radius_sq:
+                continue
+            if self._left[node] < 0:
+                collect(*self._candidates(self._tree_ids[self._start[node]:self._end[node]], q))
+            else:
+                stack.extend((self._left[node], self._right[node]))
+
+        if not found_i:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        dist_sq = np.concatenate(found_d)
+        ids = np.concatenate(found_i)
+        order = np.argsort(dist_sq, kind="stable")
+        return np.sqrt(dist_sq[order]), ids[order]
@@ -0,0 +1,180 @@
+import json
+import numpy as np
+from TwistorClasses.PointArray import points_to_array, lines_to_array
+
+MAGIC = b"TWSTRCOL"
+VERSION = 1
+_ALIGNMENT = 64
+_ITEM_SIZE = 16
+
+COLUMN_LAYOUTS = {
+    "points": ("w", "x", "y", "z"),
+    "twistors": ("mu0", "mu1", "lambda0", "lambda1"),
+    "lines": ("a_w", "a_x", "a_y", "a_z", "b_w", "b_x", "b_y", "b_z"),
+}
+
+def _round_up(value, multiple):
+    return -(-value // multiple) * multiple
+
+def _as_rows(data, kind):
+    """Converts objects or arrays into a complex128 array with a trailing component axis."""
+    if isinstance(data, (list, tuple)) and not data:
+        return np.empty((0, 2, 4) if kind == "lines" else (0, 4), dtype=np.complex128)
+    if isinstance(data, (list, tuple)) and not isinstance(data[0], (list, tuple, np.ndarray)):
+        if kind == "points":
+            return points_to_array(data)
+        elif kind == "lines":
+            return lines_to_array(data)
+        else:
+            return np.array([[complex(c.rel, c.img) for c in t.mu.components + t.lambda_.components] for t in data],
+                            dtype=np.complex128)
+    return np.asarray(data, dtype=np.complex128)
+
+def save(path, data, kind: str, chunk_rows: int = None):
+    """
+    Writes a point, twistor or line set as contiguous complex128 columns in one bulk write.
+
+    Args:
+        path (str): The output file, overwritten if it exists.
+        data: An array of shape (..., 4) for points and twistors or (N, 2, 4) for lines, or a
+            list of ProjectivePoint, Twistor or ProjectiveLine objects. An empty list saves
+            an empty table.
+        kind (str): One of "points", "twistors" or "lines".
+        chunk_rows (int): If given, records a chunk index of this many rows for TwistorFile.chunk.
+
+    Raises:
+        ValueError: If kind is unknown, chunk_rows is not positive or data has the wrong
+            trailing shape.
+    """
+    if kind not in COLUMN_LAYOUTS:
+        raise ValueError(f"Unknown kind: {kind}")
+    if chunk_rows is not None and chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    rows = _as_rows(data, kind)
+    columns = COLUMN_LAYOUTS[kind]
+    trailing = (2, 4) if kind == "lines" else (4,)
+    if rows.shape[-len(trailing):] != trailing:
+        raise ValueError(f"{kind} data must have trailing shape {trailing}")
+    shape = rows.shape[:-len(trailing)]
+    table = rows.reshape(-1, len(columns))
+    count = len(table)
+    column_stride = _round_up(max(count, 1) * _ITEM_SIZE, _ALIGNMENT)
+
+    header = {
+        "version": VERSION,
+        "kind": kind,
+        "rows": count,
+        "shape": list(shape),
+        "columns": list(columns),
+        "dtype": "<c16",
+        "column_stride": column_stride,
+        "chunk_rows": chunk_rows,
+    }
+    encoded = json.dumps(header).encode("utf-8")
+    data_start = _round_up(len(MAGIC) + 4 + len(encoded), _ALIGNMENT)
+    encoded = encoded.ljust(data_start - len(MAGIC) - 4)
+
+    padding = b"\0" * (column_stride - count * _ITEM_SIZE)
+    with open(path, "wb") as handle:
+        handle.write(MAGIC + len(encoded).to_bytes(4, "little") + encoded)
+        for k in range(len(columns)):
+            np.ascontiguousarray(table[:, k], dtype="<c16").tofile(handle)
+            handle.write(padding)
+
+def save_points(path, points, chunk_rows: int = None):
+    """Writes (N, 4) homogeneous coordinates or a list of ProjectivePoints."""
+    save(path, points, "points", chunk_rows)
+
+def save_twistors(path, twistors, chunk_rows: int = None):
+    """Writes a (..., 4) twistor array (e.g. from twistor_mapping_batch) or a list of Twistors."""
+    save(path, twistors, "twistors", chunk_rows)
+
+def save_lines(path, lines, chunk_rows: int = None):
+    """Writes (N, 2, 4) line endpoints or a list of ProjectiveLines."""
+    save(path, lines, "lines", chunk_rows)
+
+class TwistorFile:
+    """A memory-mapped, read-only view of a file written by save.
+
+    Nothing is read until it is accessed: column, to_array, chunk and read_range all
+    return views into the memory map rather than copies.
+    """
+
+    def __init__(self, path):
+        """Opens a columnar file.
+
+        Args:
+            path (str): The file to open.
+
+        Raises:
+            ValueError: If the file is not in this format or has an unsupported version.
+        """
+        with open(path, "rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a twistor column file")
+            length = int.from_bytes(handle.read(4), "little")
+            self.header = json.loads(handle.read(length).decode("utf-8"))
+        if self.header["version"] > VERSION:
+            raise ValueError(f"Unsupported twistor column file version {self.header['version']}")
+        self.path = path
+        self.kind = self.header["kind"]
+        self.rows = self.header["rows"]
+        self.shape = tuple(self.header["shape"])
+        self.columns = tuple(self.header["columns"])
+        self.chunk_rows = self.header["chunk_rows"]
+        data_start = len(MAGIC) + 4 + length
+        self._block = np.memmap(path, dtype=self.header["dtype"], mode="r", offset=data_start,
+                                shape=(len(self.columns), self.header["column_stride"] // _ITEM_SIZE))
+
+    def __len__(self):
+        return self.rows
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns one contiguous column as a zero-copy (rows,) view."""
+        return self._block[self.columns.index(name), :self.rows]
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the data in its saved shape as a zero-copy strided view.
+
+        Returns:
+            np.ndarray: (..., 4) for points and twistors, (N, 2, 4) for lines. The view can be
+                passed straight to the batched APIs.
+        """
+        table = self._block[:, :self.rows].T
+        if self.kind == "lines":
+            return table.reshape(self.rows, 2, 4)
+        return table.reshape(self.shape + (4,))
+
+    def read_range(self, start: int, stop: int) -> np.ndarray:
+        """Returns rows start:stop of the flat (rows, columns) table as a zero-copy view."""
+        table = self._block[:, start:min(stop, self.rows)].T
+        if self.kind == "lines":
+            return table.reshape(-1, 2, 4)
+        return table
+
+    @property
+    def num_chunks(self) -> int:
+        """The number of chunks in the chunk index (1 if none was recorded)."""
+        if not self.chunk_rows:
+            return 1
+        return max(1, -(-self.rows // self.chunk_rows))
+
+    def chunk(self, index: int) -> np.ndarray:
+        """
+        Returns one chunk of rows from the chunk index.
+
+        Args:
+            index (int): The chunk number, 0 <= index < num_chunks.
+
+        Returns:
+            np.ndarray: A zero-copy view of the chunk's rows.
+        """
+        if not 0 <= index < self.num_chunks:
+            raise IndexError(f"Chunk {index} out of range")
+        size = self.chunk_rows or self.rows
+        return self.read_range(index * size, (index + 1) * size)
+
+def load(path) -> TwistorFile:
+    """Opens a columnar file written by save as a memory-mapped TwistorFile."""
+    return TwistorFile(path)
@@ -2,10 +2,14 @@ from TwistorClasses.ComplexNumber import ComplexNumber
 from TwistorClasses.ProjectivePoint import ProjectivePoint
 from TwistorClasses.ProjectiveLine import ProjectiveLine
 
+SQRT2 = 2**0.5
+
 class Spinor:
     """Represents a two-component Weyl spinor."""
+    __slots__ = ("components",)
+
     def __init__(self, component1: ComplexNumber, component2: ComplexNumber):
-        self.components = [component1, component2]
+        self.components = (component1, component2)
 
     def display(self):
         print(f"Spinor: [{self.components[0].rel} + {self.components[0].img}i, "
@@ -13,6 +17,8 @@ class Spinor:
 
 class Twistor:
     """Represents a twistor with components (mu, lambda)."""
+    __slots__ = ("mu", "lambda_")
+
     def __init__(self, mu: Spinor, lambda_: Spinor):
         self.mu = mu 
         self.lambda_ = lambda_ 
@@ -24,28 +30,36 @@ class Twistor:
 
 class ComplexMinkowskiPoint:
     """Represents a point in complexified Minkowski space using a 2x2 Hermitian matrix."""
+    __slots__ = ("matrix",)
+
     def __init__(self, t: float, x: float, y: float, z: float):
-        self.matrix = [
-            [ComplexNumber((t + z) / (2**0.5), 0), ComplexNumber(x / (2**0.5), y / (2**0.5))],
-            [ComplexNumber(x / (2**0.5), -y / (2**0.5)), ComplexNumber((t - z) / (2**0.5), 0)]
-        ]
+        x_scaled = x / SQRT2
+        y_scaled = y / SQRT2
+        self.matrix = (
+            (ComplexNumber((t + z) / SQRT2, 0), ComplexNumber(x_scaled, y_scaled)),
+            (ComplexNumber(x_scaled, -y_scaled), ComplexNumber((t - z) / SQRT2, 0))
+        )
 
     def display(self):
         print("Complexified Minkowski Point Matrix:")
         for row in self.matrix:
             print([f"({elem.rel} + {elem.img}i)" for elem in row])
 
-def twistor_mapping(minkowski_point: ComplexMinkowskiPoint, lambda_spinor: Spinor) -> Twistor:
+def twistor_mapping(minkowski_point: ComplexMinkowskiPoint, lambda_spinor: Spinor, cache=None) -> Twistor:
     """
     Maps a complexified Minkowski point to twistor space.
     
     Args:
         minkowski_point (ComplexMinkowskiPoint): The point in complexified Minkowski space.
         lambda_spinor (Spinor): The spinor representing λα.
+        cache (MappingCache): Optional cache consulted before computing, see MappingCache.
     
     Returns:
         Twistor: The twistor corresponding to the point.
     """
+    if cache is not None:
+        return cache.twistor_mapping(minkowski_point, lambda_spinor)
+
     mu_components = [
         minkowski_point.matrix[0][0] * lambda_spinor.components[0] +
         minkowski_point.matrix[0][1] * lambda_spinor.components[1],
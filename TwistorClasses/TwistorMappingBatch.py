@@ -0,0 +1,147 @@
+import numpy as np
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.TwistorMapping import Spinor, Twistor
+from TwistorClasses.Parallel import executor_scope, partition
+
+def minkowski_matrices(points) -> np.ndarray:
+    """
+    Builds the 2x2 Hermitian matrices of many spacetime points at once.
+
+    Args:
+        points (array-like): An (N, 4) array of real (t, x, y, z) coordinates.
+
+    Returns:
+        np.ndarray: An (N, 2, 2) complex128 array laid out like ComplexMinkowskiPoint.matrix.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 4:
+        raise ValueError("Points must be an (N, 4) array of (t, x, y, z) coordinates")
+    t, x, y, z = (points[:, k] / 2**0.5 for k in range(4))
+    matrices = np.empty((len(points), 2, 2), dtype=np.complex128)
+    matrices[:, 0, 0] = t + z
+    matrices[:, 0, 1] = x + 1j * y
+    matrices[:, 1, 0] = x - 1j * y
+    matrices[:, 1, 1] = t - z
+    return matrices
+
+def spinors_to_array(spinors) -> np.ndarray:
+    """
+    Packs a list of Spinor objects into an (M, 2) complex128 array.
+
+    Args:
+        spinors (list of Spinor): The spinors to pack.
+
+    Returns:
+        np.ndarray: The spinor components, one row per spinor.
+    """
+    return np.array([[complex(c.rel, c.img) for c in s.components] for s in spinors],
+                    dtype=np.complex128).reshape(len(spinors), 2)
+
+def twistors_to_array(twistors) -> np.ndarray:
+    """
+    Packs a list of Twistor objects into an (N, 4) complex128 array.
+
+    Args:
+        twistors (list of Twistor): The twistors to pack.
+
+    Returns:
+        np.ndarray: The (mu0, mu1, lambda0, lambda1) components, one row per twistor.
+    """
+    return np.array([[complex(c.rel, c.img) for c in t.mu.components + t.lambda_.components] for t in twistors],
+                    dtype=np.complex128).reshape(len(twistors), 4)
+
+def twistors_from_array(twistors) -> list:
+    """
+    Unpacks an array of twistor components into Twistor objects.
+
+    Args:
+        twistors (array-like): A (..., 4) array of (mu0, mu1, lambda0, lambda1) components.
+
+    Returns:
+        list of Twistor: One Twistor per row, in row-major order.
+    """
+    rows = np.asarray(twistors, dtype=np.complex128).reshape(-1, 4).tolist()
+    return [
+        Twistor(
+            mu=Spinor(ComplexNumber(mu0.real, mu0.imag), ComplexNumber(mu1.real, mu1.imag)),
+            lambda_=Spinor(ComplexNumber(l0.real, l0.imag), ComplexNumber(l1.real, l1.imag))
+        )
+        for mu0, mu1, l0, l1 in rows
+    ]
+
+def _map_block(points, spinors, out):
+    """Writes the twistors of a block of points against every spinor into out."""
+    matrices = minkowski_matrices(points)
+    lambda0 = spinors[:, 0]
+    lambda1 = spinors[:, 1]
+    np.add(matrices[:, 0, 0, None] * lambda0, matrices[:, 0, 1, None] * lambda1, out=out[:, :, 0])
+    np.add(matrices[:, 1, 0, None] * lambda0, matrices[:, 1, 1, None] * lambda1, out=out[:, :, 1])
+    out[:, :, 2] = lambda0
+    out[:, :, 3] = lambda1
+
+def _map_kernel(start, stop, points, spinors, out):
+    _map_block(points[start:stop], spinors, out)
+
+def _prepare(points, spinors):
+    points = np.asarray(points, dtype=np.float64)
+    spinors = np.asarray(spinors, dtype=np.complex128)
+    if points.ndim != 2 or points.shape[1] != 4:
+        raise ValueError("Points must be an (N, 4) array of (t, x, y, z) coordinates")
+    if spinors.ndim != 2 or spinors.shape[1] != 2:
+        raise ValueError("Spinors must be an (M, 2) array of complex components")
+    return points, spinors
+
+def twistor_mapping_batch(points, spinors, chunk_size: int = None, out=None, executor=None) -> np.ndarray:
+    """
+    Maps N spacetime points against M spinors to twistor space in one broadcasted pass.
+
+    Row (i, j) of the result equals twistor_mapping(ComplexMinkowskiPoint(*points[i]), spinors[j]).
+
+    Args:
+        points (array-like): An (N, 4) array of real (t, x, y, z) coordinates.
+        spinors (array-like): An (M, 2) array of complex λ spinor components.
+        chunk_size (int): If given, points are processed this many at a time so that
+            temporaries stay bounded by chunk_size x M.
+        out (np.ndarray): Optional preallocated (N, M, 4) complex128 array, e.g. a memory map.
+        executor: A backend accepted by Parallel.get_executor; chunks are mapped in parallel.
+            Without chunk_size the points are split evenly across the workers.
+
+    Returns:
+        np.ndarray: An (N, M, 4) complex128 array of (mu0, mu1, lambda0, lambda1) components.
+
+    Raises:
+        ValueError: If the inputs or out have the wrong shape, or chunk_size is not positive.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    points, spinors = _prepare(points, spinors)
+    shape = (len(points), len(spinors), 4)
+    if out is None:
+        out = np.empty(shape, dtype=np.complex128)
+    elif out.shape != shape:
+        raise ValueError(f"Output array must have shape {shape}")
+    with executor_scope(executor) as backend:
+        blocks = partition(len(points), chunk_size, parts=backend.workers)
+        return backend.run(_map_kernel, blocks, (points, spinors), out)
+
+def iter_twistor_mapping_batch(points, spinors, chunk_size: int):
+    """
+    Lazily maps spacetime points to twistor space, one chunk of points at a time.
+
+    Args:
+        points (array-like): An (N, 4) array of real (t, x, y, z) coordinates.
+        spinors (array-like): An (M, 2) array of complex λ spinor components.
+        chunk_size (int): The number of points mapped per chunk.
+
+    Yields:
+        tuple: (start, block) where block is the (chunk, M, 4) twistor array for
+            points[start:start + chunk].
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    points, spinors = _prepare(points, spinors)
+    for start in range(0, len(points), chunk_size):
+        block = points[start:start + chunk_size]
+        out = np.empty((len(block), len(spinors), 4), dtype=np.complex128)
+        _map_block(block, spinors, out)
+        yield start, out
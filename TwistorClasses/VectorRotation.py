@@ -1,9 +1,11 @@
-from Quaternion import Quaternion
+from TwistorClasses.Quaternion import Quaternion
 from math import acos
 
 class VectorRotation:
     """Represents a vector in quaternion form and applies quaternion-based rotations."""
 
+    __slots__ = ("vector_q",)
+
     def __init__(self, x, y, z):
         """Initializes a vector as a quaternion with a zero scalar component.
         
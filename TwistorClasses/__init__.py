@@ -0,0 +1,87 @@
+"""Twistor theory with complex numbers, quaternions and projective geometry.
+
+Importing the package is cheap: submodules and the names below are loaded on first
+attribute access (PEP 562), so a plain scalar import such as
+
+    from TwistorClasses.ComplexNumber import ComplexNumber
+
+never imports NumPy. Only the array-backed modules (TwistorMappingBatch, DistanceMatrix,
+Simulation, ...) need it, and only when they are used.
+
+Classes that share their module's name (ComplexNumber, Quaternion, ProjectivePoint, ...)
+are reached through the module, as everywhere else in the package; TwistorClasses.Quaternion
+is the module and TwistorClasses.Quaternion.Quaternion the class.
+"""
+import importlib
+
+SUBMODULES = (
+    "ComplexBatch", "ComplexNumber", "ConformalGroup", "DistanceMatrix", "EventStream",
+    "Instrumentation", "InverseMapping", "LazyExpression", "LineIntersection", "MappingCache",
+    "NullDirections", "Parallel", "PointArray", "ProjectiveLine", "ProjectivePoint",
+    "ProjectiveTransform", "Quaternion", "QuaternionArray", "RotationBatch", "Service",
+    "Simulation", "SpatialIndex", "TwistorFile", "TwistorMapping", "TwistorMappingBatch", "VectorRotation",
+)
+
+# Submodules that need NumPy. The scalar classes must stay out of this list.
+NUMPY_SUBMODULES = frozenset(SUBMODULES) - {
+    "ComplexNumber", "Quaternion", "ProjectivePoint", "ProjectiveLine", "TwistorMapping",
+    "VectorRotation", "MappingCache", "Instrumentation",
+}
+
+# Name exported from the package -> submodule defining it.
+_EXPORTS = {
+    "Spinor": "TwistorMapping",
+    "Twistor": "TwistorMapping",
+    "ComplexMinkowskiPoint": "TwistorMapping",
+    "twistor_mapping": "TwistorMapping",
+    "LRUCache": "MappingCache",
+    "Profiler": "Instrumentation",
+    "points_to_array": "PointArray",
+    "array_to_points": "PointArray",
+    "lines_to_array": "PointArray",
+    "array_to_lines": "PointArray",
+    "twistor_mapping_batch": "TwistorMappingBatch",
+    "iter_twistor_mapping_batch": "TwistorMappingBatch",
+    "twistors_to_array": "TwistorMappingBatch",
+    "twistors_from_array": "TwistorMappingBatch",
+    "inverse_twistor_mapping": "InverseMapping",
+    "inverse_twistor_mapping_batch": "InverseMapping",
+    "distance_matrix": "DistanceMatrix",
+    "find_intersections": "LineIntersection",
+    "lines_meet": "LineIntersection",
+    "exact_lines_meet": "LineIntersection",
+    "ConformalTransform": "ConformalGroup",
+    "LightConeSampler": "NullDirections",
+    "SnapshotRecorder": "Simulation",
+    "TwistorStreamWriter": "EventStream",
+    "stream_events_to_twistors": "EventStream",
+    "get_executor": "Parallel",
+    "TwistorService": "Service",
+    "ServiceClient": "Service",
+    "compile_expression": "LazyExpression",
+    "trace": "LazyExpression",
+}
+
+__all__ = list(SUBMODULES) + list(_EXPORTS)
+
+def _import(name):
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name == "numpy" and name in NUMPY_SUBMODULES:
+            raise ImportError(f"{__name__}.{name} requires NumPy, which is not installed") from e
+        raise
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(_import(_EXPORTS[name]), name)
+    elif name in SUBMODULES:
+        value = _import(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,107 @@
+"""Measures cold-import latency of TwistorClasses with python -X importtime.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 20 --output import.json
+
+Each target is imported --repeat times in a fresh interpreter; the median cumulative
+import time of the target itself (excluding interpreter startup) is reported, along with
+the number of modules it pulled in. The scalar targets must not import NumPy and must
+load within --budget-ms; the script exits with status 1 if either check fails, so it can
+guard startup time in CI. Array-backed targets are listed for reference only.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+# (module, scalar): scalar targets are checked against the budget and must not load NumPy.
+TARGETS = (
+    ("TwistorClasses", True),
+    ("TwistorClasses.ComplexNumber", True),
+    ("TwistorClasses.Quaternion", True),
+    ("TwistorClasses.ProjectiveLine", True),
+    ("TwistorClasses.TwistorMapping", True),
+    ("TwistorClasses.TwistorMappingBatch", False),
+    ("TwistorClasses.Simulation", False),
+)
+DEFAULT_BUDGET_MS = 20.0
+DEFAULT_REPEAT = 7
+
+def _root():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_once(module: str) -> dict:
+    """
+    Imports a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module (str): The dotted module name.
+
+    Returns:
+        dict: "cumulative_us" of the module, "modules" (every module the process imported) and
+            "numpy" (whether NumPy was imported).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=_root(), check=True,
+    )
+    cumulative = None
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        name = name.strip()
+        modules.append(name)
+        if name == module:
+            cumulative = int(cumulative_us)
+    if cumulative is None:
+        raise RuntimeError(f"{module} did not appear in the -X importtime output")
+    return {"cumulative_us": cumulative, "modules": modules, "numpy": "numpy" in modules}
+
+def measure(module: str, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Returns the median import time in ms, the module count and whether NumPy was loaded."""
+    runs = [import_once(module) for _ in range(repeat)]
+    return {
+        "median_ms": statistics.median(run["cumulative_us"] for run in runs) / 1e3,
+        "min_ms": min(run["cumulative_us"] for run in runs) / 1e3,
+        "modules": len(runs[0]["modules"]),
+        "numpy": runs[0]["numpy"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="maximum median import time of each scalar target")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    failures = []
+    print(f"{'module':<36} {'median ms':>10} {'min ms':>10} {'modules':>8} {'numpy':>6}")
+    for module, scalar in TARGETS:
+        result = results[module] = measure(module, args.repeat)
+        print(f"{module:<36} {result['median_ms']:>10.2f} {result['min_ms']:>10.2f} "
+              f"{result['modules']:>8} {'yes' if result['numpy'] else 'no':>6}")
+        if scalar and result["numpy"]:
+            failures.append(f"{module} imports NumPy")
+        if scalar and result["median_ms"] > args.budget_ms:
+            failures.append(f"{module} took {result['median_ms']:.2f} ms, over the {args.budget_ms} ms budget")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "budget_ms": args.budget_ms, "results": results},
+                      f, indent=2)
+            f.write("\n")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compares eager ComplexNumber/Quaternion evaluation with compiled lazy expressions.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_lazy_expression --count 100000
+
+Two expressions are timed: the rotation q * p * q^-1 used by ProjectivePoint.rotate and
+the incidence products of twistor_mapping. The eager rows loop over objects; the lazy
+rows trace the same code once with LazyExpression.trace and evaluate it over arrays.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.LazyExpression import COMPLEX, QUATERNION, trace
+
+def rotate(q, p):
+    return q * p * q.inverse()
+
+def incidence(m00, m01, m10, m11, l0, l1):
+    return m00 * l0 + m01 * l1, m10 * l0 + m11 * l1
+
+def _time(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def run(count, seed=0):
+    """Returns {label: seconds} for the eager and compiled versions of both expressions."""
+    rng = np.random.default_rng(seed)
+    q_array, p_array = rng.normal(size=(count, 4)), rng.normal(size=(count, 4))
+    quaternions = [Quaternion(*row) for row in q_array.tolist()]
+    points = [Quaternion(*row) for row in p_array.tolist()]
+    complex_arrays = {name: rng.normal(size=count) + 1j * rng.normal(size=count)
+                      for name in ("m00", "m01", "m10", "m11", "l0", "l1")}
+    complex_objects = {name: [ComplexNumber(v.real, v.imag) for v in values.tolist()]
+                       for name, values in complex_arrays.items()}
+
+    start = time.perf_counter()
+    compiled_rotate = trace(rotate, q=QUATERNION, p=QUATERNION)
+    compiled_incidence = trace(incidence, **{name: COMPLEX for name in complex_arrays})
+    compile_time = time.perf_counter() - start
+
+    columns = [complex_objects[name] for name in ("m00", "m01", "m10", "m11", "l0", "l1")]
+    return {
+        "compile (both)": compile_time,
+        "rotate eager": _time(lambda: [rotate(q, p) for q, p in zip(quaternions, points)]),
+        "rotate compiled": _time(lambda: compiled_rotate(q=q_array, p=p_array)),
+        "incidence eager": _time(lambda: [incidence(*row) for row in zip(*columns)]),
+        "incidence compiled": _time(lambda: compiled_incidence(**complex_arrays)),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    for label, seconds in run(args.count).items():
+        print(f"{label:<20} {seconds * 1e3:10.2f} ms")
+
+if __name__ == "__main__":
+    main()
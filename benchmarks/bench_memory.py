@@ -0,0 +1,94 @@
+"""Reports resident bytes per point for in-memory ProjectivePoint and twistor sets.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory --points 100000
+
+The "dict" rows rebuild the original per-instance __dict__ layout so the slotted
+classes can be compared against it in the same interpreter.
+"""
+import argparse
+import random
+import tracemalloc
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, Twistor
+
+class _DictComplexNumber:
+    def __init__(self, rel, img):
+        self.rel = rel
+        self.img = img
+
+class _DictProjectivePoint:
+    def __init__(self, w, x, y, z):
+        self.w = w
+        self.x = x
+        self.y = y
+        self.z = z
+
+class _DictSpinor:
+    def __init__(self, component1, component2):
+        self.components = [component1, component2]
+
+class _DictTwistor:
+    def __init__(self, mu, lambda_):
+        self.mu = mu
+        self.lambda_ = lambda_
+
+def _measure(build, count):
+    """Returns the bytes per item retained by build(count)."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    items = build(count)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del items
+    return retained / count
+
+def _values(count, seed=0):
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(count)]
+
+def _points(complex_cls, point_cls, values):
+    return [
+        point_cls(complex_cls(v[0], v[1]), complex_cls(v[2], v[3]), complex_cls(v[4], v[5]), complex_cls(v[6], v[7]))
+        for v in values
+    ]
+
+def _twistors(complex_cls, spinor_cls, twistor_cls, values):
+    return [
+        twistor_cls(spinor_cls(complex_cls(v[0], v[1]), complex_cls(v[2], v[3])),
+                    spinor_cls(complex_cls(v[4], v[5]), complex_cls(v[6], v[7])))
+        for v in values
+    ]
+
+def _array(np, values):
+    return np.array(values, dtype=np.float64).view(np.complex128)
+
+def run(count):
+    """Measures every layout and returns a list of (label, bytes_per_item) rows."""
+    values = _values(count)
+    rows = [
+        ("ProjectivePoint (dict)", _measure(lambda n: _points(_DictComplexNumber, _DictProjectivePoint, values), count)),
+        ("ProjectivePoint (slots)", _measure(lambda n: _points(ComplexNumber, ProjectivePoint, values), count)),
+        ("Twistor (dict)", _measure(lambda n: _twistors(_DictComplexNumber, _DictSpinor, _DictTwistor, values), count)),
+        ("Twistor (slots)", _measure(lambda n: _twistors(ComplexNumber, Spinor, Twistor, values), count)),
+        ("ComplexMinkowskiPoint (slots)", _measure(lambda n: [ComplexMinkowskiPoint(*v[:4]) for v in values], count)),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        return rows
+    rows.append(("complex128 array row", _measure(lambda n: _array(np, values), count)))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100_000)
+    args = parser.parse_args()
+    for label, per_item in run(args.points):
+        print(f"{label:<32} {per_item:10.1f} bytes/point")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compares the float64, float32, mixed and exact backends of the line intersection tests.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_precision --lines 10000 --pairs 100000
+
+Lines are random, with one in ten planted to meet its neighbour and a share of pairs
+placed near the tolerance and of lines with nearly coincident endpoints, which float64
+cannot decide reliably. Every backend is checked against exact_lines_meet.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from TwistorClasses.LineIntersection import DEFAULT_TOLERANCE, exact_lines_meet, find_intersections, lines_meet
+
+def _lines(rng, count):
+    return rng.normal(size=(count, 2, 4)) + 1j * rng.normal(size=(count, 2, 4))
+
+def make_pairs(count, tolerance, seed=0):
+    """Returns (K, 2, 4) endpoint arrays of pairs: a third meet, a third near-miss, a tenth ill-conditioned."""
+    rng = np.random.default_rng(seed)
+    a, b = _lines(rng, count), _lines(rng, count)
+    meet = rng.random(count) < 1 / 3
+    near = ~meet & (rng.random(count) < 0.5)
+    through = a[:, 0] * rng.normal(size=(count, 1)) + a[:, 1] * rng.normal(size=(count, 1))
+    b[meet, 0] = through[meet]
+    offsets = tolerance * 10 ** rng.uniform(-1, 1, size=(count, 1)) * rng.normal(size=(count, 4))
+    b[near, 0] = (through + offsets)[near]
+    ill = rng.random(count) < 0.1
+    a[ill, 1] = a[ill, 0] + 1e-9 * rng.normal(size=(ill.sum(), 4))
+    b[ill, 0] = a[ill, 1]
+    return a, b
+
+def make_lines(count, seed=0):
+    """Returns (N, 2, 4) endpoints where every tenth line meets the next one."""
+    lines = _lines(np.random.default_rng(seed), count)
+    lines[1::10, 0] = lines[0::10, 0][:len(lines[1::10])] - 0.5 * lines[0::10, 1][:len(lines[1::10])]
+    return lines
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=10_000, help="lines for the all-pairs search")
+    parser.add_argument("--pairs", type=int, default=100_000, help="pairs for the row-wise test")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    a, b = make_pairs(args.pairs, args.tolerance)
+    exact, exact_time = _timed(lambda: exact_lines_meet(a, b, args.tolerance))
+    print(f"row-wise lines_meet over {args.pairs} pairs")
+    print(f"{'precision':<10} {'ms':>10} {'wrong':>8} {'exact evals':>12}")
+    print(f"{'exact':<10} {exact_time * 1e3:>10.1f} {0:>8} {args.pairs:>12}")
+    for precision in ("float64", "float32", "mixed"):
+        (meets, refined), seconds = _timed(lambda: lines_meet(a, b, args.tolerance, precision, return_refined=True))
+        print(f"{precision:<10} {seconds * 1e3:>10.1f} {int((meets != exact).sum()):>8} {len(refined):>12}")
+
+    lines = make_lines(args.lines)
+    print(f"\nall-pairs find_intersections over {args.lines} lines")
+    print(f"{'precision':<10} {'ms':>10} {'pairs':>8}")
+    for precision in ("float64", "mixed"):
+        pairs, seconds = _timed(lambda: find_intersections(lines, tolerance=args.tolerance, precision=precision))
+        print(f"{precision:<10} {seconds * 1e3:>10.1f} {len(pairs):>8}")
+
+if __name__ == "__main__":
+    main()
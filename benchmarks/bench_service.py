@@ -0,0 +1,80 @@
+"""Measures latency and throughput of TwistorService under concurrent load on localhost.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_service --requests 20000 --concurrency 256
+
+A stand-in client keeps --concurrency requests outstanding over one localhost connection
+until --requests have completed. Each operation is run twice: with max_batch_size=1,
+which handles requests one at a time like a plain wrapper around the scalar functions,
+and with micro-batching. p50/p99 latencies are measured by the client.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from TwistorClasses.Service import OPERATIONS, LatencyStats, ServiceClient, TwistorService
+
+def _payloads(operation, count, rng):
+    def point():
+        return [rng.uniform(-1, 1) for _ in range(4)]
+
+    def homogeneous():
+        return [complex(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(4)]
+
+    if operation == "map":
+        return [(point(), [complex(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(2)]) for _ in range(count)]
+    if operation == "distance":
+        return [(homogeneous(), homogeneous()) for _ in range(count)]
+    return [([homogeneous(), homogeneous()], [homogeneous(), homogeneous()]) for _ in range(count)]
+
+async def load(client: ServiceClient, operation: str, payloads, concurrency: int) -> dict:
+    """
+    Sends every payload with at most concurrency requests outstanding.
+
+    Returns:
+        dict: LatencyStats.summary() measured at the client.
+    """
+    stats = LatencyStats()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(args):
+        async with slots:
+            started = time.perf_counter()
+            await client.request(operation, *args)
+            stats.record(started, time.perf_counter())
+
+    await asyncio.gather(*(one(args) for args in payloads))
+    return stats.summary()
+
+async def run(requests: int, concurrency: int, max_batch_size: int, max_wait: float, seed: int = 0) -> dict:
+    """Returns {(operation, mode): client summary} for the unbatched and batched services."""
+    rng = random.Random(seed)
+    results = {}
+    for operation in OPERATIONS:
+        payloads = _payloads(operation, requests, rng)
+        for mode, batch_size in (("one-at-a-time", 1), ("batched", max_batch_size)):
+            async with TwistorService(max_batch_size=batch_size, max_wait=max_wait) as service:
+                host, port = await service.serve()
+                async with await ServiceClient.connect(host, port) as client:
+                    summary = await load(client, operation, payloads, concurrency)
+                summary["mean_batch_size"] = service.stats.summary()["mean_batch_size"]
+            results[operation, mode] = summary
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait", type=float, default=0.002, help="seconds")
+    args = parser.parse_args()
+    results = asyncio.run(run(args.requests, args.concurrency, args.max_batch_size, args.max_wait))
+    print(f"{'operation':<10} {'mode':<14} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'batch':>7}")
+    for (operation, mode), summary in results.items():
+        print(f"{operation:<10} {mode:<14} {summary['throughput_rps']:>10.0f} {summary['p50_ms']:>8.2f} "
+              f"{summary['p99_ms']:>8.2f} {summary['mean_batch_size']:>7.1f}")
+
+if __name__ == "__main__":
+    main()
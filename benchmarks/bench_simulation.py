@@ -0,0 +1,76 @@
+"""Compares Simulation steps against a per-particle object loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_simulation --particles 1000 10000 100000
+
+The object loop is the hand-written baseline: for every particle and step it moves a
+ProjectivePoint, rotates it with ProjectivePoint.rotate and remaps it with
+twistor_mapping. The Simulation step covers the same ground for all particles at once,
+with RK4 instead of the loop's Euler drift, the quaternion attitude integrator and
+twistor_mapping_batch.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping
+from TwistorClasses.Simulation import Simulation, harmonic_acceleration
+
+SPINORS = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.complex128)
+
+def _object_step(points, velocities, spin, spinors, t, dt):
+    for point, velocity in zip(points, velocities):
+        point.x += velocity[0] * dt
+        point.y += velocity[1] * dt
+        point.z += velocity[2] * dt
+        point.rotate(spin)
+        event = ComplexMinkowskiPoint(t, point.x.rel, point.y.rel, point.z.rel)
+        for spinor in spinors:
+            twistor_mapping(event, spinor)
+
+def object_loop(count, steps, dt=1e-3, seed=0):
+    """Returns the seconds per step of the per-particle object loop."""
+    rng = np.random.default_rng(seed)
+    points = [ProjectivePoint(ComplexNumber(1.0, 0.0), *(ComplexNumber(float(c), 0.0) for c in row))
+              for row in rng.normal(size=(count, 3))]
+    velocities = rng.normal(size=(count, 3)).tolist()
+    spin = Quaternion(np.cos(dt / 2), 0.0, 0.0, np.sin(dt / 2))
+    spinors = [Spinor(ComplexNumber(1.0, 0.0), ComplexNumber(0.0, 0.0)), Spinor(ComplexNumber(0.0, 0.0), ComplexNumber(1.0, 0.0))]
+    start = time.perf_counter()
+    for step in range(steps):
+        _object_step(points, velocities, spin, spinors, step * dt, dt)
+    return (time.perf_counter() - start) / steps
+
+def vectorized(count, steps, dt=1e-3, seed=0):
+    """Returns the seconds per step of Simulation with twistors computed every step."""
+    rng = np.random.default_rng(seed)
+    simulation = Simulation(rng.normal(size=(count, 3)), rng.normal(size=(count, 3)),
+                            angular_velocities=rng.normal(size=(count, 3)),
+                            acceleration=harmonic_acceleration(1.0), integrator="rk4")
+    start = time.perf_counter()
+    for _ in range(steps):
+        simulation.step(dt)
+        simulation.twistors(SPINORS)
+    return (time.perf_counter() - start) / steps
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--particles", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--object-limit", type=int, default=10_000, help="largest count run with the object loop")
+    args = parser.parse_args()
+    for count in args.particles:
+        fast = vectorized(count, args.steps)
+        line = f"n={count:<8} simulation {fast * 1e3:9.2f} ms/step ({1 / fast:8.1f} steps/s)"
+        if count <= args.object_limit:
+            slow = object_loop(count, max(1, args.steps // 10))
+            line += f"  object loop {slow * 1e3:9.2f} ms/step  speedup {slow / fast:6.1f}x"
+        print(line)
+
+if __name__ == "__main__":
+    main()
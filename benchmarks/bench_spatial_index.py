@@ -0,0 +1,59 @@
+"""Compares SpatialIndex queries against the brute-force distance matrix.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spatial_index --points 1000 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from TwistorClasses.DistanceMatrix import distance_matrix
+from TwistorClasses.SpatialIndex import SpatialIndex
+
+def _random_coords(rng, count):
+    coords = rng.normal(size=(count, 4)) + 1j * rng.normal(size=(count, 4))
+    coords[:, 0] = 1.0
+    return coords
+
+def run(count, queries=200, k=8, seed=0):
+    """Times index build and per-query latency for one point count and returns a result dict."""
+    rng = np.random.default_rng(seed)
+    coords = _random_coords(rng, count)
+    probes = coords[rng.integers(0, count, size=queries)]
+
+    start = time.perf_counter()
+    index = SpatialIndex(coords)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for probe in probes:
+        index.query(probe, k=k)
+    knn = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for probe in probes:
+        index.query_radius(probe, 0.5)
+    radius = (time.perf_counter() - start) / queries
+
+    result = {"points": count, "build_s": build, "knn_query_s": knn, "radius_query_s": radius}
+    if count <= 5_000:
+        start = time.perf_counter()
+        distance_matrix(coords)
+        result["brute_matrix_s"] = time.perf_counter() - start
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    for count in args.points:
+        row = run(count, args.queries)
+        brute = f"{row['brute_matrix_s']:.3f}s" if "brute_matrix_s" in row else "skipped"
+        print(f"n={count:<8} build {row['build_s']:.3f}s  knn {row['knn_query_s'] * 1e6:8.1f}us  "
+              f"radius {row['radius_query_s'] * 1e6:8.1f}us  brute matrix {brute}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Measures throughput and peak memory of the TwistorClasses hot paths and compares runs.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_suite run --sizes 100 1000 10000 --output before.json
+    python -m benchmarks.bench_suite run --sizes 100 1000 10000 --output after.json
+    python -m benchmarks.bench_suite compare before.json after.json --threshold 0.10
+
+Inputs are generated from a fixed seed, so two runs of the same sizes time identical
+work. Each case is timed --repeat times, fast cases looped for at least --min-time
+seconds per sample, and the best time is reported; peak memory is
+traced with tracemalloc in a separate run so tracing does not distort the timings.
+Pairwise cases count one operation per pair of points. Cases are skipped above their
+size limit, where a single run would take minutes or more memory than a laptop has.
+compare exits with status 1 if any case regressed by more than the threshold.
+"""
+import argparse
+from collections import namedtuple
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.ProjectiveLine import ProjectiveLine
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_SEED = 0
+DEFAULT_MIN_TIME = 0.05
+
+Case = namedtuple("Case", "name setup run max_size pairwise needs_numpy", defaults=(False, False))
+
+def _complex(rng):
+    return ComplexNumber(rng.uniform(-1, 1), rng.uniform(-1, 1))
+
+def _quaternion(rng):
+    return Quaternion(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1))
+
+def _point(rng):
+    return ProjectivePoint(ComplexNumber(1, 0), _complex(rng), _complex(rng), _complex(rng))
+
+def _complex_pairs(rng, n):
+    return [_complex(rng) for _ in range(n)], [_complex(rng) for _ in range(n)]
+
+def _run_add(a, b):
+    for x, y in zip(a, b):
+        x + y
+
+def _run_mul(a, b):
+    for x, y in zip(a, b):
+        x * y
+
+def _run_div(a, b):
+    for x, y in zip(a, b):
+        x / y
+
+def _run_quaternion_multiply(a, b):
+    for p, q in zip(a, b):
+        p.multiply(q)
+
+def _run_quaternion_inverse(a):
+    for q in a:
+        q.inverse()
+
+def _run_rotate(points, rotations):
+    for point, rotation in zip(points, rotations):
+        point.rotate(rotation, in_place=False)
+
+def _run_distance_to(a, b):
+    for p, q in zip(a, b):
+        p.distance_to(q)
+
+def _meeting_lines(rng, n):
+    """Builds n lines, each starting at a random point of the previous one so that neighbours meet."""
+    lines = []
+    start = _point(rng)
+    for _ in range(n):
+        line = ProjectiveLine(start, _point(rng))
+        lines.append(line)
+        t = rng.uniform(-1, 1)
+        start = ProjectivePoint(*(getattr(line.point_a, name) * t + getattr(line.point_b, name) * (1 - t)
+                                  for name in ("w", "x", "y", "z")))
+    return (lines,)
+
+def _run_intersect(lines):
+    for line, other in zip(lines, lines[1:] + lines[:1]):
+        line.intersect(other)
+
+def _run_twistor_mapping(points, spinors):
+    for point, spinor in zip(points, spinors):
+        twistor_mapping(point, spinor)
+
+def _setup_twistor_mapping(rng, n):
+    points = [ComplexMinkowskiPoint(*(rng.uniform(-1, 1) for _ in range(4))) for _ in range(n)]
+    spinors = [Spinor(_complex(rng), _complex(rng)) for _ in range(n)]
+    return points, spinors
+
+def _setup_batch_mapping(rng, n):
+    import numpy as np
+    generator = np.random.default_rng(rng.getrandbits(32))
+    return generator.uniform(-1, 1, size=(n, 4)), generator.uniform(-1, 1, size=(1, 2)) + 0j
+
+def _run_batch_mapping(points, spinors):
+    from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch
+    twistor_mapping_batch(points, spinors)
+
+def _setup_batch_matrix(rng, n):
+    from TwistorClasses.PointArray import points_to_array
+    return (points_to_array([_point(rng) for _ in range(n)]),)
+
+def _run_batch_matrix(coords):
+    from TwistorClasses.DistanceMatrix import distance_matrix
+    distance_matrix(coords, condensed=True)
+
+CASES = [
+    Case("ComplexNumber.add", _complex_pairs, _run_add, 1_000_000),
+    Case("ComplexNumber.mul", _complex_pairs, _run_mul, 1_000_000),
+    Case("ComplexNumber.div", _complex_pairs, _run_div, 1_000_000),
+    Case("Quaternion.multiply", lambda rng, n: ([_quaternion(rng) for _ in range(n)], [_quaternion(rng) for _ in range(n)]),
+         _run_quaternion_multiply, 1_000_000),
+    Case("Quaternion.inverse", lambda rng, n: ([_quaternion(rng) for _ in range(n)],), _run_quaternion_inverse, 1_000_000),
+    Case("ProjectivePoint.rotate", lambda rng, n: ([_point(rng) for _ in range(n)], [_quaternion(rng) for _ in range(n)]),
+         _run_rotate, 1_000_000),
+    Case("ProjectivePoint.distance_to", lambda rng, n: ([_point(rng) for _ in range(n)], [_point(rng) for _ in range(n)]),
+         _run_distance_to, 1_000_000),
+    Case("ProjectivePoint.compute_distance_matrix", lambda rng, n: ([_point(rng) for _ in range(n)],),
+         ProjectivePoint.compute_distance_matrix, 1_000, pairwise=True),
+    Case("ProjectiveLine.intersect", _meeting_lines, _run_intersect, 1_000_000),
+    Case("twistor_mapping", _setup_twistor_mapping, _run_twistor_mapping, 1_000_000),
+    Case("twistor_mapping_batch", _setup_batch_mapping, _run_batch_mapping, 1_000_000, needs_numpy=True),
+    Case("distance_matrix (condensed)", _setup_batch_matrix, _run_batch_matrix, 10_000, pairwise=True, needs_numpy=True),
+]
+
+def _numpy_version():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np.__version__
+
+def _time(run, args, repeat, min_time):
+    """
+    Returns repeat per-call wall times of run(*args), with the garbage collector paused.
+
+    Fast cases are looped so that every sample lasts at least min_time seconds, which keeps
+    timer resolution and scheduling noise out of small sizes.
+    """
+    times = []
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        run(*args)
+        first = time.perf_counter() - start
+        loops = max(1, math.ceil(min_time / first)) if first > 0 else 1
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                run(*args)
+            times.append((time.perf_counter() - start) / loops)
+    finally:
+        if enabled:
+            gc.enable()
+    return times
+
+def _peak_memory(run, args):
+    """Returns the peak bytes allocated by one call of run(*args) on top of its inputs."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        run(*args)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+def run_case(case, size, repeat=3, seed=DEFAULT_SEED, min_time=DEFAULT_MIN_TIME):
+    """
+    Benchmarks one case at one size.
+
+    Returns:
+        dict: case, size, ops, best_s, median_s, ops_per_s and peak_bytes, or a dict with
+            skipped set to the reason when the case cannot run at this size.
+    """
+    if size > case.max_size:
+        return {"case": case.name, "size": size, "skipped": f"size above {case.max_size}"}
+    if case.needs_numpy and _numpy_version() is None:
+        return {"case": case.name, "size": size, "skipped": "numpy not installed"}
+    args = case.setup(random.Random(f"{seed}:{case.name}:{size}"), size)
+    times = _time(case.run, args, repeat, min_time)
+    peak = _peak_memory(case.run, args)
+    ops = size * (size - 1) // 2 if case.pairwise else size
+    best = min(times)
+    return {
+        "case": case.name,
+        "size": size,
+        "ops": ops,
+        "best_s": best,
+        "median_s": statistics.median(times),
+        "ops_per_s": ops / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+    }
+
+def run(sizes=DEFAULT_SIZES, cases=None, repeat=3, seed=DEFAULT_SEED, progress=None,
+        min_time=DEFAULT_MIN_TIME) -> dict:
+    """
+    Runs the selected cases at every size.
+
+    Args:
+        sizes (list of int): The input sizes.
+        cases (list of str): Case names to run; all cases when omitted.
+        repeat (int): Timed runs per case and size.
+        seed (int): The seed all inputs are derived from.
+        progress (callable): Called with each result as it completes.
+        min_time (float): The minimum duration of one timed sample, in seconds.
+
+    Returns:
+        dict: {"meta": {...}, "results": [...]} ready to be written as JSON.
+    """
+    selected = CASES if cases is None else [c for c in CASES if c.name in cases]
+    unknown = set(cases or ()) - {c.name for c in CASES}
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {sorted(unknown)}")
+    results = []
+    for case in selected:
+        for size in sizes:
+            result = run_case(case, size, repeat, seed, min_time)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    meta = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "numpy": _numpy_version(),
+        "seed": seed,
+        "repeat": repeat,
+        "min_time": min_time,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return {"meta": meta, "results": results}
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10, memory_threshold: float = None) -> list:
+    """
+    Compares two runs case by case.
+
+    Args:
+        baseline (dict): The earlier run, as returned by run.
+        current (dict): The later run.
+        threshold (float): The relative throughput drop counted as a regression.
+        memory_threshold (float): The relative peak-memory growth counted as a regression;
+            defaults to threshold.
+
+    Returns:
+        list of dict: One row per (case, size) timed in both runs, with speedup, memory_ratio
+            and a regression flag.
+    """
+    if memory_threshold is None:
+        memory_threshold = threshold
+    before = {(r["case"], r["size"]): r for r in baseline["results"] if "skipped" not in r}
+    rows = []
+    for result in current["results"]:
+        key = (result["case"], result["size"])
+        if "skipped" in result or key not in before:
+            continue
+        old = before[key]
+        speedup = result["ops_per_s"] / old["ops_per_s"] if old["ops_per_s"] else float("inf")
+        memory_ratio = (result["peak_bytes"] / old["peak_bytes"]) if old["peak_bytes"] else 1.0
+        rows.append({
+            "case": result["case"],
+            "size": result["size"],
+            "speedup": speedup,
+            "memory_ratio": memory_ratio,
+            "regression": speedup < 1.0 - threshold or memory_ratio > 1.0 + memory_threshold,
+        })
+    return rows
+
+def _format_result(result):
+    if "skipped" in result:
+        return f"{result['case']:<40} n={result['size']:<8} skipped ({result['skipped']})"
+    return (f"{result['case']:<40} n={result['size']:<8} {result['best_s']:10.4f}s "
+            f"{result['ops_per_s']:14.0f} ops/s {result['peak_bytes'] / 1024:12.1f} KiB peak")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks and write JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run_parser.add_argument("--cases", nargs="+", help="case names; see --list")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    run_parser.add_argument("--output", help="JSON file to write; stdout when omitted")
+    run_parser.add_argument("--list", action="store_true", help="list the case names and exit")
+    compare_parser = commands.add_parser("compare", help="compare two JSON runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+    compare_parser.add_argument("--memory-threshold", type=float)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if args.list:
+            for case in CASES:
+                print(f"{case.name:<40} up to n={case.max_size}")
+            return
+        progress = lambda result: print(_format_result(result), file=sys.stderr)
+        report = run(args.sizes, args.cases, args.repeat, args.seed, progress, args.min_time)
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare(baseline, current, args.threshold, args.memory_threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"{row['case']:<40} n={row['size']:<8} {row['speedup']:6.2f}x speed "
+              f"{row['memory_ratio']:6.2f}x memory {flag}")
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{len(rows)} compared, {regressions} regressed")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.ConformalGroup import (ConformalTransform, boost, dilation, is_conformal, lorentz, rotation,
+                                           special_conformal, translation)
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.ProjectiveTransform import ProjectiveTransform
+from TwistorClasses.TwistorMappingBatch import minkowski_matrices, twistor_mapping_batch
+
+
+def minkowski_dot(a, b) -> np.ndarray:
+    """The (+, -, -, -) inner products of the rows of a with b, broadcasting like a * b."""
+    return a[..., 0] * b[..., 0] - (a[..., 1:] * b[..., 1:]).sum(axis=-1)
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).normal(size=(20, 4))
+
+
+@pytest.fixture
+def transforms():
+    return [translation(1.0, -2.0, 0.5, 3.0), rotation(Quaternion(1.0, 2.0, -1.0, 0.5)),
+            boost(0.7, (1.0, 2.0, -2.0)), dilation(2.5), special_conformal(0.1, 0.2, -0.05, 0.1)]
+
+
+def test_translation_rotation_boost_dilation(points):
+    np.testing.assert_allclose(ConformalTransform(translation(1, 2, 3, 4)).transform_points(points),
+                               points + [1, 2, 3, 4], atol=1e-12)
+    np.testing.assert_allclose(ConformalTransform(dilation(3.0)).transform_points(points), 3 * points, atol=1e-12)
+
+    q = Quaternion(1.0, 2.0, -1.0, 0.5)
+    rotated = ConformalTransform(rotation(q)).transform_points(points)
+    for point, result in zip(points.tolist(), rotated):
+        spatial = q * Quaternion(0.0, *point[1:]) * q.inverse()
+        np.testing.assert_allclose(result, [point[0], spatial.x, spatial.y, spatial.z], atol=1e-12)
+
+    phi, n = 0.7, np.array([1.0, 2.0, -2.0]) / 3
+    boosted = ConformalTransform(boost(phi, 3 * n)).transform_points(points)
+    along = points[:, 1:] @ n
+    np.testing.assert_allclose(boosted[:, 0], points[:, 0] * np.cosh(phi) + along * np.sinh(phi), atol=1e-12)
+    np.testing.assert_allclose(boosted[:, 1:] @ n, along * np.cosh(phi) + points[:, 0] * np.sinh(phi), atol=1e-12)
+    np.testing.assert_allclose(np.cross(boosted[:, 1:].real, n), np.cross(points[:, 1:], n), atol=1e-12)
+
+
+def test_special_conformal_matches_formula(points):
+    b = np.array([0.1, 0.2, -0.05, 0.1])
+    squared = minkowski_dot(points, points)
+    denominator = 1 - 2 * minkowski_dot(points, b) + minkowski_dot(b, b) * squared
+    expected = (points - np.outer(squared, b)) / denominator[:, None]
+    result = ConformalTransform(special_conformal(*b)).transform_points(points)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_points_sent_to_infinity_are_nan():
+    b = np.array([0.5, 0.0, 0.0, 0.0])
+    # 1 - 2 b.x + b² x² vanishes at x = (2, 0, 0, 0).
+    result = ConformalTransform(special_conformal(*b)).transform_points([[2.0, 0, 0, 0], [1.0, 0, 0, 0]])
+    assert np.isnan(result[0]).all() and np.isfinite(result[1]).all()
+
+
+def test_generators_are_conformal(transforms):
+    assert all(is_conformal(m) for m in transforms)
+    assert not is_conformal(np.diag([2.0, 1.0, 1.0, 0.5]))
+    with pytest.raises(ValueError):
+        lorentz(2 * np.eye(2))
+    with pytest.raises(ValueError):
+        dilation(0.0)
+    with pytest.raises(ValueError):
+        rotation((0, 0, 0, 0))
+    with pytest.raises(ValueError):
+        boost(1.0, (0, 0, 0))
+
+
+def test_chain_matches_sequential_application(points, transforms):
+    chain = ConformalTransform(*transforms)
+    sequential = points.astype(np.complex128)
+    for m in transforms:
+        sequential = ConformalTransform(m).transform_points(sequential.real)
+    np.testing.assert_allclose(chain.transform_points(points), sequential, atol=1e-10)
+    assert is_conformal(chain.matrix)
+
+
+def test_twistors_transform_like_their_points(points, transforms):
+    rng = np.random.default_rng(1)
+    spinors = rng.normal(size=(3, 2)) + 1j * rng.normal(size=(3, 2))
+    chain = ConformalTransform(*transforms[:4])
+    twistors = chain.apply(twistor_mapping_batch(points, spinors))
+    moved = chain.transform_points(points).real
+    np.testing.assert_allclose(twistors[..., :2], np.einsum("nij,nmj->nmi", minkowski_matrices(moved),
+                                                            twistors[..., 2:]), atol=1e-10)
+
+
+def test_composition_and_inverse(transforms):
+    first, second = ConformalTransform(*transforms[:2]), ConformalTransform(*transforms[2:])
+    composed = first.then(second)
+    assert type(composed) is ConformalTransform and len(composed.matrices) == 5
+    np.testing.assert_allclose((second @ first).matrix, composed.matrix)
+    np.testing.assert_allclose(first.then(transforms[2]).matrix, transforms[2] @ first.matrix)
+    inverse = composed.inverse()
+    assert type(inverse) is ConformalTransform
+    np.testing.assert_allclose(inverse.matrix @ composed.matrix, np.eye(4), atol=1e-10)
+    np.testing.assert_allclose(inverse.matrix, np.linalg.inv(composed.matrix), atol=1e-10)
+
+
+def test_mixing_with_projective_transforms_gives_a_projective_transform(transforms):
+    conformal, projective = ConformalTransform(transforms[0]), ProjectiveTransform(np.diag([2.0, 1.0, 1.0, 1.0]))
+    for mixed in (conformal.then(projective), projective.then(conformal), conformal @ projective,
+                  projective @ conformal):
+        assert type(mixed) is ProjectiveTransform
+        np.testing.assert_allclose(mixed.inverse().matrix @ mixed.matrix, np.eye(4), atol=1e-12)
+    assert type(projective.then(projective)) is ProjectiveTransform
+    assert type(ConformalTransform().then(conformal)) is ConformalTransform
+    with pytest.raises(ValueError):
+        conformal.apply(np.ones((3, 3)))
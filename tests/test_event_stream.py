@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.EventStream import (TwistorStreamWriter, read_binary_events, read_csv_events,
+                                        stream_events_to_twistors)
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch
+
+
+@pytest.fixture
+def events():
+    return np.random.default_rng(0).normal(size=(103, 4))
+
+
+@pytest.fixture
+def spinors():
+    rng = np.random.default_rng(1)
+    return rng.normal(size=(3, 2)) + 1j * rng.normal(size=(3, 2))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 1000])
+def test_binary_and_csv_chunks_match(tmp_path, events, chunk_size):
+    events.tofile(tmp_path / "events.bin")
+    np.savetxt(tmp_path / "events.csv", events, delimiter=",", header="t,x,y,z", comments="", fmt="%.17g")
+    binary = list(read_binary_events(tmp_path / "events.bin", chunk_size))
+    csv = list(read_csv_events(tmp_path / "events.csv", chunk_size))
+    assert max(len(chunk) for chunk in binary) == min(chunk_size, len(events))
+    np.testing.assert_array_equal(np.concatenate(binary), events)
+    np.testing.assert_array_equal(np.concatenate(csv), events)
+
+
+def test_float32_records(tmp_path, events):
+    events.astype("<f4").tofile(tmp_path / "events.bin")
+    chunks = list(read_binary_events(tmp_path / "events.bin", 50, dtype="<f4"))
+    np.testing.assert_array_equal(np.concatenate(chunks), events.astype(np.float32))
+
+
+def test_empty_files_yield_no_chunks(tmp_path):
+    (tmp_path / "events.bin").write_bytes(b"")
+    (tmp_path / "events.csv").write_text("")
+    assert list(read_binary_events(tmp_path / "events.bin")) == []
+    assert list(read_csv_events(tmp_path / "events.csv")) == []
+
+
+def test_truncated_binary_file_is_rejected(tmp_path, events):
+    (tmp_path / "events.bin").write_bytes(events.tobytes()[:-8])
+    with pytest.raises(ValueError, match="whole number"):
+        list(read_binary_events(tmp_path / "events.bin"))
+    with pytest.raises(ValueError):
+        list(read_binary_events(tmp_path / "events.bin", chunk_size=0))
+
+
+def test_stream_matches_batch_mapping(tmp_path, events, spinors):
+    events.tofile(tmp_path / "events.bin")
+    count = stream_events_to_twistors(tmp_path / "events.bin", tmp_path / "twistors.npy", spinors, chunk_size=16)
+    assert count == len(events)
+    result = np.load(tmp_path / "twistors.npy", mmap_mode="r")
+    np.testing.assert_allclose(result, twistor_mapping_batch(events, spinors), rtol=1e-12, atol=1e-12)
+
+
+def test_stream_of_empty_file_writes_an_empty_array(tmp_path, spinors):
+    (tmp_path / "events.bin").write_bytes(b"")
+    assert stream_events_to_twistors(tmp_path / "events.bin", tmp_path / "twistors.npy", spinors) == 0
+    result = np.load(tmp_path / "twistors.npy")
+    assert result.shape == (0, 3, 4) and result.dtype == np.complex128
+
+
+def test_writer_leaves_no_header_after_an_error(tmp_path):
+    with pytest.raises(RuntimeError):
+        with TwistorStreamWriter(tmp_path / "out.npy") as writer:
+            writer.write(np.ones((2, 4)))
+            raise RuntimeError("interrupted")
+    assert writer.failed
+    with pytest.raises(ValueError):
+        np.load(tmp_path / "out.npy")
+    with TwistorStreamWriter(tmp_path / "out.npy") as writer:
+        writer.write(np.ones((2, 4)))
+        with pytest.raises(ValueError):
+            writer.write(np.ones((2, 3)))
+    assert np.load(tmp_path / "out.npy").shape == (2, 4)
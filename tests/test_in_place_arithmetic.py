@@ -0,0 +1,112 @@
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.ProjectiveLine import ProjectiveLine
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.Quaternion import Quaternion
+
+
+def components(value) -> tuple:
+    if isinstance(value, ComplexNumber):
+        return (value.rel, value.img)
+    if isinstance(value, Quaternion):
+        return (value.w, value.x, value.y, value.z)
+    return tuple(c for part in (value.w, value.x, value.y, value.z) for c in components(part))
+
+
+def complex_point(*values) -> ProjectivePoint:
+    return ProjectivePoint(*(ComplexNumber(v, 0) for v in values))
+
+
+@pytest.mark.parametrize("operator, in_place", [
+    (lambda a, b: a + b, lambda a, b: a.__iadd__(b)),
+    (lambda a, b: a - b, lambda a, b: a.__isub__(b)),
+    (lambda a, b: a * b, lambda a, b: a.__imul__(b)),
+    (lambda a, b: a / b, lambda a, b: a.__itruediv__(b)),
+])
+@pytest.mark.parametrize("other", [ComplexNumber(0.5, -2.0), 3.0, 2])
+def test_complex_in_place_operators_update_self(operator, in_place, other):
+    a = ComplexNumber(1.5, 2.5)
+    expected = components(operator(ComplexNumber(1.5, 2.5), other))
+    assert in_place(a, other) is a
+    assert components(a) == pytest.approx(expected)
+
+
+def test_complex_out_may_alias_operands():
+    a, b = ComplexNumber(1.0, 2.0), ComplexNumber(3.0, -1.0)
+    assert components(a.multiply(b, out=b)) == pytest.approx(components(ComplexNumber(1.0, 2.0) * ComplexNumber(3.0, -1.0)))
+    a, b = ComplexNumber(1.0, 2.0), ComplexNumber(3.0, -1.0)
+    assert components(a.divide(b, out=a)) == pytest.approx((0.1, 0.7))
+    z = ComplexNumber(1.0, 1.0)
+    assert z.multiply_add(ComplexNumber(0.0, 1.0), z, out=z) is z
+    assert components(z) == pytest.approx((0.0, 2.0))
+
+
+def test_complex_divide_by_zero_raises():
+    with pytest.raises(ZeroDivisionError):
+        ComplexNumber(1.0, 0.0).divide(ComplexNumber(0.0, 0.0))
+
+
+def test_copy_is_independent():
+    a = ComplexNumber(1.0, 2.0)
+    b = a.copy()
+    b *= 2
+    assert components(a) == (1.0, 2.0)
+
+
+def test_quaternion_in_place_operators_match_allocating():
+    p, q = Quaternion(1.0, 2.0, 3.0, 4.0), Quaternion(0.5, -1.0, 0.25, 2.0)
+    a = p.copy()
+    a *= q
+    assert components(a) == pytest.approx(components(p.multiply(q)))
+    a = p.copy()
+    a += q
+    assert components(a) == pytest.approx(components(p.add(q)))
+    a = p.copy()
+    a -= q
+    assert components(a) == pytest.approx(components(p.subtract(q)))
+    a = p.copy()
+    a /= 2.0
+    assert components(a) == pytest.approx((0.5, 1.0, 1.5, 2.0))
+    assert components(p.multiply_add(q, p)) == pytest.approx(components(p.multiply(q).add(p)))
+    assert components(p.multiply(p.inverse())) == pytest.approx((1.0, 0.0, 0.0, 0.0))
+    with pytest.raises(TypeError):
+        a += 1.0
+
+
+def test_quaternion_out_may_alias_operands():
+    p, q = Quaternion(1.0, 2.0, 3.0, 4.0), Quaternion(0.5, -1.0, 0.25, 2.0)
+    expected = components(p.multiply(q))
+    assert components(p.copy().multiply(q, out=q.copy())) == pytest.approx(expected)
+    a = p.copy()
+    assert a.multiply(q, out=a) is a
+    assert components(a) == pytest.approx(expected)
+    a = p.copy()
+    assert a.normalize(out=a) is a
+    assert a.magnitude() == pytest.approx(1.0)
+
+
+def test_scale_leaves_shared_components_alone():
+    w = ComplexNumber(2, 0)
+    a = ProjectivePoint(w, ComplexNumber(2, 0), ComplexNumber(3, 0), ComplexNumber(4, 0))
+    b = ProjectivePoint(w, ComplexNumber(4, 0), ComplexNumber(5, 0), ComplexNumber(6, 0))
+    line = ProjectiveLine(a, b)
+    line.normalize()
+    assert components(a) == pytest.approx((1, 0, 1, 0, 1.5, 0, 2, 0))
+    assert components(b) == pytest.approx((1, 0, 2, 0, 2.5, 0, 3, 0))
+    assert components(w) == (2, 0)
+
+
+def test_scale_with_repeated_component():
+    c = ComplexNumber(2, 0)
+    point = ProjectivePoint(c, c, c, ComplexNumber(4, 0))
+    point.scale(5)
+    assert components(point) == (10, 0, 10, 0, 10, 0, 20, 0)
+    assert components(c) == (2, 0)
+
+
+def test_rotate_copy_does_not_alias_w():
+    point = complex_point(1, 1, 0, 0)
+    rotated = point.rotate(Quaternion(0.0, 0.0, 0.0, 1.0), in_place=False)
+    rotated.w *= 3
+    assert components(point.w) == (1, 0)
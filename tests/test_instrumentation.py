@@ -0,0 +1,124 @@
+import importlib
+from pathlib import Path
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.Instrumentation import DEFAULT_ALLOCATION_TARGETS, DEFAULT_TARGETS, Profiler
+from TwistorClasses.Quaternion import Quaternion
+
+
+def snapshot() -> dict:
+    """Maps (owner name, attribute) to the object bound there, for every package module and target class."""
+    bindings = {}
+    for name, module in list(sys.modules.items()):
+        if name == "TwistorClasses" or name.startswith("TwistorClasses."):
+            for attribute, value in vars(module).items():
+                bindings[(name, attribute)] = value
+    for module_name, qualified_name in DEFAULT_TARGETS + DEFAULT_ALLOCATION_TARGETS:
+        class_name = qualified_name.split(".")[0]
+        owner = getattr(importlib.import_module(module_name), class_name)
+        if isinstance(owner, type):
+            for attribute, value in vars(owner).items():
+                bindings[(f"{module_name}.{class_name}", attribute)] = value
+    return bindings
+
+
+def is_profiler_wrapper(value) -> bool:
+    function = getattr(value, "__func__", value)
+    code = getattr(function, "__code__", None)
+    return code is not None and code.co_filename.endswith("Instrumentation.py") and code.co_name == "wrapper"
+
+
+def work():
+    q = Quaternion(1.0, 2.0, 3.0, 4.0)
+    for _ in range(200):
+        q.normalize().angle_with(q)
+    return ComplexNumber(1.0, 2.0) * ComplexNumber(3.0, 4.0)
+
+
+def test_session_restores_every_patched_attribute():
+    before = snapshot()
+    with Profiler():
+        patched = snapshot()
+        work()
+    after = snapshot()
+    assert any(is_profiler_wrapper(value) for value in patched.values())
+    changed = [key for key, value in before.items() if after[key] is not value]
+    assert changed == []
+    leaked = [key for key, value in after.items() if is_profiler_wrapper(value)]
+    assert leaked == []
+
+
+def test_lazy_package_export_looked_up_during_session_is_restored():
+    # A fresh interpreter, so that the package has not cached twistor_mapping yet.
+    code = (
+        "import TwistorClasses\n"
+        "from TwistorClasses.Instrumentation import Profiler\n"
+        "from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping\n"
+        "from TwistorClasses.ComplexNumber import ComplexNumber\n"
+        "s = Spinor(ComplexNumber(1, 0), ComplexNumber(0, 1))\n"
+        "p = ComplexMinkowskiPoint(1, 2, 3, 4)\n"
+        "with Profiler() as profiler:\n"
+        "    TwistorClasses.twistor_mapping(p, s)\n"
+        "TwistorClasses.twistor_mapping(p, s)\n"
+        "assert TwistorClasses.twistor_mapping is twistor_mapping\n"
+        "print(profiler.counters['twistor_mapping'].calls)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parents[1])
+    assert result.stdout.strip() == "1"
+
+
+def test_counts_calls_and_allocations():
+    with Profiler() as profiler:
+        work()
+    report = profiler.report()
+    assert report["operations"]["Quaternion.normalize"]["calls"] == 200
+    assert report["operations"]["Quaternion.angle_with"]["calls"] == 200
+    assert report["operations"]["ComplexNumber.__mul__"]["calls"] == 1
+    assert report["allocations"]["Quaternion"] == 201
+    assert "Quaternion.normalize" in profiler.format_report()
+    assert not profiler.active
+
+
+def test_self_time_is_per_thread():
+    with Profiler() as profiler:
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    for row in profiler.report()["operations"].values():
+        assert 0.0 <= row["self_s"] <= row["total_s"] + 1e-12
+
+
+def test_only_one_session_at_a_time():
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            Profiler().start()
+    with Profiler():
+        pass
+
+
+def test_failed_start_restores_patches():
+    before = snapshot()
+    profiler = Profiler(targets=DEFAULT_TARGETS + (("TwistorClasses.Quaternion", "Quaternion.missing"),))
+    with pytest.raises(KeyError):
+        profiler.start()
+    assert not profiler.active
+    after = snapshot()
+    assert all(after[key] is value for key, value in before.items())
+    with Profiler():
+        pass
+
+
+def test_reset_clears_counters():
+    with Profiler() as profiler:
+        work()
+        profiler.reset()
+    assert profiler.report()["operations"] == {}
+    assert profiler.report()["allocations"] == {}
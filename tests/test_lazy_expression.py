@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.LazyExpression import (COMPLEX, QUATERNION, REAL, complex_from, compile_expression, lazy, symbol,
+                                           trace)
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.QuaternionArray import QuaternionArray
+
+COUNT = 50
+
+
+def rotate(q, p):
+    return q * p * q.inverse()
+
+
+def incidence(m00, m01, m10, m11, l0, l1):
+    return m00 * l0 + m01 * l1, m10 * l0 + m11 * l1
+
+
+def complex_mix(a, b, c):
+    return (a * b - c) / (a.conjugate() + 2.0) * c.magnitude()
+
+
+def quaternion_mix(q, p):
+    return (q.normalize() * p.conjugate() * q.dot_product(p)).subtract(p * q.magnitude_squared())
+
+
+def components(q) -> tuple:
+    return (q.w, q.x, q.y, q.z)
+
+
+def to_complex(values) -> list:
+    return [ComplexNumber(v.real, v.imag) for v in values.tolist()]
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def complex_inputs(rng):
+    return {name: rng.normal(size=COUNT) + 1j * rng.normal(size=COUNT) for name in "abc"}
+
+
+@pytest.fixture
+def quaternion_inputs(rng):
+    return {name: rng.normal(size=(COUNT, 4)) for name in "qp"}
+
+
+def test_rotation_matches_eager(quaternion_inputs):
+    compiled = trace(rotate, q=QUATERNION, p=QUATERNION)
+    result = compiled(**quaternion_inputs)
+    assert result.shape == (COUNT, 4)
+    for row, q, p in zip(result, *(quaternion_inputs[n].tolist() for n in "qp")):
+        np.testing.assert_allclose(row, components(rotate(Quaternion(*q), Quaternion(*p))))
+
+
+def test_incidence_matches_eager(rng):
+    inputs = {name: rng.normal(size=COUNT) + 1j * rng.normal(size=COUNT)
+              for name in ("m00", "m01", "m10", "m11", "l0", "l1")}
+    first, second = trace(incidence, **{name: COMPLEX for name in inputs})(**inputs)
+    columns = [to_complex(inputs[name]) for name in ("m00", "m01", "m10", "m11", "l0", "l1")]
+    for k, row in enumerate(zip(*columns)):
+        expected = incidence(*row)
+        assert first[k] == pytest.approx(complex(expected[0].rel, expected[0].img))
+        assert second[k] == pytest.approx(complex(expected[1].rel, expected[1].img))
+
+
+def test_complex_arithmetic_matches_eager(complex_inputs):
+    result = trace(complex_mix, a=COMPLEX, b=COMPLEX, c=COMPLEX)(**complex_inputs)
+    assert result.dtype == np.complex128
+    for k, (a, b, c) in enumerate(zip(*(to_complex(complex_inputs[n]) for n in "abc"))):
+        expected = complex_mix(a, b, c)
+        assert result[k] == pytest.approx(complex(expected.rel, expected.img))
+
+
+def test_quaternion_arithmetic_matches_eager(quaternion_inputs):
+    result = trace(quaternion_mix, q=QUATERNION, p=QUATERNION)(**quaternion_inputs)
+    for row, q, p in zip(result, *(quaternion_inputs[n].tolist() for n in "qp")):
+        np.testing.assert_allclose(row, components(quaternion_mix(Quaternion(*q), Quaternion(*p))))
+
+
+def test_real_and_component_outputs(quaternion_inputs, complex_inputs):
+    q, a = symbol("q", QUATERNION), symbol("a", COMPLEX)
+    compiled = compile_expression([q.magnitude(), q.w * q.z, a.rel + a.img ** 2, a.magnitude_squared(),
+                                   complex_from(a.img, a.rel)])
+    magnitude, wz, mixed, squared, swapped = compiled(q=quaternion_inputs["q"], a=complex_inputs["a"])
+    values, z = quaternion_inputs["q"], complex_inputs["a"]
+    np.testing.assert_allclose(magnitude, np.linalg.norm(values, axis=1))
+    np.testing.assert_allclose(wz, values[:, 0] * values[:, 3])
+    np.testing.assert_allclose(mixed, z.real + z.imag ** 2)
+    np.testing.assert_allclose(squared, np.abs(z) ** 2)
+    np.testing.assert_allclose(swapped, z.imag + 1j * z.real)
+    assert magnitude.dtype == wz.dtype == np.float64
+
+
+def test_quaternion_division_uses_the_inverse(quaternion_inputs):
+    divided = trace(lambda q, p: q / p, q=QUATERNION, p=QUATERNION)(**quaternion_inputs)
+    multiplied = trace(lambda q, p: q * p.inverse(), q=QUATERNION, p=QUATERNION)(**quaternion_inputs)
+    np.testing.assert_array_equal(divided, multiplied)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_chunking_does_not_change_results(quaternion_inputs, chunk_size):
+    reference = trace(rotate, q=QUATERNION, p=QUATERNION)(**quaternion_inputs)
+    chunked = trace(rotate, chunk_size=chunk_size, q=QUATERNION, p=QUATERNION)(**quaternion_inputs)
+    np.testing.assert_array_equal(chunked, reference)
+
+
+def test_accepts_objects_and_broadcasts_single_values(quaternion_inputs):
+    compiled = trace(rotate, q=QUATERNION, p=QUATERNION)
+    single = Quaternion(0.5, 0.5, -0.5, 0.5)
+    points = quaternion_inputs["p"]
+    expected = compiled(q=np.tile(components(single), (COUNT, 1)), p=points)
+    np.testing.assert_allclose(compiled(q=single, p=points), expected)
+    np.testing.assert_allclose(compiled(q=single, p=QuaternionArray(points)), expected)
+    objects = [Quaternion(*row) for row in points.tolist()]
+    np.testing.assert_allclose(compiled(q=single, p=objects), expected)
+    scaled = compile_expression(symbol("a", COMPLEX) * symbol("s", REAL))
+    np.testing.assert_allclose(scaled(a=ComplexNumber(1.0, 2.0), s=np.arange(3.0)), [0, 1 + 2j, 2 + 4j])
+
+
+def test_constants_fold_into_the_kernel(complex_inputs):
+    a = symbol("a", COMPLEX)
+    compiled = compile_expression(a * lazy(ComplexNumber(0.0, 1.0)) + lazy(2.5) + lazy(Quaternion(1, 0, 0, 0)).w)
+    np.testing.assert_allclose(compiled(a=complex_inputs["a"]), complex_inputs["a"] * 1j + 3.5)
+    assert a * 1.0 is a and a + 0.0 is a
+
+
+def test_common_subexpressions_are_shared():
+    q, p = symbol("q", QUATERNION), symbol("p", QUATERNION)
+    assert q * p is q * p
+    a, b = symbol("a", COMPLEX), symbol("b", COMPLEX)
+    assert a + b is b + a and a * b is b * a
+    assert q * p is not p * q
+    assert -(-a) is a and a.conjugate().conjugate() is a
+    once = compile_expression(rotate(q, p))
+    twice = compile_expression([rotate(q, p), rotate(q, p) * q.inverse()])
+    # The second output reuses the first output's nodes, q.inverse() included.
+    assert twice.node_count == once.node_count + 1
+    assert once.source.count("1.0 / (") == 1
+
+
+def test_bad_inputs_are_rejected(quaternion_inputs):
+    compiled = trace(rotate, q=QUATERNION, p=QUATERNION)
+    with pytest.raises(ValueError):
+        compiled(q=quaternion_inputs["q"])
+    with pytest.raises(ValueError):
+        compiled(**quaternion_inputs, r=1.0)
+    with pytest.raises(ValueError):
+        compiled(q=np.ones((3, 3)), p=quaternion_inputs["p"])
+    with pytest.raises(ValueError):
+        symbol("a", "octonion")
+    with pytest.raises(ValueError):
+        symbol("not a name")
+    with pytest.raises(ValueError):
+        compile_expression(symbol("a", COMPLEX) + symbol("a", REAL))
+
+
+def test_mixed_kinds_are_type_errors():
+    q, a, r = symbol("q", QUATERNION), symbol("a", COMPLEX), symbol("r", REAL)
+    with pytest.raises(TypeError):
+        q * a
+    with pytest.raises(TypeError):
+        q + r
+    with pytest.raises(TypeError):
+        a ** 2
+    with pytest.raises(TypeError):
+        a.dot_product(a)
+    with pytest.raises(TypeError):
+        a + True
+    with pytest.raises(AttributeError):
+        a.w
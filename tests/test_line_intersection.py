@@ -0,0 +1,231 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.LineIntersection import (PRECISIONS, exact_lines_meet, find_intersections, intersection_points,
+                                             lines_meet)
+from TwistorClasses.PointArray import lines_to_array
+from TwistorClasses.ProjectiveLine import ProjectiveLine
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+
+TOLERANCE = 1e-10
+
+
+def random_lines(rng, n, hubs=6) -> np.ndarray:
+    """Returns (n, 2, 4) endpoints of lines through a few shared hub points, so that many pairs meet."""
+    centres = rng.normal(size=(hubs, 4)) + 1j * rng.normal(size=(hubs, 4))
+    endpoints = rng.normal(size=(n, 2, 4)) + 1j * rng.normal(size=(n, 2, 4))
+    through = rng.random(n) < 0.7
+    endpoints[through, 0] = centres[rng.integers(hubs, size=through.sum())]
+    return endpoints
+
+
+def normalized_incidence(a, b) -> np.ndarray:
+    """Brute-force |p . dual(q)| / (|p| |q|) for every pair of lines in a and b."""
+    def plucker(e):
+        pairs = ((0, 1), (0, 2), (0, 3), (2, 3), (3, 1), (1, 2))
+        return np.stack([e[:, 0, i] * e[:, 1, j] - e[:, 0, j] * e[:, 1, i] for i, j in pairs], axis=1)
+    p, q = plucker(a), plucker(b)
+    dual = q[:, [3, 4, 5, 0, 1, 2]]
+    norms = np.outer(np.linalg.norm(p, axis=1), np.linalg.norm(q, axis=1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(norms > 0, np.abs(p @ dual.T) / norms, np.inf)
+
+
+def brute_force_pairs(a, b=None, tolerance=TOLERANCE) -> np.ndarray:
+    meets = normalized_incidence(a, a if b is None else b) <= tolerance
+    if b is None:
+        meets = np.triu(meets, 1)
+    return np.argwhere(meets)
+
+
+def to_line(endpoints) -> ProjectiveLine:
+    return ProjectiveLine(*(ProjectivePoint(*(ComplexNumber(z.real, z.imag) for z in point.tolist()))
+                            for point in endpoints))
+
+
+def to_array(point) -> np.ndarray:
+    return np.array([complex(c.rel, c.img) for c in (point.w, point.x, point.y, point.z)])
+
+
+def on_line(point, endpoints) -> bool:
+    """Checks that point lies in the span of a line's two endpoints."""
+    return np.linalg.matrix_rank(np.stack((endpoints[0], endpoints[1], point)), tol=1e-8) == 2
+
+
+@pytest.fixture
+def endpoints():
+    return random_lines(np.random.default_rng(7), 120)
+
+
+@pytest.mark.parametrize("broad_phase", [True, False])
+@pytest.mark.parametrize("tile_size", [7, 64, 1000])
+def test_find_intersections_matches_brute_force(endpoints, broad_phase, tile_size):
+    pairs = find_intersections(endpoints, tile_size=tile_size, broad_phase=broad_phase)
+    expected = brute_force_pairs(endpoints)
+    assert len(expected) > 100
+    np.testing.assert_array_equal(pairs, expected)
+
+
+def test_find_intersections_between_two_sets(endpoints):
+    pairs = find_intersections(endpoints[:50], endpoints[50:], tile_size=16)
+    np.testing.assert_array_equal(pairs, brute_force_pairs(endpoints[:50], endpoints[50:]))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_find_intersections_parallel_backends(endpoints, executor):
+    np.testing.assert_array_equal(find_intersections(endpoints, tile_size=16, executor=executor),
+                                  find_intersections(endpoints, tile_size=16))
+
+
+def test_find_intersections_points_lie_on_both_lines(endpoints):
+    pairs, points = find_intersections(endpoints, return_points=True)
+    for (i, j), point in zip(pairs, points):
+        assert on_line(point, endpoints[i]) and on_line(point, endpoints[j])
+
+
+def test_find_intersections_skips_degenerate_lines(endpoints):
+    endpoints = endpoints.copy()
+    endpoints[3, 1] = endpoints[3, 0] * 2
+    pairs = find_intersections(endpoints)
+    assert 3 not in pairs
+    np.testing.assert_array_equal(pairs, brute_force_pairs(endpoints))
+
+
+def test_find_intersections_lines_to_array_round_trip(endpoints):
+    lines = [to_line(e) for e in endpoints[:20]]
+    np.testing.assert_array_equal(find_intersections(lines_to_array(lines)), find_intersections(endpoints[:20]))
+
+
+def test_intersect_bool_agrees_with_find_intersections(endpoints):
+    lines = [to_line(e) for e in endpoints[:40]]
+    expected = {tuple(pair) for pair in find_intersections(endpoints[:40]).tolist()}
+    for i in range(len(lines)):
+        for j in range(i + 1, len(lines)):
+            assert lines[i].intersect_bool(lines[j]) == ((i, j) in expected)
+
+
+def test_intersect_returns_the_meeting_point(endpoints):
+    pairs = brute_force_pairs(endpoints[:40])
+    expected = intersection_points(endpoints[pairs[:, 0]], endpoints[pairs[:, 1]])
+    for (i, j), reference in zip(pairs, expected):
+        point = to_array(to_line(endpoints[i]).intersect(to_line(endpoints[j])))
+        assert on_line(point, endpoints[i]) and on_line(point, endpoints[j])
+        assert abs(np.vdot(point, reference)) == pytest.approx(np.linalg.norm(point) * np.linalg.norm(reference))
+
+
+def test_intersect_at_shared_endpoint():
+    a, b, c = (ProjectivePoint(*(ComplexNumber(*v) for v in row)) for row in (
+        [(1, 0), (2, 1), (0, 0), (3, -1)], [(1, 0), (0, 0), (1, 2), (0, 1)], [(2, 1), (1, 1), (-1, 0), (0, 2)]))
+    point = to_array(ProjectiveLine(a, b).intersect(ProjectiveLine(b, c)))
+    np.testing.assert_allclose(point / point[0], to_array(b) / to_array(b)[0])
+
+
+def test_intersect_returns_none_without_a_single_meeting_point(endpoints):
+    skew = normalized_incidence(endpoints[:1], endpoints[1:2])[0, 0] > 1e-3
+    assert skew
+    first, second = to_line(endpoints[0]), to_line(endpoints[1])
+    assert first.intersect(second) is None
+    assert first.intersect(ProjectiveLine(first.point_b, first.point_a)) is None
+    assert ProjectiveLine(first.point_a, first.point_a).intersect(second) is None
+
+
+def near_coplanar_pairs(rng, count, tolerance=TOLERANCE) -> tuple:
+    """Returns (K, 2, 4) endpoint pairs: a third meet, a third miss by about the tolerance, a tenth ill-conditioned."""
+    a = rng.normal(size=(count, 2, 4)) + 1j * rng.normal(size=(count, 2, 4))
+    b = rng.normal(size=(count, 2, 4)) + 1j * rng.normal(size=(count, 2, 4))
+    meet = rng.random(count) < 1 / 3
+    near = ~meet & (rng.random(count) < 0.5)
+    through = a[:, 0] * rng.normal(size=(count, 1)) + a[:, 1] * rng.normal(size=(count, 1))
+    b[meet, 0] = through[meet]
+    offsets = tolerance * 10 ** rng.uniform(-1, 1, size=(count, 1)) * rng.normal(size=(count, 4))
+    b[near, 0] = (through + offsets)[near]
+    ill = rng.random(count) < 0.1
+    a[ill, 1] = a[ill, 0] + 1e-9 * rng.normal(size=(ill.sum(), 4))
+    b[ill, 0] = a[ill, 1]
+    return a, b
+
+
+@pytest.fixture
+def near_pairs():
+    return near_coplanar_pairs(np.random.default_rng(11), 3000)
+
+
+def test_mixed_matches_exact_on_near_coplanar_lines(near_pairs):
+    a, b = near_pairs
+    exact = exact_lines_meet(a, b)
+    mixed, refined = lines_meet(a, b, precision="mixed", return_refined=True)
+    np.testing.assert_array_equal(mixed, exact)
+    np.testing.assert_array_equal(lines_meet(a, b, precision="exact"), exact)
+    # The inputs are hard enough that the float32 screen alone gets some wrong and the
+    # cascade has to evaluate some pairs exactly.
+    assert (lines_meet(a, b, precision="float32") != exact).sum() > 100
+    assert 0 < len(refined) < len(a)
+    assert 0 < exact.sum() < len(a)
+
+
+def test_mixed_find_intersections_matches_exact():
+    rng = np.random.default_rng(5)
+    a, b = near_coplanar_pairs(rng, 40)
+    endpoints = np.concatenate((a, b))
+    rows, cols = np.triu_indices(len(endpoints), 1)
+    exact = exact_lines_meet(endpoints[rows], endpoints[cols])
+    expected = np.stack((rows[exact], cols[exact]), axis=1)
+    np.testing.assert_array_equal(find_intersections(endpoints, precision="mixed", tile_size=16), expected)
+
+
+@pytest.mark.parametrize("precision", PRECISIONS)
+def test_degenerate_and_non_finite_lines_never_meet(precision):
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(4, 2, 4)) + 1j * rng.normal(size=(4, 2, 4))
+    b = a[:, ::-1].copy()  # the same lines, which meet everywhere
+    a[0, 1] = a[0, 0]
+    a[1, 1] = a[1, 0] * 2  # a power of two keeps the endpoints exactly dependent
+    a[2] = 0
+    a[3, 0, 2] = np.nan
+    np.testing.assert_array_equal(lines_meet(a, b, precision=precision), [False] * 4)
+    np.testing.assert_array_equal(exact_lines_meet(a, b), [False] * 4)
+
+
+@pytest.mark.parametrize("precision", ["mixed", "exact", "float64"])
+def test_tolerance_boundary(precision):
+    a, b = near_coplanar_pairs(np.random.default_rng(2), 50)
+    incidence = normalized_incidence(a, b).diagonal()
+    pick = np.flatnonzero((incidence > 1e-11) & (incidence < 1e-9))[:5]
+    assert len(pick)
+    for k in pick:
+        below, above = incidence[k] * (1 - 1e-4), incidence[k] * (1 + 1e-4)
+        assert not exact_lines_meet(a[k:k + 1], b[k:k + 1], below)[0]
+        assert exact_lines_meet(a[k:k + 1], b[k:k + 1], above)[0]
+        assert not lines_meet(a[k:k + 1], b[k:k + 1], below, precision)[0]
+        assert lines_meet(a[k:k + 1], b[k:k + 1], above, precision)[0]
+
+
+def test_mixed_refines_pairs_at_the_boundary():
+    a, b = near_coplanar_pairs(np.random.default_rng(2), 50)
+    incidence = normalized_incidence(a, b).diagonal()
+    k = int(np.flatnonzero((incidence > 1e-11) & (incidence < 1e-9))[0])
+    meets, refined = lines_meet(a[k:k + 1], b[k:k + 1], incidence[k] * (1 + 1e-9), "mixed", return_refined=True)
+    assert meets[0] == exact_lines_meet(a[k:k + 1], b[k:k + 1], incidence[k] * (1 + 1e-9))[0]
+    assert refined.tolist() == [0]
+
+
+def test_intersect_bool_exact_agrees_with_exact_lines_meet(near_pairs):
+    a, b = near_pairs
+    a, b = a[:300].copy(), b[:300].copy()
+    a[0, 1] = a[0, 0]
+    a[1, 0, 3] = np.inf
+    for tolerance in (TOLERANCE, TOLERANCE / 10):
+        expected = exact_lines_meet(a, b, tolerance)
+        results = [to_line(x).intersect_bool(to_line(y), tolerance, exact=True) for x, y in zip(a, b)]
+        np.testing.assert_array_equal(results, expected)
+
+
+def test_lines_meet_rejects_bad_arguments(near_pairs):
+    a, b = near_pairs
+    with pytest.raises(ValueError):
+        lines_meet(a, b, precision="float16")
+    with pytest.raises(ValueError):
+        lines_meet(a, b[:-1])
+    with pytest.raises(ValueError):
+        exact_lines_meet(a[:, 0], b[:, 0])
@@ -0,0 +1,97 @@
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.MappingCache import LRUCache, MappingCache, point_key
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping
+
+
+def spinor(a, b) -> Spinor:
+    return Spinor(ComplexNumber(a.real, a.imag), ComplexNumber(b.real, b.imag))
+
+
+def mu(twistor) -> tuple:
+    return tuple((c.rel, c.img) for c in twistor.mu.components)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+    assert cache.get("a", lambda: None) == 1
+    assert cache.get("c", lambda: 3) == 3
+    assert cache.get("b", lambda: "rebuilt") == "rebuilt"
+    assert cache.stats() == {"hits": 1, "misses": 4, "evictions": 2, "size": 2, "maxsize": 2, "hit_rate": 0.2}
+
+
+def test_lru_zero_size_disables_caching():
+    cache = LRUCache(0)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("a", lambda: 2) == 2
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_lru_clear_resets_counters():
+    cache = LRUCache(4)
+    cache.get("a", lambda: 1)
+    cache.get("a", lambda: 1)
+    cache.clear()
+    assert cache.stats()["hits"] == cache.stats()["misses"] == len(cache) == 0
+
+
+def test_cached_results_match_uncached():
+    cache = MappingCache()
+    lam = spinor(1 + 1j, 0.5 - 2j)
+    for coordinates in [(1.0, 2.0, 3.0, 4.0), (0.0, -1.5, 0.25, 7.0)]:
+        expected = mu(twistor_mapping(ComplexMinkowskiPoint(*coordinates), lam))
+        for _ in range(2):
+            result = twistor_mapping(ComplexMinkowskiPoint(*coordinates), lam, cache=cache)
+            assert mu(result) == expected
+            assert result.lambda_ is lam
+            assert mu(cache.twistor_mapping(coordinates, lam)) == expected
+    assert cache.stats()["twistors"]["misses"] == 2
+
+
+def test_tuple_and_point_share_one_entry():
+    cache = MappingCache()
+    lam = spinor(1, 1j)
+    cache.twistor_mapping((1.0, 2.0, 3.0, 4.0), lam)
+    cache.twistor_mapping(cache.minkowski_point(1.0, 2.0, 3.0, 4.0), lam)
+    cache.twistor_mapping(ComplexMinkowskiPoint(1.0, 2.0, 3.0, 4.0), lam)
+    stats = cache.stats()["twistors"]
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 2, 1)
+    assert point_key((1.0, 2.0, 3.0, 4.0)) == point_key(ComplexMinkowskiPoint(1.0, 2.0, 3.0, 4.0))
+
+
+def test_mutating_a_result_does_not_poison_the_cache():
+    cache = MappingCache()
+    lam = spinor(1, 1j)
+    point = ComplexMinkowskiPoint(1.0, 0.0, 0.0, 1.0)
+    expected = mu(twistor_mapping(point, lam))
+    m = twistor_mapping(point, lam, cache=cache).mu.components[0]
+    m *= 10
+    assert mu(twistor_mapping(point, lam, cache=cache)) == expected
+    assert mu(cache.twistor_mapping((1.0, 0.0, 0.0, 1.0), lam)) == expected
+
+
+def test_mutating_a_cached_point_does_not_poison_the_cache():
+    cache = MappingCache()
+    lam = spinor(2, -1j)
+    expected = mu(twistor_mapping(ComplexMinkowskiPoint(3.0, 1.0, 2.0, 0.5), lam))
+    entry = cache.minkowski_point(3.0, 1.0, 2.0, 0.5).matrix[0][0]
+    entry *= 5
+    assert cache.minkowski_point(3.0, 1.0, 2.0, 0.5).matrix[0][0].rel == pytest.approx(3.5 / 2**0.5)
+    assert mu(cache.twistor_mapping((3.0, 1.0, 2.0, 0.5), lam)) == expected
+
+
+def test_twistor_cache_is_bounded():
+    cache = MappingCache(max_points=2, max_twistors=3)
+    lam = spinor(1, 0)
+    for t in range(5):
+        cache.twistor_mapping((float(t), 0.0, 0.0, 0.0), lam)
+    stats = cache.stats()
+    assert stats["points"]["size"] == 2 and stats["points"]["evictions"] == 3
+    assert stats["twistors"]["size"] == 3 and stats["twistors"]["evictions"] == 2
+    cache.clear()
+    assert cache.stats()["twistors"]["size"] == 0
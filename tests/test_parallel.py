@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pytest
+
+from TwistorClasses.Parallel import (ProcessExecutor, SerialExecutor, ThreadExecutor, executor_scope,
+                                     get_executor, partition)
+
+BACKENDS = ["serial", "thread", "process"]
+
+
+def square_kernel(start, stop, values, offset, out):
+    out[...] = values[start:stop] ** 2 + offset
+
+
+def column_kernel(start, stop, values, out):
+    out[...] = values[:, start:stop] * 10
+
+
+def add_kernel(start, stop, out):
+    out += np.arange(start, stop)[:, None]
+
+
+def failing_kernel(start, stop, values, out):
+    if start > 0:
+        raise RuntimeError(f"block {start} failed")
+    out[...] = values[start:stop]
+
+
+def nonzero_kernel(start, stop, values):
+    return start + np.flatnonzero(values[start:stop] > 0)
+
+
+def shared_segments() -> set:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+def test_partition():
+    assert partition(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert partition(10, parts=3) == [(0, 4), (4, 8), (8, 10)]
+    assert partition(0, 4) == []
+    assert partition(3, 0) == [(0, 1), (1, 2), (2, 3)]
+    assert partition(5) == [(0, 5)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_matches_serial(backend):
+    values = np.arange(103, dtype=np.float64)
+    with executor_scope(backend, 3) as executor:
+        out = executor.run(square_kernel, partition(103, 10), (values, 1.5), np.empty(103))
+    np.testing.assert_array_equal(out, values ** 2 + 1.5)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_with_custom_regions(backend):
+    values = np.arange(24, dtype=np.float64).reshape(3, 8)
+    blocks = partition(8, 3)
+    regions = [(slice(None), slice(start, stop)) for start, stop in blocks]
+    with executor_scope(backend, 2) as executor:
+        out = executor.run(column_kernel, blocks, (values,), np.zeros((3, 8)), regions)
+    np.testing.assert_array_equal(out, values * 10)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_kernels_see_the_existing_contents_of_out(backend):
+    out = np.ones((9, 2))
+    with executor_scope(backend, 2) as executor:
+        executor.run(add_kernel, partition(9, 2), (), out)
+    np.testing.assert_array_equal(out, 1 + np.arange(9)[:, None] * np.ones((1, 2)))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_into_memory_map(backend, tmp_path):
+    values = np.linspace(-1, 1, 1000)
+    out = np.lib.format.open_memmap(tmp_path / "out.npy", mode="w+", dtype=np.float64, shape=(1000,))
+    with executor_scope(backend, 2) as executor:
+        executor.run(square_kernel, partition(1000, 64), (values, 0.0), out)
+    out.flush()
+    np.testing.assert_array_equal(np.load(tmp_path / "out.npy"), values ** 2)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_map_blocks_keeps_block_order(backend):
+    values = np.random.default_rng(0).normal(size=500)
+    with executor_scope(backend, 3) as executor:
+        parts = executor.map_blocks(nonzero_kernel, partition(500, 37), (values,))
+    np.testing.assert_array_equal(np.concatenate(parts), np.flatnonzero(values > 0))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_kernel_errors_propagate_and_release_shared_memory(backend):
+    before = shared_segments()
+    with executor_scope(backend, 2) as executor:
+        with pytest.raises(RuntimeError, match="failed"):
+            executor.run(failing_kernel, partition(40, 5), (np.arange(40.0),), np.empty(40))
+    assert shared_segments() <= before
+
+
+def test_process_backend_releases_shared_memory():
+    before = shared_segments()
+    with ProcessExecutor(2) as executor:
+        executor.run(square_kernel, partition(100, 7), (np.arange(100.0), 0.0), np.empty(100))
+        executor.map_blocks(nonzero_kernel, partition(100, 7), (np.arange(100.0) - 50,))
+    assert shared_segments() <= before
+
+
+def test_get_executor():
+    assert isinstance(get_executor(), SerialExecutor)
+    assert isinstance(get_executor("thread", 2), ThreadExecutor)
+    assert get_executor("process", 3).workers == 3
+    executor = ThreadExecutor(2)
+    assert get_executor(executor) is executor
+    with pytest.raises(ValueError):
+        get_executor("gpu")
+
+
+def test_executor_scope_closes_only_what_it_created():
+    executor = ThreadExecutor(2)
+    with executor_scope(executor) as backend:
+        backend.run(square_kernel, partition(10, 3), (np.arange(10.0), 0.0), np.empty(10))
+    assert executor._pool is not None
+    executor.close()
+    with executor_scope("thread", 2) as backend:
+        backend.run(square_kernel, partition(10, 3), (np.arange(10.0), 0.0), np.empty(10))
+    assert backend._pool is None
@@ -0,0 +1,113 @@
+import functools
+
+import numpy as np
+import pytest
+
+from TwistorClasses.Quaternion import Quaternion
+from TwistorClasses.QuaternionArray import QuaternionArray
+
+
+def components(q) -> tuple:
+    return (q.w, q.x, q.y, q.z)
+
+
+def unit_quaternions(rng, n) -> np.ndarray:
+    q = rng.normal(size=(n, 4))
+    return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def array():
+    return QuaternionArray(unit_quaternions(np.random.default_rng(0), 37))
+
+
+def test_round_trip_and_indexing(array):
+    quaternions = array.to_quaternions()
+    np.testing.assert_array_equal(QuaternionArray.from_quaternions(quaternions).components, array.components)
+    assert components(array[3]) == tuple(array.components[3])
+    assert isinstance(array[2:5], QuaternionArray) and array[2:5].shape == (3,)
+    assert len(array) == 37
+
+
+def test_multiply_matches_scalar(array):
+    other = QuaternionArray(unit_quaternions(np.random.default_rng(1), 37))
+    result = array.multiply(other)
+    for p, q, r in zip(array.to_quaternions(), other.to_quaternions(), result.to_quaternions()):
+        assert components(r) == pytest.approx(components(p.multiply(q)))
+    single = Quaternion(0.5, 0.5, -0.5, 0.5)
+    np.testing.assert_allclose((array * single).components[4], components(array[4].multiply(single)))
+
+
+def test_outer_product_by_broadcasting(array):
+    rows = QuaternionArray(array.components[:4, None, :])
+    cols = QuaternionArray(array.components[None, :5, :])
+    outer = rows.multiply(cols)
+    assert outer.shape == (4, 5)
+    assert components(outer[2, 3]) == pytest.approx(components(array[2].multiply(array[3])))
+
+
+@pytest.mark.parametrize("sequence", [False, True])
+@pytest.mark.parametrize("n", [1, 2, 5, 37])
+def test_cumulative_product_matches_sequential(array, sequence, n):
+    quaternions = array[:n].to_quaternions()
+    prefix = array[:n].cumulative_product(sequence=sequence)
+    running = None
+    for q, result in zip(quaternions, prefix.to_quaternions()):
+        if running is None:
+            running = q
+        else:
+            running = q.multiply(running) if sequence else running.multiply(q)
+        assert components(result) == pytest.approx(components(running))
+    product = functools.reduce(lambda a, b: b.multiply(a) if sequence else a.multiply(b), quaternions)
+    assert components(array[:n].product(sequence=sequence)) == pytest.approx(components(product))
+
+
+def test_product_of_empty_array_is_identity():
+    assert components(QuaternionArray(np.empty((0, 4))).product()) == (1.0, 0.0, 0.0, 0.0)
+
+
+def test_single_quaternion_is_rejected_clearly():
+    single = QuaternionArray([1.0, 0.0, 0.0, 0.0])
+    with pytest.raises(ValueError, match="single quaternion"):
+        single.cumulative_product()
+    with pytest.raises(ValueError, match="single quaternion"):
+        single[0]
+    with pytest.raises(TypeError):
+        len(single)
+    with pytest.raises(ValueError):
+        QuaternionArray(np.ones((3, 3)))
+
+
+def test_magnitude_conjugate_inverse(array):
+    scaled = array * 3.0
+    np.testing.assert_allclose(scaled.magnitude(), 3.0)
+    np.testing.assert_allclose(scaled.normalize().magnitude(), 1.0)
+    identity = scaled.multiply(scaled.inverse()).components
+    np.testing.assert_allclose(identity, np.tile([1.0, 0.0, 0.0, 0.0], (37, 1)), atol=1e-12)
+    np.testing.assert_allclose(array.conjugate().components[:, 1:], -array.components[:, 1:])
+
+
+def test_slerp_endpoints_and_midpoint(array):
+    start, end = array[:10], QuaternionArray(unit_quaternions(np.random.default_rng(2), 10))
+    np.testing.assert_allclose(np.abs(start.slerp(end, 0.0).dot_product(start)), 1.0)
+    np.testing.assert_allclose(np.abs(start.slerp(end, 1.0).dot_product(end)), 1.0)
+    middle = start.slerp(end, 0.5)
+    np.testing.assert_allclose(middle.magnitude(), 1.0)
+    angles_start = [m.angle_with(s) for m, s in zip(middle.to_quaternions(), start.to_quaternions())]
+    angles_end = [m.angle_with(e) for m, e in zip(middle.to_quaternions(), end.to_quaternions())]
+    # The midpoint is equally far from both ends along the shorter arc (q and -q are one rotation).
+    half = [min(a, np.pi - a) for a in angles_start]
+    np.testing.assert_allclose(half, [min(a, np.pi - a) for a in angles_end], atol=1e-9)
+
+
+def test_slerp_of_identical_quaternions_is_stable(array):
+    np.testing.assert_allclose(array.slerp(array, 0.3).components, array.components, atol=1e-12)
+
+
+def test_angle_matrix_matches_scalar(array):
+    angles = array[:6].angle_matrix(array[6:10])
+    assert angles.shape == (6, 4)
+    for i, p in enumerate(array[:6].to_quaternions()):
+        for j, q in enumerate(array[6:10].to_quaternions()):
+            assert angles[i, j] == pytest.approx(p.angle_with(q))
+    np.testing.assert_allclose(np.diag(array.angle_matrix()), 0.0, atol=1e-7)
@@ -0,0 +1,211 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.ProjectiveLine import ProjectiveLine
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.Service import (LatencyStats, MicroBatcher, ServiceClient, TwistorService, lines_intersect,
+                                    map_twistors, point_distances)
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping
+
+
+def to_point(row) -> ProjectivePoint:
+    return ProjectivePoint(*(ComplexNumber(z.real, z.imag) for z in row))
+
+
+def random_complex(rng, *shape) -> np.ndarray:
+    return rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+
+def echo(requests):
+    return [request * 2 for request in requests]
+
+
+def reject_negative(requests):
+    if any(request < 0 for request in requests):
+        raise ValueError("negative request")
+    return [request + 1 for request in requests]
+
+
+def test_map_twistors_matches_twistor_mapping():
+    rng = np.random.default_rng(0)
+    requests = [(rng.normal(size=4).tolist(), random_complex(rng, 2).tolist()) for _ in range(20)]
+    for (point, spinor), result in zip(requests, map_twistors(requests)):
+        twistor = twistor_mapping(ComplexMinkowskiPoint(*point),
+                                  Spinor(*(ComplexNumber(z.real, z.imag) for z in spinor)))
+        expected = [complex(c.rel, c.img) for c in twistor.mu.components + twistor.lambda_.components]
+        assert result == pytest.approx(expected)
+
+
+def test_point_distances_match_distance_to():
+    rng = np.random.default_rng(1)
+    requests = [(random_complex(rng, 4).tolist(), random_complex(rng, 4).tolist()) for _ in range(20)]
+    expected = [to_point(a).distance_to(to_point(b)) for a, b in requests]
+    assert point_distances(requests) == pytest.approx(expected)
+
+
+def test_lines_intersect_matches_intersect_bool():
+    rng = np.random.default_rng(2)
+    requests = []
+    for k in range(40):
+        a, b = random_complex(rng, 2, 4), random_complex(rng, 2, 4)
+        if k % 2:
+            b[0] = a[0] * 0.5 + a[1] * 2.0
+        requests.append((a.tolist(), b.tolist()))
+    expected = [ProjectiveLine(*map(to_point, a)).intersect_bool(ProjectiveLine(*map(to_point, b)))
+                for a, b in requests]
+    assert lines_intersect(requests) == expected
+    assert sum(expected) == 20
+
+
+def test_batches_fill_up_to_max_batch_size():
+    async def main():
+        batcher = MicroBatcher(echo, max_batch_size=4, max_wait=1.0)
+        results = await asyncio.gather(*(batcher.submit(k) for k in range(10)))
+        await batcher.close()
+        return results, batcher.stats
+
+    results, stats = asyncio.run(main())
+    assert results == [2 * k for k in range(10)]
+    assert sorted(stats.batch_sizes) == [2, 4, 4]
+    assert stats.summary()["requests"] == 10 and stats.summary()["errors"] == 0
+
+
+def test_partial_batch_is_sent_after_max_wait():
+    async def main():
+        batcher = MicroBatcher(echo, max_batch_size=100, max_wait=0.01)
+        result = await asyncio.wait_for(batcher.submit(21), 5.0)
+        await batcher.close()
+        return result, batcher.stats.batch_sizes
+
+    assert asyncio.run(main()) == (42, [1])
+
+
+def test_backpressure_limits_outstanding_requests():
+    release = threading.Event()
+
+    def blocking(requests):
+        release.wait(5.0)
+        return requests
+
+    async def main():
+        batcher = MicroBatcher(blocking, max_batch_size=2, max_wait=0.0, max_pending=4)
+        tasks = [asyncio.ensure_future(batcher.enqueue(k)) for k in range(7)]
+        await asyncio.sleep(0.1)
+        accepted = sum(task.done() for task in tasks)
+        release.set()
+        futures = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*futures)
+        await batcher.close()
+        return accepted, results
+
+    accepted, results = asyncio.run(main())
+    assert accepted == 4
+    assert results == list(range(7))
+
+
+def test_failing_request_does_not_fail_its_batch():
+    async def main():
+        batcher = MicroBatcher(reject_negative, max_batch_size=8, max_wait=1.0)
+        results = await asyncio.gather(*(batcher.submit(k) for k in (1, -1, 2, 3, -5, 4, 5, 6)),
+                                       return_exceptions=True)
+        await batcher.close()
+        return results, batcher.stats
+
+    results, stats = asyncio.run(main())
+    assert [r for r in results if not isinstance(r, Exception)] == [2, 3, 4, 5, 6, 7]
+    assert [str(r) for r in results if isinstance(r, Exception)] == ["negative request"] * 2
+    assert isinstance(results[1], ValueError) and isinstance(results[4], ValueError)
+    assert stats.errors == 2 and stats.batch_sizes == [8]
+
+
+def test_handler_returning_the_wrong_count_fails_each_request():
+    async def main():
+        batcher = MicroBatcher(lambda requests: [], max_batch_size=2, max_wait=1.0)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+        await batcher.close()
+        return results
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(main()))
+
+
+def test_close_flushes_queued_requests_and_rejects_new_ones():
+    async def main():
+        batcher = MicroBatcher(echo, max_batch_size=100, max_wait=10.0)
+        futures = [await batcher.enqueue(k) for k in range(3)]
+        await batcher.close()
+        assert all(future.done() for future in futures)
+        with pytest.raises(RuntimeError):
+            await batcher.enqueue(4)
+        return [future.result() for future in futures]
+
+    assert asyncio.run(main()) == [0, 2, 4]
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        MicroBatcher(echo, max_batch_size=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(echo, max_wait=-1.0)
+    with pytest.raises(ValueError):
+        MicroBatcher(echo, max_batch_size=10, max_pending=5)
+
+
+def test_latency_stats_summary():
+    stats = LatencyStats()
+    assert stats.summary()["p50_ms"] is None
+    stats.record(0.0, 0.001)
+    stats.record(0.5, 1.0, ok=False)
+    stats.record_batch(2)
+    summary = stats.summary()
+    assert summary["requests"] == 2 and summary["errors"] == 1 and summary["batches"] == 1
+    assert summary["max_ms"] == pytest.approx(500.0)
+    assert summary["throughput_rps"] == pytest.approx(2.0)
+
+
+def test_service_requests_in_process():
+    async def main():
+        async with TwistorService(max_wait=0.001, workers=2) as service:
+            mapped = await service.request("map", [1.0, 2.0, 3.0, 4.0], [1j, 1.0])
+            distance = await service.request("distance", [1, 1, 0, 0], [1, 0, 0, 0])
+            with pytest.raises(ValueError):
+                await service.request("rotate", 1)
+            with pytest.raises(ValueError):
+                await service.request("intersect", [[1, 2, 3, 4]], [[1, 0, 0, 0]])
+        return mapped, distance
+
+    mapped, distance = asyncio.run(main())
+    assert mapped == pytest.approx(map_twistors([([1.0, 2.0, 3.0, 4.0], [1j, 1.0])])[0])
+    assert distance == pytest.approx(1.0)
+
+
+def test_service_over_tcp_survives_malformed_lines():
+    async def main():
+        async with TwistorService(max_wait=0.001, workers=2) as service:
+            host, port = await service.serve()
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"not json\n")
+            writer.write(b'{"id": 7, "op": "distance"}\n')
+            writer.write(b'{"id": 8, "op": "intersect", "args": [[[1, 2]], [[3, 4]]]}\n')
+            writer.write(b'{"id": 9, "op": "distance", "args": [[1, 0, 3, 0], [1, 0, 0, 4]]}\n')
+            await writer.drain()
+            replies = [await asyncio.wait_for(reader.readline(), 5.0) for _ in range(4)]
+            writer.close()
+            async with await ServiceClient.connect(host, port) as client:
+                mapped = await client.request("map", [0.0, 1.0, 0.0, 0.0], [1.0, 1j])
+                with pytest.raises(RuntimeError, match="Unknown operation"):
+                    await client.request("rotate", 1)
+        return replies, mapped
+
+    replies, mapped = asyncio.run(main())
+    by_id = {}
+    for line in replies:
+        message = json.loads(line)
+        by_id[message["id"]] = message
+    assert "error" in by_id[None] and "error" in by_id[7] and "error" in by_id[8]
+    assert by_id[9]["result"] == pytest.approx(5.0)
+    assert mapped == pytest.approx(map_twistors([([0.0, 1.0, 0.0, 0.0], [1.0, 1j])])[0])
@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pytest
+
+from TwistorClasses.Simulation import Simulation, SnapshotRecorder, constant_acceleration, harmonic_acceleration
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch
+
+
+@pytest.fixture
+def simulation():
+    rng = np.random.default_rng(0)
+    return Simulation(rng.normal(size=(6, 3)), rng.normal(size=(6, 3)), rng.normal(size=(6, 4)),
+                      rng.normal(size=(6, 3)), acceleration=constant_acceleration((0.0, 0.0, -9.81)))
+
+
+@pytest.fixture
+def spinors():
+    rng = np.random.default_rng(1)
+    return rng.normal(size=(2, 2)) + 1j * rng.normal(size=(2, 2))
+
+
+def test_constant_acceleration_is_integrated_exactly(simulation):
+    start, velocity = simulation.positions.copy(), simulation.velocities.copy()
+    simulation.run(10, 0.1)
+    gravity = np.array([0.0, 0.0, -9.81])
+    np.testing.assert_allclose(simulation.positions, start + velocity + 0.5 * gravity, atol=1e-12)
+    np.testing.assert_allclose(simulation.velocities, velocity + gravity, atol=1e-12)
+    np.testing.assert_allclose(np.linalg.norm(simulation.attitudes, axis=1), 1.0)
+    assert simulation.steps == 10 and simulation.time == pytest.approx(1.0)
+
+
+def test_harmonic_oscillator_returns_after_one_period():
+    simulation = Simulation([[1.0, 0.0, 0.0]], acceleration=harmonic_acceleration(4.0))
+    simulation.run(1000, np.pi / 1000)
+    np.testing.assert_allclose(simulation.positions, [[1.0, 0.0, 0.0]], atol=1e-9)
+
+
+def test_recorder_writes_every_kth_snapshot(tmp_path, simulation, spinors):
+    with SnapshotRecorder(tmp_path, every=3, spinors=spinors) as recorder:
+        recorder.maybe_record(simulation)
+        expected_twistors = [simulation.twistors(spinors)]
+        for _ in range(9):
+            simulation.run(1, 0.01, recorder)
+            if simulation.steps % 3 == 0:
+                expected_twistors.append(twistor_mapping_batch(simulation.spacetime_points(), spinors))
+    assert not recorder.failed
+    times = np.load(tmp_path / "times.npy")
+    np.testing.assert_allclose(times, [0.0, 0.03, 0.06, 0.09])
+    positions = np.load(tmp_path / "positions.npy", mmap_mode="r")
+    assert positions.shape == (4, 6, 3)
+    np.testing.assert_array_equal(positions[-1], simulation.positions)
+    np.testing.assert_array_equal(np.load(tmp_path / "twistors.npy"), np.stack(expected_twistors))
+    assert not os.path.exists(tmp_path / "angular_velocities.npy")
+
+
+def test_recorder_is_aborted_by_an_exception(tmp_path, simulation):
+    with pytest.raises(RuntimeError):
+        with SnapshotRecorder(tmp_path, fields=("positions",)) as recorder:
+            simulation.run(3, 0.01, recorder)
+            raise RuntimeError("interrupted")
+    assert recorder.failed
+    assert not os.path.exists(tmp_path / "times.npy")
+    with pytest.raises(ValueError):
+        np.load(tmp_path / "positions.npy")
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        SnapshotRecorder(tmp_path, every=0)
+    with pytest.raises(ValueError):
+        SnapshotRecorder(tmp_path, fields=("positions", "spin"))
+    with pytest.raises(ValueError):
+        Simulation(np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        Simulation(np.zeros((3, 3)), velocities=np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        Simulation(np.zeros((3, 3)), integrator="leapfrog")
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.ProjectivePoint import ProjectivePoint
+from TwistorClasses.SpatialIndex import SpatialIndex
+
+
+def random_coords(rng, n) -> np.ndarray:
+    return rng.normal(size=(n, 4)) + 1j * rng.normal(size=(n, 4))
+
+
+def brute_force_distances(coords, query, affine=True) -> np.ndarray:
+    coords, query = np.asarray(coords), np.asarray(query)
+    if affine:
+        xyz, q = coords[:, 1:] / coords[:, :1], query[1:] / query[0]
+    else:
+        xyz, q = coords[:, 1:], query[1:]
+    return np.sqrt((np.abs(xyz - q) ** 2).sum(axis=1))
+
+
+def to_point(row) -> ProjectivePoint:
+    return ProjectivePoint(*(ComplexNumber(z.real, z.imag) for z in row.tolist()))
+
+
+@pytest.fixture
+def coords():
+    return random_coords(np.random.default_rng(0), 2000)
+
+
+@pytest.mark.parametrize("affine", [True, False])
+@pytest.mark.parametrize("k", [1, 7, 50])
+def test_query_matches_brute_force(coords, affine, k):
+    index = SpatialIndex(coords, affine=affine, leaf_size=8)
+    for query in random_coords(np.random.default_rng(1), 10):
+        distances, ids = index.query(query, k=k)
+        expected = brute_force_distances(coords, query, affine)
+        order = np.argsort(expected, kind="stable")[:k]
+        np.testing.assert_allclose(distances, expected[order])
+        np.testing.assert_allclose(expected[ids], distances)
+
+
+@pytest.mark.parametrize("affine", [True, False])
+def test_query_radius_matches_brute_force(coords, affine):
+    index = SpatialIndex(coords, affine=affine, leaf_size=8)
+    for query in random_coords(np.random.default_rng(2), 10):
+        expected = brute_force_distances(coords, query, affine)
+        radius = np.sort(expected)[30:32].mean()  # midway, so rounding cannot move a point across it
+        distances, ids = index.query_radius(query, radius)
+        assert sorted(ids.tolist()) == np.flatnonzero(expected <= radius).tolist()
+        np.testing.assert_allclose(distances, np.sort(expected[ids]))
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_both_queries_return_distances_then_ids(coords):
+    index = SpatialIndex(coords)
+    knn = index.query(coords[0], k=5)
+    radius = index.query_radius(coords[0], knn[0][-1])
+    np.testing.assert_allclose(radius[0][:5], knn[0])
+    np.testing.assert_array_equal(radius[1][:5], knn[1])
+    assert knn[1].dtype == radius[1].dtype == np.intp
+
+
+def test_raw_distances_equal_distance_to(coords):
+    index = SpatialIndex(coords, affine=False)
+    distances, ids = index.query(coords[0], k=5)
+    first = to_point(coords[0])
+    assert distances == pytest.approx([first.distance_to(to_point(coords[i])) for i in ids])
+
+
+def test_insert_and_delete_match_rebuilt_index(coords):
+    rng = np.random.default_rng(3)
+    index = SpatialIndex(coords[:1000], leaf_size=8, rebuild_fraction=0.5)
+    for row in coords[1000:1300]:
+        index.insert(row)
+    deleted = rng.choice(1300, size=200, replace=False)
+    for point_id in deleted:
+        index.delete(int(point_id))
+    live = np.setdiff1d(np.arange(1300), deleted)
+    assert len(index) == len(live)
+    for query in random_coords(rng, 10):
+        distances, ids = index.query(query, k=10)
+        expected = brute_force_distances(coords[live], query)
+        np.testing.assert_allclose(distances, np.sort(expected)[:10])
+        assert not np.isin(ids, deleted).any()
+    with pytest.raises(KeyError):
+        index.delete(int(deleted[0]))
+    with pytest.raises(KeyError):
+        index.delete(5000)
+
+
+def test_points_at_infinity_are_kept_apart(coords):
+    coords = coords[:100].copy()
+    coords[[4, 9], 0] = 0
+    index = SpatialIndex(coords)
+    assert index.points_at_infinity().tolist() == [4, 9]
+    assert len(index) == 100
+    distances, ids = index.query(coords[0], k=100)
+    assert len(ids) == 98 and not np.isin(ids, [4, 9]).any()
+    empty = index.query(coords[4], k=3)
+    assert len(empty[0]) == len(empty[1]) == 0
+    assert len(index.query_radius(coords[4], 10.0)[1]) == 0
+    assert SpatialIndex(coords, affine=False).points_at_infinity().tolist() == []
+
+
+def test_empty_index_and_bad_arguments():
+    index = SpatialIndex()
+    assert len(index.query([1, 0, 0, 0], k=3)[1]) == 0
+    assert len(index.query_radius([1, 0, 0, 0], 1.0)[1]) == 0
+    point_id = index.insert([1, 1, 1, 1])
+    assert index.query([1, 1, 1, 1])[1].tolist() == [point_id]
+    with pytest.raises(ValueError):
+        index.query_radius([1, 0, 0, 0], -1.0)
+    with pytest.raises(ValueError):
+        SpatialIndex(leaf_size=0)
+    with pytest.raises(ValueError):
+        index.build(np.ones((3, 3)))
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.PointArray import array_to_lines, array_to_points
+from TwistorClasses.TwistorFile import TwistorFile, load, save, save_lines, save_points, save_twistors
+from TwistorClasses.TwistorMappingBatch import twistor_mapping_batch, twistors_from_array
+
+
+def random_complex(rng, *shape) -> np.ndarray:
+    return rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def test_points_round_trip(tmp_path, rng):
+    points = random_complex(rng, 37, 4)
+    save_points(tmp_path / "points.tw", points)
+    loaded = load(tmp_path / "points.tw")
+    assert len(loaded) == 37 and loaded.kind == "points"
+    np.testing.assert_array_equal(loaded.to_array(), points)
+    np.testing.assert_array_equal(loaded.column("y"), points[:, 2])
+    assert loaded.column("y").flags.c_contiguous
+
+
+def test_twistors_keep_their_shape(tmp_path, rng):
+    twistors = twistor_mapping_batch(rng.normal(size=(5, 4)), random_complex(rng, 3, 2))
+    save_twistors(tmp_path / "twistors.tw", twistors)
+    np.testing.assert_array_equal(load(tmp_path / "twistors.tw").to_array(), twistors)
+    save_twistors(tmp_path / "objects.tw", twistors_from_array(twistors.reshape(-1, 4)))
+    np.testing.assert_array_equal(load(tmp_path / "objects.tw").to_array(), twistors.reshape(-1, 4))
+
+
+def test_lines_and_objects_round_trip(tmp_path, rng):
+    endpoints = random_complex(rng, 9, 2, 4)
+    save_lines(tmp_path / "lines.tw", array_to_lines(endpoints))
+    np.testing.assert_array_equal(load(tmp_path / "lines.tw").to_array(), endpoints)
+    points = random_complex(rng, 4, 4)
+    save_points(tmp_path / "points.tw", array_to_points(points))
+    np.testing.assert_array_equal(load(tmp_path / "points.tw").to_array(), points)
+
+
+def test_chunks_cover_every_row(tmp_path, rng):
+    endpoints = random_complex(rng, 23, 2, 4)
+    save(tmp_path / "lines.tw", endpoints, "lines", chunk_rows=5)
+    loaded = TwistorFile(tmp_path / "lines.tw")
+    assert loaded.num_chunks == 5
+    np.testing.assert_array_equal(np.concatenate([loaded.chunk(k) for k in range(loaded.num_chunks)]), endpoints)
+    np.testing.assert_array_equal(loaded.read_range(20, 100), endpoints[20:])
+    with pytest.raises(IndexError):
+        loaded.chunk(5)
+
+
+@pytest.mark.parametrize("kind, trailing", [("points", (4,)), ("twistors", (4,)), ("lines", (2, 4))])
+def test_empty_tables(tmp_path, kind, trailing):
+    for data in ([], np.empty((0,) + trailing)):
+        save(tmp_path / "empty.tw", data, kind, chunk_rows=8)
+        loaded = load(tmp_path / "empty.tw")
+        assert len(loaded) == 0 and loaded.num_chunks == 1
+        assert loaded.to_array().shape == (0,) + trailing
+        assert loaded.chunk(0).shape[0] == 0
+
+
+def test_bad_arguments(tmp_path, rng):
+    points = random_complex(rng, 4, 4)
+    for chunk_rows in (0, -3):
+        with pytest.raises(ValueError, match="chunk_rows"):
+            save(tmp_path / "points.tw", points, "points", chunk_rows=chunk_rows)
+    with pytest.raises(ValueError):
+        save(tmp_path / "points.tw", points, "spinors")
+    with pytest.raises(ValueError):
+        save(tmp_path / "points.tw", points[:, :3], "points")
+    (tmp_path / "other.bin").write_bytes(b"not a twistor file")
+    with pytest.raises(ValueError):
+        load(tmp_path / "other.bin")
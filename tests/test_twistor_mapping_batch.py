@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from TwistorClasses.ComplexNumber import ComplexNumber
+from TwistorClasses.TwistorMapping import ComplexMinkowskiPoint, Spinor, twistor_mapping
+from TwistorClasses.TwistorMappingBatch import (iter_twistor_mapping_batch, twistor_mapping_batch,
+                                                twistors_to_array)
+
+
+@pytest.fixture
+def inputs():
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(7, 4)) * 10
+    spinors = rng.normal(size=(3, 2)) + 1j * rng.normal(size=(3, 2))
+    return points, spinors
+
+
+def scalar_mapping(points, spinors) -> np.ndarray:
+    """Maps every (point, spinor) pair with the scalar twistor_mapping."""
+    spinor_objects = [Spinor(*(ComplexNumber(c.real, c.imag) for c in s)) for s in spinors]
+    twistors = [twistor_mapping(ComplexMinkowskiPoint(*point), spinor)
+                for point in points.tolist() for spinor in spinor_objects]
+    return twistors_to_array(twistors).reshape(len(points), len(spinors), 4)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 3, 100])
+def test_batch_matches_scalar_mapping(inputs, chunk_size):
+    points, spinors = inputs
+    result = twistor_mapping_batch(points, spinors, chunk_size=chunk_size)
+    np.testing.assert_allclose(result, scalar_mapping(points, spinors), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_backends_match_serial(inputs, executor):
+    points, spinors = inputs
+    expected = twistor_mapping_batch(points, spinors)
+    np.testing.assert_array_equal(twistor_mapping_batch(points, spinors, chunk_size=2, executor=executor), expected)
+
+
+def test_iter_matches_batch(inputs):
+    points, spinors = inputs
+    expected = twistor_mapping_batch(points, spinors)
+    blocks = list(iter_twistor_mapping_batch(points, spinors, chunk_size=3))
+    assert [start for start, _ in blocks] == [0, 3, 6]
+    np.testing.assert_array_equal(np.concatenate([block for _, block in blocks]), expected)
+
+
+def test_writes_into_out(inputs):
+    points, spinors = inputs
+    out = np.empty((len(points), len(spinors), 4), dtype=np.complex128)
+    assert twistor_mapping_batch(points, spinors, chunk_size=2, out=out) is out
+    np.testing.assert_allclose(out, scalar_mapping(points, spinors), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_rejects_non_positive_chunk_size(inputs, chunk_size):
+    points, spinors = inputs
+    with pytest.raises(ValueError, match="chunk_size"):
+        twistor_mapping_batch(points, spinors, chunk_size=chunk_size)
+    with pytest.raises(ValueError, match="chunk_size"):
+        next(iter_twistor_mapping_batch(points, spinors, chunk_size=chunk_size))
+
+
+def test_rejects_bad_shapes(inputs):
+    points, spinors = inputs
+    with pytest.raises(ValueError):
+        twistor_mapping_batch(points[:, :3], spinors)
+    with pytest.raises(ValueError):
+        twistor_mapping_batch(points, spinors, out=np.empty((1, 1, 4), dtype=np.complex128))